@@ -0,0 +1,50 @@
+"""Measure the cost of creating and updating a large Polygon.
+
+This creates a star shaped Polygon with many points, then times moving it,
+moving every point by a small amount, and changing it into a new shape. The
+time taken by earcut to triangulate the outline is reported separately,
+and is only paid when the triangulation can not be reused.
+
+Usage: python polygon_benchmark.py [point count]
+"""
+import math
+import random
+import sys
+import time
+
+import pyglet
+from pyglet.extlibs import earcut
+from pyglet.shapes import Polygon
+
+COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+
+window = pyglet.window.Window(640, 480, caption="Polygon benchmark", visible=False)
+batch = pyglet.graphics.Batch()
+
+radii = [200 + random.uniform(-50, 50) for _ in range(COUNT)]
+points = [(r * math.cos(i / COUNT * math.tau), r * math.sin(i / COUNT * math.tau)) for i, r in enumerate(radii)]
+
+
+def timed(name, function):
+    start = time.perf_counter()
+    function()
+    print(f"{name:<12}{(time.perf_counter() - start) * 1000:>10.2f} ms")
+
+
+def set_coordinates(polygon, coordinates):
+    polygon.coordinates = coordinates
+
+
+print(f"{COUNT} points")
+timed('earcut', lambda: earcut.earcut([value for point in points for value in point]))
+
+timed('create', lambda: Polygon(*points, batch=batch).delete())
+# The triangulation of the same outline is cached:
+polygon = Polygon(*points, batch=batch)
+timed('recreate', lambda: Polygon(*points, batch=batch).delete())
+timed('translate', lambda: set_coordinates(polygon, [(x + 5, y + 3) for x, y in points]))
+jittered = [(x + random.uniform(-0.01, 0.01), y + random.uniform(-0.01, 0.01)) for x, y in points]
+timed('jitter', lambda: set_coordinates(polygon, jittered))
+timed('reshape', lambda: set_coordinates(polygon, [(y, x) for x, y in points]))
+
+window.close()
@@ -0,0 +1,72 @@
+"""Compare MultiLine and Polyline for long, growing lines.
+
+For each class, this creates a line with many points, then measures adding
+points to its end, as a plot of streaming data would, and drawing it. A
+MultiLine has to be given all of its coordinates again to add points, while a
+Polyline only sends the new points to the GPU.
+
+Usage: python polyline_benchmark.py [point count] [points added per frame] [frames]
+"""
+import math
+import sys
+import time
+
+import pyglet
+from pyglet.gl import glFinish
+from pyglet.shapes import MultiLine, Polyline
+
+COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+ADDED = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+FRAMES = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+
+window = pyglet.window.Window(1280, 720, caption="Polyline benchmark", visible=False, vsync=False)
+
+
+def get_points(start, count):
+    return [(i * 1280 / (COUNT + ADDED * FRAMES), 360 + 300 * math.sin(i / 50)) for i in range(start, start + count)]
+
+
+def add_multiline_points(line, coordinates, points):
+    # The points of a MultiLine can not be changed, so it is created again:
+    line.delete()
+    return MultiLine(*coordinates, *points, thickness=2, batch=line.batch)
+
+
+def add_polyline_points(line, coordinates, points):
+    line.add_points(*points)
+    return line
+
+
+def benchmark(line_class, add_points):
+    batch = pyglet.graphics.Batch()
+    points = get_points(0, COUNT)
+
+    start = time.perf_counter()
+    line = line_class(*points, thickness=2, batch=batch)
+    created = time.perf_counter() - start
+
+    add_time = draw_time = 0.0
+    for frame in range(FRAMES):
+        new_points = get_points(COUNT + frame * ADDED, ADDED)
+        start = time.perf_counter()
+        line = add_points(line, points, new_points)
+        points += new_points
+        add_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        window.clear()
+        batch.draw()
+        glFinish()
+        draw_time += time.perf_counter() - start
+
+    line.delete()
+    return created, add_time / FRAMES, draw_time / FRAMES
+
+
+print(f"{COUNT} points, {ADDED} added per frame, {FRAMES} frames")
+print(f"{'class':<12}{'create (s)':>12}{'add (ms)':>12}{'draw (ms)':>12}")
+for cls, add in ((MultiLine, add_multiline_points), (Polyline, add_polyline_points)):
+    created, added, drawn = benchmark(cls, add)
+    print(f"{cls.__name__:<12}{created:>12.3f}{added * 1000:>12.2f}{drawn * 1000:>12.2f}")
+
+window.close()
@@ -0,0 +1,46 @@
+"""Measure the cost of animating several properties of many shapes.
+
+This creates a number of Circles in a Batch, then each frame changes their
+position, radius, color and rotation, and draws the Batch. Changes made to
+shapes in a Batch are combined, and applied once before it is drawn.
+
+Usage: python shape_update_benchmark.py [shape count] [frames]
+"""
+import random
+import sys
+import time
+
+import pyglet
+from pyglet.gl import glFinish
+from pyglet.shapes import Circle
+
+COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+FRAMES = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+window = pyglet.window.Window(1280, 720, caption="Shape update benchmark", visible=False, vsync=False)
+batch = pyglet.graphics.Batch()
+circles = [Circle(random.uniform(0, 1280), random.uniform(0, 720), 5, segments=16, batch=batch)
+           for _ in range(COUNT)]
+
+update_time = draw_time = 0.0
+for frame in range(FRAMES):
+    start = time.perf_counter()
+    for circle in circles:
+        circle.x += 1
+        circle.y += 1
+        circle.radius = 5 + frame % 5
+        circle.color = (frame % 256, 100, 200)
+        circle.rotation = frame
+    update_time += time.perf_counter() - start
+
+    start = time.perf_counter()
+    window.clear()
+    batch.draw()
+    glFinish()
+    draw_time += time.perf_counter() - start
+
+print(f"{COUNT} circles, {FRAMES} frames")
+print(f"update: {update_time / FRAMES * 1000:.2f} ms, draw: {draw_time / FRAMES * 1000:.2f} ms, "
+      f"total: {(update_time + draw_time) / FRAMES * 1000:.2f} ms")
+
+window.close()
@@ -0,0 +1,66 @@
+"""Compare the quad and geometry shader sprite rendering paths.
+
+For each sprite class, this creates a number of sprites in a Batch, then
+measures the time taken to create them, to move and rotate all of them, and
+to draw the Batch. The vertex data stored for each sprite is also reported.
+
+Usage: python sprite_mode_benchmark.py [sprite count] [frames]
+"""
+import random
+import sys
+import time
+
+import pyglet
+from pyglet.gl import glFinish
+from pyglet.sprite import GeometrySprite, Sprite
+
+COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+FRAMES = int(sys.argv[2]) if len(sys.argv) > 2 else 60
+
+window = pyglet.window.Window(1280, 720, caption="Sprite mode benchmark", visible=False, vsync=False)
+image = pyglet.image.SolidColorImagePattern((200, 100, 50, 255)).create_image(8, 8)
+image.anchor_x = image.anchor_y = 4
+
+
+def bytes_per_sprite(sprite):
+    vertex_list = sprite._vertex_list
+    size = sum(buffer.stride for buffer in vertex_list.domain.attrib_name_buffers.values()) * vertex_list.count
+    if hasattr(vertex_list, 'indices'):
+        size += len(vertex_list.indices) * vertex_list.domain.index_element_size
+    return size
+
+
+def benchmark(sprite_class):
+    batch = pyglet.graphics.Batch()
+    positions = [(random.uniform(0, 1280), random.uniform(0, 720)) for _ in range(COUNT)]
+
+    start = time.perf_counter()
+    sprites = [sprite_class(image, x, y, batch=batch, subpixel=True) for x, y in positions]
+    created = time.perf_counter() - start
+
+    update_time = draw_time = 0.0
+    for frame in range(FRAMES):
+        start = time.perf_counter()
+        for sprite in sprites:
+            sprite.update(x=sprite.x + 0.5, rotation=frame)
+        update_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        window.clear()
+        batch.draw()
+        glFinish()
+        draw_time += time.perf_counter() - start
+
+    size = bytes_per_sprite(sprites[0])
+    for sprite in sprites:
+        sprite.delete()
+    return created, update_time / FRAMES, draw_time / FRAMES, size
+
+
+print(f"{COUNT} sprites, {FRAMES} frames")
+print(f"{'class':<16}{'create (s)':>12}{'update (ms)':>14}{'draw (ms)':>12}{'bytes':>8}")
+for cls in (Sprite, GeometrySprite):
+    created, update, draw, size = benchmark(cls)
+    print(f"{cls.__name__:<16}{created:>12.3f}{update * 1000:>14.2f}{draw * 1000:>12.2f}{size:>8}")
+
+window.close()
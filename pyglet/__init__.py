@@ -38,6 +38,7 @@ if getattr(sys, "frozen", None):
 _SPECIAL_OPTION_VALIDATORS = {
     "audio": lambda x: isinstance(x, Sequence),
     "vsync": lambda x: x is None or isinstance(x, bool),
+    "shader_cache": lambda x: x is None or isinstance(x, str),
 }
 
 _OPTION_TYPE_VALIDATORS = {
@@ -301,6 +302,28 @@ class Options:
     .. versionadded:: 2.0.16
     """
 
+    skip_redundant_binds: bool = False
+    """If ``True``, binds of buffers and textures which are already bound are skipped.
+
+    This saves OpenGL calls when drawing many groups that use the same textures, but pyglet must then be told about
+    buffers and textures bound with OpenGL functions directly, by calling ``context.bindings.invalidate()``. Shader
+    programs and vertex arrays bound by pyglet are always tracked. Set this option before creating any windows.
+    See :py:class:`~pyglet.gl.base.BindingCache`.
+    """
+
+    shader_cache: str | None = None
+    """A directory to cache linked :py:class:`~pyglet.graphics.shader.ShaderProgram` binaries in.
+
+    If set, the binary of each linked program is saved to this directory, and restored the next time a program is
+    created from the same shader sources, skipping the link step. Cached binaries are keyed by the shader sources and
+    the OpenGL vendor, renderer and version, and are recompiled if the driver rejects them. Requires OpenGL 4.1 or the
+    ``GL_ARB_get_program_binary`` extension, and is ignored otherwise. Defaults to ``None``, which disables caching.
+
+    For example, to store binaries alongside other application data::
+
+        pyglet.options.shader_cache = os.path.join(pyglet.resource.get_data_path('mygame'), 'shaders')
+    """
+
     def get(self, item: str, default: Any = None) -> Any:
         return self.__dict__.get(item, default)
 
@@ -323,6 +346,7 @@ options: Options = Options()
 _OPTION_TYPE_REMAPS = {
     "audio": "sequence",
     "vsync": "bool",
+    "shader_cache": "str",
 }
 
 for _key, _type in options.__annotations__.items():
@@ -335,6 +359,8 @@ for _key, _type in options.__annotations__.items():
             options[_key] = _value in ("true", "TRUE", "True", "1")
         elif _type == 'int':
             options[_key] = int(_value)
+        elif _type == 'str':
+            options[_key] = _value
 
 
 if compat_platform == "cygwin":
@@ -66,6 +66,7 @@ class Options:
     osx_alt_loop: bool
     dpi_scaling: Literal["real", "scaled", "stretch"]
     shader_bind_management: bool
+    shader_cache: str | None
 
     def get(self, item: str, default: Any = None) -> Any:
         ...
@@ -7,8 +7,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import pyglet
-from pyglet.gl import glActiveTexture, glBindTexture, glEnable, GL_BLEND, glBlendFunc, glDisable, glGetIntegerv, GLint
-from pyglet.gl import GL_SRC_ALPHA, GL_TEXTURE0, GL_ONE_MINUS_SRC_ALPHA, GL_TRIANGLES, GL_MAX_TEXTURE_IMAGE_UNITS
+from pyglet.gl import glEnable, GL_BLEND, glBlendFunc, glDisable, glGetIntegerv, GLint
+from pyglet.gl import GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA, GL_TRIANGLES, GL_MAX_TEXTURE_IMAGE_UNITS
 
 if TYPE_CHECKING:
     from pyglet.image import Texture, AbstractImage, Animation
@@ -61,8 +61,7 @@ class MultiTextureSpriteGroup(pyglet.graphics.Group):
             self.program[name] = idx
 
         for i, texture in enumerate(self._textures.values()):
-            glActiveTexture(GL_TEXTURE0 + i)
-            glBindTexture(texture.target, texture.id)
+            pyglet.gl.current_context.bindings.bind_texture(texture.target, texture.id, i)
 
         glEnable(GL_BLEND)
         glBlendFunc(self.blend_src, self.blend_dest)
@@ -75,7 +74,7 @@ class MultiTextureSpriteGroup(pyglet.graphics.Group):
         """
         glDisable(GL_BLEND)
         self.program.stop()
-        glActiveTexture(GL_TEXTURE0)
+        pyglet.gl.current_context.bindings.active_texture(0)
 
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}({[(name,texture) for name,texture in self._textures.items()]})'
@@ -192,8 +192,7 @@ class EmitterGroup(graphics.Group):
     def set_state(self):
         self.program.use()
 
-        glActiveTexture(GL_TEXTURE0)
-        glBindTexture(self.texture.target, self.texture.id)
+        pyglet.gl.current_context.bindings.bind_texture(self.texture.target, self.texture.id, 0)
 
         glEnable(GL_BLEND)
         glBlendFunc(self.blend_src, self.blend_dest)
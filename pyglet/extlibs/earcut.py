@@ -173,16 +173,29 @@ def isEar(ear):
     a = ear.prev
     b = ear
     c = ear.next
+    ax, ay, bx, by, cx, cy = a.x, a.y, b.x, b.y, c.x, c.y
 
-    if area(a, b, c) >= 0:
+    if (by - ay) * (cx - bx) - (bx - ax) * (cy - by) >= 0:
         return False # reflex, can't be an ear
 
-    # now make sure we don't have other points inside the potential ear
-    p = ear.next.next
+    # triangle bbox, to reject most points before the full containment test
+    x0 = ax if ax < bx and ax < cx else (bx if bx < cx else cx)
+    y0 = ay if ay < by and ay < cy else (by if by < cy else cy)
+    x1 = ax if ax > bx and ax > cx else (bx if bx > cx else cx)
+    y1 = ay if ay > by and ay > cy else (by if by > cy else cy)
 
-    while p != ear.prev:
-        if pointInTriangle(a.x, a.y, b.x, b.y, c.x, c.y, p.x, p.y) and area(p.prev, p, p.next) >= 0:
-                return False
+    # now make sure we don't have other points inside the potential ear
+    p = c.next
+
+    while p is not a:
+        px = p.x
+        py = p.y
+        if x0 <= px <= x1 and y0 <= py <= y1 and \
+                (cx - px) * (ay - py) - (ax - px) * (cy - py) >= 0 and \
+                (ax - px) * (by - py) - (bx - px) * (ay - py) >= 0 and \
+                (bx - px) * (cy - py) - (cx - px) * (by - py) >= 0 and \
+                area(p.prev, p, p.next) >= 0:
+            return False
         p = p.next
 
     return True
@@ -191,15 +204,16 @@ def isEarHashed(ear, minX, minY, size):
     a = ear.prev
     b = ear
     c = ear.next
+    ax, ay, bx, by, cx, cy = a.x, a.y, b.x, b.y, c.x, c.y
 
-    if area(a, b, c) >= 0:
+    if (by - ay) * (cx - bx) - (bx - ax) * (cy - by) >= 0:
         return False # reflex, can't be an ear
 
     # triangle bbox; min & max are calculated like this for speed
-    minTX = (a.x if a.x < c.x else c.x) if a.x < b.x else (b.x if b.x < c.x else c.x)
-    minTY = (a.y if a.y < c.y else c.y) if a.y < b.y else (b.y if b.y < c.y else c.y)
-    maxTX = (a.x if a.x > c.x else c.x) if a.x > b.x else (b.x if b.x > c.x else c.x)
-    maxTY = (a.y if a.y > c.y else c.y) if a.y > b.y else (b.y if b.y > c.y else c.y)
+    minTX = (ax if ax < cx else cx) if ax < bx else (bx if bx < cx else cx)
+    minTY = (ay if ay < cy else cy) if ay < by else (by if by < cy else cy)
+    maxTX = (ax if ax > cx else cx) if ax > bx else (bx if bx > cx else cx)
+    maxTY = (ay if ay > cy else cy) if ay > by else (by if by > cy else cy)
 
     # z-order range for the current triangle bbox;
     minZ = zOrder(minTX, minTY, minX, minY, size)
@@ -209,7 +223,13 @@ def isEarHashed(ear, minX, minY, size):
     p = ear.nextZ
 
     while p and p.z <= maxZ:
-        if p != ear.prev and p != ear.next and pointInTriangle(a.x, a.y, b.x, b.y, c.x, c.y, p.x, p.y) and area(p.prev, p, p.next) >= 0:
+        px = p.x
+        py = p.y
+        if minTX <= px <= maxTX and minTY <= py <= maxTY and p is not a and p is not c and \
+                (cx - px) * (ay - py) - (ax - px) * (cy - py) >= 0 and \
+                (ax - px) * (by - py) - (bx - px) * (ay - py) >= 0 and \
+                (bx - px) * (cy - py) - (cx - px) * (by - py) >= 0 and \
+                area(p.prev, p, p.next) >= 0:
             return False
         p = p.nextZ
 
@@ -217,7 +237,13 @@ def isEarHashed(ear, minX, minY, size):
     p = ear.prevZ
 
     while p and p.z >= minZ:
-        if p != ear.prev and p != ear.next and pointInTriangle(a.x, a.y, b.x, b.y, c.x, c.y, p.x, p.y) and area(p.prev, p, p.next) >= 0:
+        px = p.x
+        py = p.y
+        if minTX <= px <= maxTX and minTY <= py <= maxTY and p is not a and p is not c and \
+                (cx - px) * (ay - py) - (ax - px) * (cy - py) >= 0 and \
+                (ax - px) * (by - py) - (bx - px) * (ay - py) >= 0 and \
+                (bx - px) * (cy - py) - (cx - px) * (by - py) >= 0 and \
+                area(p.prev, p, p.next) >= 0:
             return False
         p = p.prevZ
 
@@ -618,6 +644,8 @@ def removeNode(p):
         p.nextZ.prevZ = p.prevZ
 
 class Node(object):
+    __slots__ = ('i', 'x', 'y', 'prev', 'next', 'z', 'prevZ', 'nextZ', 'steiner')
+
     def __init__(self, i, x, y):
     # vertice index in coordinates array
         self.i = i
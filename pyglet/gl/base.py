@@ -3,8 +3,9 @@ from __future__ import annotations
 import abc
 import threading
 import weakref
+from collections import OrderedDict
 from enum import Enum
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Any, Callable
 
 import pyglet
 from pyglet import gl
@@ -14,7 +15,7 @@ if TYPE_CHECKING:
     from _ctypes import Array
     from pyglet.display.base import Canvas
     from pyglet.gl.gl_info import GLInfo
-    from pyglet.graphics.shader import ShaderProgram
+    from pyglet.graphics.shader import Shader, ShaderProgram
 
 
 class OpenGLAPI(Enum):
@@ -211,6 +212,80 @@ class ObjectSpace:
         self.doomed_renderbuffers = []
 
 
+class BindingCache:
+    """The objects bound in a context, used to skip redundant binds.
+
+    pyglet binds shader programs, vertex arrays, buffers and textures through
+    the cache of the current context. A program or vertex array bind is only
+    issued to OpenGL if the object is not already bound. Buffer and texture
+    binds are only skipped if :py:attr:`pyglet.options.skip_redundant_binds`
+    is enabled, as applications commonly bind textures in
+    :py:meth:`~pyglet.graphics.Group.set_state` with OpenGL functions. The
+    cache is cleared whenever the context is made current, and when objects
+    are deleted.
+
+    If OpenGL functions are called directly to change any of the cached
+    bindings, :py:meth:`invalidate` must be called afterward.
+    """
+    program: int | None
+    vertex_array: int | None
+    texture_unit: int | None
+    buffers: dict[int, int]
+    textures: dict[tuple[int | None, int], int]
+    #: Whether buffer and texture binds are skipped when already bound.
+    skip_objects: bool
+
+    def __init__(self) -> None:  # noqa: D107
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Forget all bindings, so the next bind of each kind is always issued."""
+        self.skip_objects = pyglet.options.skip_redundant_binds
+        self.program = None
+        self.vertex_array = None
+        self.texture_unit = None
+        self.buffers = {}  # target: buffer id
+        self.textures = {}  # (texture unit, target): texture id
+
+    def use_program(self, program_id: int) -> None:
+        if program_id != self.program:
+            gl.glUseProgram(program_id)
+            self.program = program_id
+
+    def bind_vertex_array(self, vao_id: int) -> None:
+        if vao_id != self.vertex_array:
+            gl.glBindVertexArray(vao_id)
+            self.vertex_array = vao_id
+            # The element array buffer binding is part of the vertex array state:
+            self.buffers.pop(gl.GL_ELEMENT_ARRAY_BUFFER, None)
+
+    def bind_buffer(self, target: int, buffer_id: int) -> None:
+        if not self.skip_objects or self.buffers.get(target) != buffer_id:
+            gl.glBindBuffer(target, buffer_id)
+            self.buffers[target] = buffer_id
+
+    def bind_buffer_base(self, target: int, index: int, buffer_id: int) -> None:
+        # This also binds the buffer to the generic binding point of the target.
+        gl.glBindBufferBase(target, index, buffer_id)
+        self.buffers[target] = buffer_id
+
+    def active_texture(self, texture_unit: int) -> None:
+        if not self.skip_objects or texture_unit != self.texture_unit:
+            gl.glActiveTexture(gl.GL_TEXTURE0 + texture_unit)
+            self.texture_unit = texture_unit
+
+    def bind_texture(self, target: int, texture_id: int, texture_unit: int | None = None) -> None:
+        """Bind a texture to a texture unit, or the active texture unit if ``None``."""
+        if texture_unit is not None and (not self.skip_objects or texture_unit != self.texture_unit):
+            gl.glActiveTexture(gl.GL_TEXTURE0 + texture_unit)
+            self.texture_unit = texture_unit
+
+        key = self.texture_unit, target
+        if not self.skip_objects or self.textures.get(key) != texture_id:
+            gl.glBindTexture(target, texture_id)
+            self.textures[key] = texture_id
+
+
 class Context:
     """A base OpenGL context for drawing.
 
@@ -223,6 +298,11 @@ class Context:
     object_space: ObjectSpace
     config: DisplayConfig
     context_share: Context | None
+    #: The objects currently bound in this context.
+    bindings: BindingCache
+    #: The number of Shaders kept by :py:meth:`create_shader`. The least
+    #: recently used Shader is released when more are created.
+    max_cached_shaders: int = 64
 
     def __init__(self, config: DisplayConfig, context_share: Context | None = None) -> None:
         """Initialize a context.
@@ -242,12 +322,15 @@ class Context:
         self.doomed_vaos = []
         self.doomed_framebuffers = []
 
+        self.bindings = BindingCache()
+
         if context_share:
             self.object_space = context_share.object_space
         else:
             self.object_space = ObjectSpace()
 
         self._cached_programs = weakref.WeakValueDictionary()
+        self._cached_shaders: OrderedDict[tuple, Shader] = OrderedDict()
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(id={id(self)}, share={self.context_share})"
@@ -284,6 +367,9 @@ class Context:
         # Not per-thread
         gl.current_context = self
 
+        # Other contexts, or other code, may have changed the bindings since this context was last current:
+        self.bindings.invalidate()
+
         # Set active context.
         gl_info.set_active_context()
 
@@ -376,7 +462,28 @@ class Context:
         """
         return gl.current_context is self and threading.current_thread() is threading.main_thread()
 
-    def create_program(self, *sources: tuple[str, str]) -> ShaderProgram:
+    def create_shader(self, source: str, shader_type: str, defines: dict[str, Any] | None = None) -> Shader:
+        """Create a Shader from OpenGL GLSL source.
+
+        See :py:class:`~pyglet.graphics.shader.Shader` for a description of
+        the arguments.
+
+        .. note:: This method is cached. Given the same source, type and
+                  definitions, the same Shader instance is returned, so it
+                  is only compiled once. Up to :py:attr:`max_cached_shaders`
+                  of the most recently used Shaders are kept.
+        """
+        key = (source, shader_type, tuple(defines.items()) if defines else None)
+        try:
+            self._cached_shaders.move_to_end(key)
+            return self._cached_shaders[key]
+        except KeyError:
+            shader = self._cached_shaders[key] = pyglet.graphics.shader.Shader(source, shader_type, defines)
+            while len(self._cached_shaders) > self.max_cached_shaders:
+                self._cached_shaders.popitem(last=False)
+            return shader
+
+    def create_program(self, *sources: tuple[str, str], defines: dict[str, Any] | None = None) -> ShaderProgram:
         """Create a ShaderProgram from OpenGL GLSL source.
 
         This is a convenience method that takes one or more tuples of
@@ -386,20 +493,25 @@ class Context:
         ``source_string`` is OpenGL GLSL source code as a str, and ``shader_type``
         is the OpenGL shader type, such as "vertex" or "fragment". See
         :py:class:`~pyglet.graphics.shader.Shader` for more information.
+        The optional ``defines`` are added to every shader, which allows
+        variants of a program to be created from the same sources.
 
         .. note:: This method is cached. Given the same shader sources, the
-                  same ShaderProgram instance will be returned. For more
+                  same ShaderProgram instance will be returned. Shaders are
+                  cached by :py:meth:`create_shader`, so a source shared by
+                  several programs is only compiled once. For more
                   control over the ShaderProgram lifecycle, it is recommended
                   to manually create Shaders and link ShaderPrograms.
 
         .. versionadded:: 2.0.10
         """
-        if program := self._cached_programs.get(str(sources)):
+        key = str((sources, defines)) if defines else str(sources)
+        if program := self._cached_programs.get(key):
             return program
 
-        shaders = (pyglet.graphics.shader.Shader(src, srctype) for (src, srctype) in sources)
+        shaders = (self.create_shader(src, srctype, defines) for (src, srctype) in sources)
         program = pyglet.graphics.shader.ShaderProgram(*shaders)
-        self._cached_programs[str(sources)] = program
+        self._cached_programs[key] = program
 
         return program
 
@@ -417,6 +529,7 @@ class Context:
         """
         if self._safe_to_operate_on_object_space():
             gl.glDeleteTextures(1, gl.GLuint(texture_id))
+            gl.current_context.bindings.invalidate()
         else:
             self.object_space.doomed_textures.append(texture_id)
 
@@ -428,6 +541,7 @@ class Context:
         """
         if self._safe_to_operate_on_object_space():
             gl.glDeleteBuffers(1, gl.GLuint(buffer_id))
+            gl.current_context.bindings.invalidate()
         else:
             self.object_space.doomed_buffers.append(buffer_id)
 
@@ -439,6 +553,7 @@ class Context:
         """
         if self._safe_to_operate_on_object_space():
             gl.glDeleteProgram(gl.GLuint(program_id))
+            gl.current_context.bindings.invalidate()
         else:
             self.object_space.doomed_shader_programs.append(program_id)
 
@@ -476,6 +591,7 @@ class Context:
         """
         if self._safe_to_operate_on():
             gl.glDeleteVertexArrays(1, gl.GLuint(vao_id))
+            gl.current_context.bindings.invalidate()
         else:
             self.doomed_vaos.append(vao_id)
 
@@ -1396,6 +1396,8 @@ GL_QUERY_RESULT_NO_WAIT = 37268
 GL_TEXTURE_BUFFER_OFFSET = 37277
 GL_TEXTURE_BUFFER_SIZE = 37278
 GL_TEXTURE_BUFFER_OFFSET_ALIGNMENT = 37279
+GL_MAX_SHADER_COMPILER_THREADS_KHR = 37296
+GL_COMPLETION_STATUS_KHR = 37297
 GL_COMPUTE_SHADER = 37305
 GL_MAX_COMPUTE_UNIFORM_BLOCKS = 37307
 GL_MAX_COMPUTE_TEXTURE_IMAGE_UNITS = 37308
@@ -1936,6 +1938,7 @@ glMapBuffer = _link_function('glMapBuffer', POINTER(None), [GLenum, GLenum], req
 glMapBufferRange = _link_function('glMapBufferRange', POINTER(None), [GLenum, GLintptr, GLsizeiptr, GLbitfield], requires='OpenGL 3.0')
 glMapNamedBuffer = _link_function('glMapNamedBuffer', POINTER(None), [GLuint, GLenum], requires='OpenGL 4.5')
 glMapNamedBufferRange = _link_function('glMapNamedBufferRange', POINTER(None), [GLuint, GLintptr, GLsizeiptr, GLbitfield], requires='OpenGL 4.5')
+glMaxShaderCompilerThreadsKHR = _link_function('glMaxShaderCompilerThreadsKHR', None, [GLuint], requires='None')
 glMemoryBarrier = _link_function('glMemoryBarrier', None, [GLbitfield], requires='OpenGL 4.2')
 glMemoryBarrierByRegion = _link_function('glMemoryBarrierByRegion', None, [GLbitfield], requires='OpenGL 4.5')
 glMinSampleShading = _link_function('glMinSampleShading', None, [GLfloat], requires='OpenGL 4.0')
@@ -3848,6 +3851,8 @@ __all__ = [
     'GL_TASK_SUBROUTINE_UNIFORM_NV',
     'GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_MESH_SHADER_NV',
     'GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_TASK_SHADER_NV',
+    'GL_MAX_SHADER_COMPILER_THREADS_KHR',
+    'GL_COMPLETION_STATUS_KHR',
     'glActiveShaderProgram',
     'glActiveTexture',
     'glAttachShader',
@@ -4236,6 +4241,7 @@ __all__ = [
     'glMapBufferRange',
     'glMapNamedBuffer',
     'glMapNamedBufferRange',
+    'glMaxShaderCompilerThreadsKHR',
     'glMemoryBarrier',
     'glMemoryBarrierByRegion',
     'glMinSampleShading',
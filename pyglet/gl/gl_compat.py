@@ -1829,6 +1829,8 @@ GL_QUERY_RESULT_NO_WAIT = 37268
 GL_TEXTURE_BUFFER_OFFSET = 37277
 GL_TEXTURE_BUFFER_SIZE = 37278
 GL_TEXTURE_BUFFER_OFFSET_ALIGNMENT = 37279
+GL_MAX_SHADER_COMPILER_THREADS_KHR = 37296
+GL_COMPLETION_STATUS_KHR = 37297
 GL_COMPUTE_SHADER = 37305
 GL_MAX_COMPUTE_UNIFORM_BLOCKS = 37307
 GL_MAX_COMPUTE_TEXTURE_IMAGE_UNITS = 37308
@@ -2517,6 +2519,7 @@ glMaterialfv = _link_function('glMaterialfv', None, [GLenum, GLenum, POINTER(GLf
 glMateriali = _link_function('glMateriali', None, [GLenum, GLenum, GLint], requires='OpenGL 1.0')
 glMaterialiv = _link_function('glMaterialiv', None, [GLenum, GLenum, POINTER(GLint)], requires='OpenGL 1.0')
 glMatrixMode = _link_function('glMatrixMode', None, [GLenum], requires='OpenGL 1.0')
+glMaxShaderCompilerThreadsKHR = _link_function('glMaxShaderCompilerThreadsKHR', None, [GLuint], requires='None')
 glMemoryBarrier = _link_function('glMemoryBarrier', None, [GLbitfield], requires='OpenGL 4.2')
 glMemoryBarrierByRegion = _link_function('glMemoryBarrierByRegion', None, [GLbitfield], requires='OpenGL 4.5')
 glMinSampleShading = _link_function('glMinSampleShading', None, [GLfloat], requires='OpenGL 4.0')
@@ -5065,6 +5068,8 @@ __all__ = [
     'GL_TASK_SUBROUTINE_UNIFORM_NV',
     'GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_MESH_SHADER_NV',
     'GL_ATOMIC_COUNTER_BUFFER_REFERENCED_BY_TASK_SHADER_NV',
+    'GL_MAX_SHADER_COMPILER_THREADS_KHR',
+    'GL_COMPLETION_STATUS_KHR',
     'glAccum',
     'glActiveShaderProgram',
     'glActiveTexture',
@@ -5594,6 +5599,7 @@ __all__ = [
     'glMateriali',
     'glMaterialiv',
     'glMatrixMode',
+    'glMaxShaderCompilerThreadsKHR',
     'glMemoryBarrier',
     'glMemoryBarrierByRegion',
     'glMinSampleShading',
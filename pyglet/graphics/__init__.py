@@ -9,32 +9,56 @@ See the :ref:`guide_graphics` for details on how to use this graphics API.
 from __future__ import annotations
 
 import ctypes
+import functools
 import weakref
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Sequence, Tuple
 
 import pyglet
 from pyglet.gl.gl import (
-    GL_TEXTURE0,
+    GL_BLEND,
+    GL_BLEND_DST_ALPHA,
+    GL_BLEND_DST_RGB,
+    GL_BLEND_SRC_ALPHA,
+    GL_BLEND_SRC_RGB,
+    GL_COLOR,
+    GL_DRAW_FRAMEBUFFER_BINDING,
+    GL_FRAMEBUFFER,
+    GL_ONE,
+    GL_ONE_MINUS_SRC_ALPHA,
+    GL_TRIANGLES,
     GL_UNSIGNED_BYTE,
     GL_UNSIGNED_INT,
     GL_UNSIGNED_SHORT,
+    GL_VIEWPORT,
+    GLfloat,
+    GLint,
     GLuint,
-    glActiveTexture,
-    glBindTexture,
-    glBindVertexArray,
+    glBindFramebuffer,
+    glBlendFunc,
+    glBlendFuncSeparate,
+    glClearBufferfv,
     glDeleteVertexArrays,
+    glDisable,
     glDrawArrays,
     glDrawElements,
+    glEnable,
     glFlush,
     glGenVertexArrays,
+    glGetIntegerv,
+    glIsEnabled,
+    glViewport,
 )
 from pyglet.graphics import shader, vertexdomain
+from pyglet.graphics.culling import SpatialGrid
+from pyglet.graphics.stats import BatchProfiler, DrawStats
 from pyglet.graphics.vertexarray import VertexArray  # noqa: F401
 from pyglet.graphics.vertexbuffer import BufferObject
 
 if TYPE_CHECKING:
+    from pyglet.graphics.culling import Bounds
     from pyglet.graphics.shader import ShaderProgram
     from pyglet.graphics.vertexdomain import IndexedVertexList, VertexList
+    from pyglet.image import Texture
 
 _debug_graphics_batch = pyglet.options['debug_graphics_batch']
 
@@ -59,7 +83,7 @@ def draw(size: int, mode: int, **data: Any) -> None:
     # Create and bind a throwaway VAO
     vao_id = GLuint()
     glGenVertexArrays(1, vao_id)
-    glBindVertexArray(vao_id)
+    pyglet.gl.current_context.bindings.bind_vertex_array(vao_id.value)
     # Activate shader program:
     program = get_default_shader()
     program.use()
@@ -87,7 +111,7 @@ def draw(size: int, mode: int, **data: Any) -> None:
     program.stop()
     # Discard everything after drawing:
     del buffers
-    glBindVertexArray(0)
+    pyglet.gl.current_context.bindings.bind_vertex_array(0)
     glDeleteVertexArrays(1, vao_id)
 
 
@@ -113,7 +137,7 @@ def draw_indexed(size: int, mode: int, indices: Sequence[int], **data: Any) -> N
     # Create and bind a throwaway VAO
     vao_id = GLuint()
     glGenVertexArrays(1, vao_id)
-    glBindVertexArray(vao_id)
+    pyglet.gl.current_context.bindings.bind_vertex_array(vao_id.value)
     # Activate shader program:
     program = get_default_shader()
     program.use()
@@ -160,7 +184,7 @@ def draw_indexed(size: int, mode: int, indices: Sequence[int], **data: Any) -> N
     # Discard everything after drawing:
     del buffers
     del index_buffer
-    glBindVertexArray(0)
+    pyglet.gl.current_context.bindings.bind_vertex_array(0)
     glDeleteVertexArrays(1, vao_id)
 
 
@@ -233,6 +257,29 @@ _blit_fragment_source: str = """#version 330 core
     }
 """
 
+_composite_vertex_source: str = """#version 330 core
+    in vec2 position;
+    out vec2 texture_coords;
+
+    void main()
+    {
+        gl_Position = vec4(position, 0.0, 1.0);
+        texture_coords = position * 0.5 + 0.5;
+    }
+"""
+
+_composite_fragment_source: str = """#version 330 core
+    in vec2 texture_coords;
+    out vec4 final_colors;
+
+    uniform sampler2D cached_texture;
+
+    void main()
+    {
+        final_colors = texture(cached_texture, texture_coords);
+    }
+"""
+
 def get_default_batch() -> Batch:
     """Batch used globally for objects that have no Batch specified."""
     try:
@@ -274,6 +321,85 @@ _domain_class_map: dict[tuple[bool, bool], type[vertexdomain.VertexDomain]] = {
 
 DomainKey = Tuple[bool, int, int, str]
 
+# Operations generated when visiting the group tree, see Batch._update_draw_list.
+_SET_STATE = 0
+_DRAW = 1
+_UNSET_STATE = 2
+_BEGIN_TIMER = 3
+_END_TIMER = 4
+
+
+def _draw_domains(domains: tuple[tuple[vertexdomain.VertexDomain, int], ...]) -> None:
+    for domain, mode in domains:
+        domain.draw(mode)
+
+
+def _elide_state_changes(operations: list[tuple]) -> list[tuple]:
+    """Remove state changes which have no effect.
+
+    Groups that do not override ``set_state`` or ``unset_state`` are skipped,
+    and an ``unset_state`` immediately followed by a ``set_state`` of a group
+    with the same state (see :py:meth:`Group.has_same_state`) is removed.
+    """
+    elided = []
+    for operation in operations:
+        op = operation[0]
+        if op == _SET_STATE:
+            group = operation[1]
+            if type(group).set_state is Group.set_state:
+                continue
+            if elided and elided[-1][0] == _UNSET_STATE and group.has_same_state(elided[-1][1]):
+                # The previous group leaves the exact state this group would set.
+                elided.pop()
+                continue
+        elif op == _UNSET_STATE and type(operation[1]).unset_state is Group.unset_state:
+            continue
+        elided.append(operation)
+
+    return elided
+
+
+def _create_draw_list(operations: list[tuple], merge_draws: bool,
+                      profiler: BatchProfiler | None) -> list[Callable]:
+    """Create the list of functions to call from the operations.
+
+    If ``merge_draws`` is ``True``, consecutive domain draws are merged into
+    a single call. If a profiler is given, all calls are instrumented.
+    """
+    draw_list = []
+    domains = []
+    for op, *args in operations:
+        if op == _DRAW:
+            if profiler:
+                draw_list.append(profiler.wrap_draw(*args))
+            elif merge_draws:
+                domains.append(tuple(args))
+            else:
+                draw_list.append((lambda d, m: lambda: d.draw(m))(*args))  # noqa: PLC3002
+            continue
+
+        if domains:
+            draw_list.append(functools.partial(_draw_domains, tuple(domains)))
+            domains = []
+
+        if op == _SET_STATE:
+            func = args[0].set_state
+        elif op == _UNSET_STATE:
+            func = args[0].unset_state
+        elif op == _BEGIN_TIMER:
+            draw_list.append(functools.partial(profiler.begin_timer, args[0]))
+            continue
+        else:
+            draw_list.append(functools.partial(profiler.end_timer, args[0]))
+            continue
+        draw_list.append(profiler.wrap_state(func) if profiler else func)
+
+    if domains:
+        draw_list.append(functools.partial(_draw_domains, tuple(domains)))
+
+    return draw_list
+
+
 class Batch:
     """Manage a collection of drawables for batched rendering.
 
@@ -296,6 +422,13 @@ class Batch:
     While any drawables can be added to a `Batch`, only those with the same
     draw mode, shader program, and group can be optimised together.
 
+    If the Batch is created with ``compile_draw_list=True``, the draw list is
+    further reduced when it is rebuilt: groups without state changes are
+    skipped, sibling groups which set the same state (as determined by
+    :py:meth:`Group.has_same_state`) do not unset and set it again, and
+    consecutive domain draws are issued from a single call. This is useful
+    for batches containing many groups which share a program or texture.
+
     Internally, a `Batch` manages a set of VertexDomains along with
     information about how the domains are to be drawn. To implement batching on
     a custom drawable, get your vertex domains from the given batch instead of
@@ -306,8 +439,37 @@ class Batch:
     group_children: dict[Group, list[Group]]
     group_map: dict[Group, dict[DomainKey, vertexdomain.VertexDomain]]
 
-    def __init__(self) -> None:
-        """Create a graphics batch."""
+    def __init__(self, compile_draw_list: bool = False, compaction_threshold: float | None = None,
+                 stream_attributes: Sequence[str] = (), indirect_draw: bool = False,
+                 culling_cell_size: float | None = None) -> None:
+        """Create a graphics batch.
+
+        Args:
+            compile_draw_list:
+                If ``True``, redundant state changes between groups are
+                removed from the draw list, and domain draws are merged.
+            compaction_threshold:
+                If set, each vertex domain is compacted before drawing once
+                more than this fraction (0.0 to 1.0) of its buffers is lost to
+                gaps left by deleted vertex lists. See :py:meth:`compact`.
+            stream_attributes:
+                Names of vertex attributes which are rewritten every frame,
+                such as ``('translate', 'colors')``. If the OpenGL context
+                supports buffer storage (4.4 or ``GL_ARB_buffer_storage``),
+                these attributes are written to persistently mapped, fenced
+                ring buffers instead of being uploaded with ``glBufferSubData``.
+            indirect_draw:
+                If ``True`` and the context supports multi-draw-indirect (4.3
+                or ``GL_ARB_multi_draw_indirect``), the draw commands of each
+                vertex domain are kept in a ``GL_DRAW_INDIRECT_BUFFER`` which
+                is only rewritten when vertex lists are added or removed.
+            culling_cell_size:
+                If set, each vertex domain keeps a
+                :py:class:`~pyglet.graphics.culling.SpatialGrid` of the
+                bounds of its vertex lists, with cells of this size. Once a
+                :py:attr:`view` is set, only the vertex lists intersecting it
+                are drawn. See :py:meth:`VertexList.set_bounds`.
+        """
         # Mapping to find domain.
         # group -> (attributes, mode, indexed) -> domain
         self.group_map = {}
@@ -320,11 +482,21 @@ class Batch:
 
         self._draw_list = []
         self._draw_list_dirty = False
+        self._compile_draw_list = compile_draw_list
+        self._compaction_threshold = compaction_threshold
+        self._stream_attributes = tuple(stream_attributes)
+        self._indirect_draw = indirect_draw
+        self._culling_cell_size = culling_cell_size
+        self._view = None
+        self._profiler = None
 
         self._context = pyglet.gl.current_context
 
         self._instance_count = 0
 
+        # Functions to call before the next draw, see schedule_update:
+        self._update_callbacks = []
+
     def invalidate(self) -> None:
         """Force the batch to update the draw list.
 
@@ -335,6 +507,28 @@ class Batch:
         """
         self._draw_list_dirty = True
 
+    def schedule_update(self, callback: Callable[[], None]) -> None:
+        """Call a function once, before the batch is next drawn.
+
+        Drawables can use this to defer updating their vertex data. Several
+        changes made to a drawable between draws can then be combined into a
+        single update, such as moving, rotating and resizing a shape.
+
+        The function is called before the batch is drawn with :py:meth:`draw`
+        or :py:meth:`draw_subset`. A reference to it is kept until then.
+
+        Args:
+            callback:
+                The function to call, without arguments.
+        """
+        self._update_callbacks.append(callback)
+
+    def _run_update_callbacks(self) -> None:
+        callbacks = self._update_callbacks
+        self._update_callbacks = []
+        for callback in callbacks:
+            callback()
+
     def update_shader(self, vertex_list: VertexList | IndexedVertexList, mode: int, group: Group,
                       program: ShaderProgram) -> bool:
         """Migrate a vertex list to another domain that has the specified shader attributes.
@@ -450,7 +644,12 @@ class Batch:
             domain = domain_map[key]
         except KeyError:
             # Create domain
-            domain = _domain_class_map[(indexed, instanced)](attributes)
+            domain = _domain_class_map[(indexed, instanced)](attributes, stream_attributes=self._stream_attributes)
+            domain.compaction_threshold = self._compaction_threshold
+            domain.indirect_draw = self._indirect_draw
+            if self._culling_cell_size is not None and not instanced:
+                domain.culling = SpatialGrid(self._culling_cell_size)
+                domain.culling.view = self._view
             domain_map[key] = domain
             self._draw_list_dirty = True
 
@@ -485,7 +684,7 @@ class Batch:
                 if domain.is_empty:
                     del domain_map[(indexed, instanced, mode, formats)]
                     continue
-                draw_list.append((lambda d, m: lambda: d.draw(m))(domain, mode))  # noqa: PLC3002
+                draw_list.append((_DRAW, domain, mode))
 
             # Sort and visit child groups of this group
             children = self.group_children.get(group)
@@ -496,7 +695,7 @@ class Batch:
                         draw_list.extend(visit(child))
 
             if children or domain_map:
-                return [group.set_state, *draw_list, group.unset_state]
+                return [(_SET_STATE, group), *draw_list, (_UNSET_STATE, group)]
 
             # Remove unused group from batch
             del self.group_map[group]
@@ -514,13 +713,26 @@ class Batch:
 
             return []
 
-        self._draw_list = []
+        operations = []
+        profiler = self._profiler
+        gpu_timers = profiler is not None and profiler.gpu_timers
 
         self.top_groups.sort()
         for top_group in list(self.top_groups):
             if top_group.visible:
-                self._draw_list.extend(visit(top_group))
+                top_operations = visit(top_group)
+                if gpu_timers and top_operations:
+                    operations.extend([(_BEGIN_TIMER, top_group), *top_operations, (_END_TIMER, top_group)])
+                else:
+                    operations.extend(top_operations)
+
+        if profiler:
+            profiler.group_count = sum(1 for op, *_ in operations if op == _SET_STATE)
 
+        if self._compile_draw_list:
+            operations = _elide_state_changes(operations)
+
+        self._draw_list = _create_draw_list(operations, self._compile_draw_list, profiler)
         self._draw_list_dirty = False
 
         if _debug_graphics_batch:
@@ -551,11 +763,100 @@ class Batch:
 
     def draw(self) -> None:
         """Draw the batch."""
+        if self._update_callbacks:
+            self._run_update_callbacks()
+
         if self._draw_list_dirty:
             self._update_draw_list()
 
-        for func in self._draw_list:
-            func()
+        if self._profiler is None:
+            for func in self._draw_list:
+                func()
+        else:
+            self._profiler.begin_frame()
+            for func in self._draw_list:
+                func()
+            self._profiler.end_frame()
+
+    def enable_stats(self, gpu_timers: bool = False) -> None:
+        """Collect statistics about the work done each time the batch is drawn.
+
+        After each :py:meth:`draw`, a :py:class:`~pyglet.graphics.stats.DrawStats`
+        snapshot is available from :py:attr:`stats`. The statistics include the
+        number of groups, state changes, domains, draw calls and primitives,
+        as well as the number of bytes uploaded to vertex buffers.
+
+        Collecting statistics adds some overhead to drawing, so should usually
+        only be enabled while profiling.
+
+        Args:
+            gpu_timers:
+                If ``True``, the GPU time spent drawing each top-level group is
+                also measured with ``GL_TIME_ELAPSED`` queries.
+        """
+        self.disable_stats()
+        self._profiler = BatchProfiler(gpu_timers)
+        self._draw_list_dirty = True
+
+    def disable_stats(self) -> None:
+        """Stop collecting statistics, see :py:meth:`enable_stats`."""
+        if self._profiler is not None:
+            self._profiler.delete()
+            self._profiler = None
+            self._draw_list_dirty = True
+
+    @property
+    def stats(self) -> DrawStats | None:
+        """Statistics of the most recent draw, if enabled.
+
+        ``None`` unless enabled with :py:meth:`enable_stats`, and the batch
+        has been drawn since.
+
+        Read only.
+        """
+        return self._profiler.stats if self._profiler else None
+
+    @property
+    def culling_cell_size(self) -> float | None:
+        """The cell size of the spatial index used for culling, if enabled.
+
+        Read only.
+        """
+        return self._culling_cell_size
+
+    @property
+    def view(self) -> Bounds | None:
+        """The visible area as ``(x, y, width, height)``, used for culling.
+
+        This is in the same coordinates as the vertex positions, so usually
+        needs to be updated along with a camera or the window's view matrix.
+        Setting a view has no effect unless the batch was created with a
+        ``culling_cell_size``. If ``None`` (the default), everything is drawn.
+        """
+        return self._view
+
+    @view.setter
+    def view(self, view: Bounds | None) -> None:
+        self._view = view
+        for domain_map in self.group_map.values():
+            for domain in domain_map.values():
+                if domain.culling is not None:
+                    domain.culling.view = view
+
+    def compact(self) -> None:
+        """Compact all vertex domains in the batch.
+
+        Creating and deleting many drawables leaves gaps in the buffers of the
+        vertex domains, and each region between gaps requires another entry in
+        the domain's draw call. Compacting moves the vertex data of every domain
+        into a contiguous region, and shrinks the buffers to fit.
+
+        This can be expensive for large batches, so is best done at a natural
+        pause, such as after loading or unloading a level.
+        """
+        for domain_map in self.group_map.values():
+            for domain in domain_map.values():
+                domain.compact()
 
     def draw_subset(self, vertex_lists: Sequence[VertexList | IndexedVertexList]) -> None:
         """Draw only some vertex lists in the batch.
@@ -572,6 +873,8 @@ class Batch:
                 Vertex lists to draw.
 
         """
+        if self._update_callbacks:
+            self._run_update_callbacks()
 
         # Horrendously inefficient.
         def visit(group: Group) -> None:
@@ -600,6 +903,150 @@ class Batch:
                 visit(top_group)
 
 
+class CachedBatch(Batch):
+    """A Batch which is rendered once into a texture, and drawn from it.
+
+    Static content, such as UI panels or tile layers, is drawn with a single
+    textured quad covering the viewport, instead of setting the state of every
+    group and drawing every domain each frame. The batch is rendered into its
+    texture again only after it changes: when vertex lists are added, removed
+    or modified, when the viewport size changes, or after :py:meth:`invalidate`
+    is called.
+
+    Changes of uniforms, such as the projection or view of the window, are not
+    detected. Call :py:meth:`invalidate` after changing them.
+
+    .. note:: The texture has no depth buffer, and is composited with
+              premultiplied alpha blending. Opaque content is reproduced
+              exactly, while the alpha of translucent content is approximate.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Create a cached graphics batch.
+
+        Args:
+            kwargs:
+                The arguments of :py:class:`Batch`.
+        """
+        super().__init__(**kwargs)
+        self._cache_valid = False
+        self._texture = None
+        self._framebuffer = None
+        self._quad = None
+        # The allocator generations of the domains when last rendered:
+        self._generations = ()
+
+    def invalidate(self) -> None:
+        """Force the batch to update the draw list, and to be rendered again."""
+        super().invalidate()
+        self._cache_valid = False
+
+    @property
+    def texture(self) -> Texture | None:
+        """The texture the batch was last rendered into, if any."""
+        return self._texture
+
+    def _get_generations(self) -> tuple[int, ...]:
+        generations = []
+        for domain_map in self.group_map.values():
+            for domain in domain_map.values():
+                generations.append(domain.allocator.generation)
+                index_allocator = getattr(domain, 'index_allocator', None)
+                if index_allocator is not None:
+                    generations.append(index_allocator.generation)
+        return tuple(generations)
+
+    def _has_changes(self) -> bool:
+        if self._draw_list_dirty:
+            return True
+
+        for domain_map in self.group_map.values():
+            for domain in domain_map.values():
+                for buffer, _ in domain.buffer_attributes:
+                    if buffer._dirty:  # noqa: SLF001
+                        return True
+                index_buffer = getattr(domain, 'index_buffer', None)
+                if index_buffer is not None and index_buffer._dirty:  # noqa: SLF001
+                    return True
+
+        # Vertex lists were added or deleted:
+        return self._get_generations() != self._generations
+
+    def _render(self, x: int, y: int, width: int, height: int) -> None:
+        texture = self._texture
+        if texture is None or texture.width != width or texture.height != height:
+            if texture is not None:
+                self._framebuffer.delete()
+                texture.delete()
+            self._texture = pyglet.image.Texture.create(width, height)
+            self._framebuffer = pyglet.image.buffer.Framebuffer()
+            self._framebuffer.attach_texture(self._texture)
+
+        previous_framebuffer = GLint()
+        glGetIntegerv(GL_DRAW_FRAMEBUFFER_BINDING, previous_framebuffer)
+
+        self._framebuffer.bind()
+        glViewport(0, 0, width, height)
+        glClearBufferfv(GL_COLOR, 0, (GLfloat * 4)(0, 0, 0, 0))
+        super().draw()
+
+        glBindFramebuffer(GL_FRAMEBUFFER, previous_framebuffer.value)
+        glViewport(x, y, width, height)
+        self._cache_valid = True
+        self._generations = self._get_generations()
+
+    def _composite(self) -> None:
+        program = pyglet.gl.current_context.create_program((_composite_vertex_source, 'vertex'),
+                                                           (_composite_fragment_source, 'fragment'))
+        if self._quad is None:
+            self._quad = program.vertex_list(6, GL_TRIANGLES, batch=Batch(),
+                                             position=('f', (-1, -1, 1, -1, 1, 1, -1, -1, 1, 1, -1, 1)))
+
+        # Restore the blend state of the caller afterward:
+        blend_enabled = glIsEnabled(GL_BLEND)
+        blend_func = [GLint() for _ in range(4)]
+        for name, value in zip((GL_BLEND_SRC_RGB, GL_BLEND_DST_RGB, GL_BLEND_SRC_ALPHA, GL_BLEND_DST_ALPHA), blend_func):
+            glGetIntegerv(name, value)
+
+        program.use()
+        pyglet.gl.current_context.bindings.bind_texture(self._texture.target, self._texture.id, 0)
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_ONE, GL_ONE_MINUS_SRC_ALPHA)
+        self._quad.draw(GL_TRIANGLES)
+        glBlendFuncSeparate(*(value.value for value in blend_func))
+        if not blend_enabled:
+            glDisable(GL_BLEND)
+        program.stop()
+
+    def draw(self) -> None:
+        """Draw the batch, rendering it into its texture first if it changed."""
+        if self._update_callbacks:
+            self._run_update_callbacks()
+
+        viewport = (GLint * 4)()
+        glGetIntegerv(GL_VIEWPORT, viewport)
+        x, y, width, height = viewport
+
+        texture = self._texture
+        if (not self._cache_valid or texture is None or texture.width != width or texture.height != height or
+                self._has_changes()):
+            self._render(x, y, width, height)
+
+        self._composite()
+
+    def delete(self) -> None:
+        """Release the texture, framebuffer and quad of the cache."""
+        if self._texture is not None:
+            self._framebuffer.delete()
+            self._texture.delete()
+            self._texture = None
+            self._framebuffer = None
+        if self._quad is not None:
+            self._quad.delete()
+            self._quad = None
+        self._cache_valid = False
+
+
 class Group:
     """Group of common OpenGL state.
 
@@ -703,6 +1150,19 @@ class Group:
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(order={self._order})"
 
+    def has_same_state(self, other: Group) -> bool:
+        """Whether another Group applies exactly the same OpenGL state as this one.
+
+        Unlike ``__eq__``, the order and parent are not considered. A
+        :py:class:`Batch` created with ``compile_draw_list=True`` uses this
+        to skip unsetting and setting state between neighbouring groups.
+
+        The default implementation returns ``False``, which is always safe.
+        Subclasses adding state to a Group that overrides this must override
+        it again.
+        """
+        return False
+
     def set_state(self) -> None:
         """Apply the OpenGL state change.
 
@@ -751,6 +1211,15 @@ class ShaderGroup(Group):
     def unset_state(self) -> None:
         self.program.stop()
 
+    def has_same_state(self, other: Group) -> bool:
+        """Whether another ShaderGroup uses the same program.
+
+        Subclasses are never considered to have the same state, as they may
+        set state of their own. They must override this method to be
+        coalesced.
+        """
+        return self.__class__ is ShaderGroup and other.__class__ is ShaderGroup and self.program == other.program
+
     def __eq__(self, other: ShaderGroup) -> bool:
         return (self.__class__ is other.__class__ and
                 self._order == other.order and
@@ -782,8 +1251,18 @@ class TextureGroup(Group):
         self.texture = texture
 
     def set_state(self) -> None:
-        glActiveTexture(GL_TEXTURE0)
-        glBindTexture(self.texture.target, self.texture.id)
+        pyglet.gl.current_context.bindings.bind_texture(self.texture.target, self.texture.id, 0)
+
+    def has_same_state(self, other: Group) -> bool:
+        """Whether another TextureGroup binds the same texture.
+
+        Subclasses are never considered to have the same state, as they may
+        set state of their own. They must override this method to be
+        coalesced.
+        """
+        return (self.__class__ is TextureGroup and other.__class__ is TextureGroup and
+                self.texture.target == other.texture.target and
+                self.texture.id == other.texture.id)
 
     def __hash__(self) -> int:
         return hash((self.texture.target, self.texture.id, self.order, self.parent))
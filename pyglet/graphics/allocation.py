@@ -32,8 +32,12 @@ responsibility to maintain the allocated regions.
 # -allocator does not track individual allocated regions.  Trusts caller
 #  to provide accurate (start, size) tuple, which completely describes
 #  a region from the allocator's point of view.
-# -this means that compacting is probably not feasible, or would be hideously
-#  expensive
+# -this means that the allocator cannot compact itself. Compaction is instead
+#  done by the vertex domains, which know their vertex lists and replace the
+#  allocator with a fresh one (see VertexDomain.compact)
+# -every change to the layout of the allocated regions bumps a generation
+#  counter, so callers can cache data derived from get_allocated_regions()
+#  (such as the packed glMultiDrawArrays arguments) until it changes.
 from __future__ import annotations
 
 
@@ -55,8 +59,9 @@ class Allocator:
     """Buffer space allocation implementation."""
     sizes: list[int]
     starts: list[int]
+    generation: int
 
-    __slots__ = 'capacity', 'starts', 'sizes'
+    __slots__ = 'capacity', 'starts', 'sizes', 'generation'
 
     def __init__(self, capacity: int) -> None:
         """Create an allocator for a buffer of the specified maximum capacity size."""
@@ -81,6 +86,9 @@ class Allocator:
         self.starts = []
         self.sizes = []
 
+        # Incremented whenever ``starts`` or ``sizes`` are modified.
+        self.generation = 0
+
     def set_capacity(self, size: int) -> None:
         """Resize the maximum buffer size.
 
@@ -107,6 +115,8 @@ class Allocator:
         if size == 0:
             return 0
 
+        self.generation += 1
+
         # Return start, or raise AllocatorMemoryException
         if not self.starts:
             if size <= self.capacity:
@@ -182,6 +192,8 @@ class Allocator:
 
         # return start, or raise AllocatorMemoryException
 
+        self.generation += 1
+
         # Truncation is the same as deallocating the tail cruft
         if new_size < size:
             self.dealloc(start + new_size, size - new_size)
@@ -254,6 +266,8 @@ class Allocator:
 
         assert self.starts
 
+        self.generation += 1
+
         # Find which block needs to be split
         for i, (alloc_start, alloc_size) in enumerate(zip(*(self.starts, self.sizes))):
             p = start - alloc_start
@@ -0,0 +1,190 @@
+"""Spatial indexing of vertex lists, for drawing only those in view.
+
+A :py:class:`SpatialGrid` sorts items into the cells of a uniform grid by
+their 2D bounds, so the items intersecting a view rectangle can be found
+without testing every item. Vertex domains use one grid each when their
+:py:class:`~pyglet.graphics.Batch` is created with a ``culling_cell_size``.
+
+Items without bounds are always considered visible.
+"""
+from __future__ import annotations
+
+import math
+from typing import Any, Tuple
+
+__all__ = ['Bounds', 'SpatialGrid']
+
+#: Axis aligned bounds as ``(x, y, width, height)``.
+Bounds = Tuple[float, float, float, float]
+
+
+class SpatialGrid:
+    """A uniform grid of axis aligned bounds.
+
+    Each item is stored in every cell its bounds overlap. Updating the
+    bounds of an item only touches the grid cells when the item moves into
+    different cells, so items moving a little every frame are cheap to keep
+    up to date.
+    """
+    cell_size: float
+    generation: int
+
+    def __init__(self, cell_size: float = 256.0) -> None:
+        """Create an empty grid.
+
+        Args:
+            cell_size:
+                Width and height of each cell. This is best set to a few times
+                the size of a typical item.
+        """
+        self.cell_size = cell_size
+        # Incremented on any change which can affect the result of a query of the view.
+        self.generation = 0
+        self._view = None
+        self._unbounded = set()
+        self._cells = {}  # (column, row): set of items
+        self._bounds = {}  # item: (x1, y1, x2, y2)
+        self._item_cells = {}  # item: (first column, first row, last column, last row)
+
+    @property
+    def view(self) -> Bounds | None:
+        """The bounds of the visible area, or ``None`` if everything is visible."""
+        return self._view
+
+    @view.setter
+    def view(self, view: Bounds | None) -> None:
+        self._view = view
+        self.generation += 1
+
+    def __len__(self) -> int:
+        return len(self._unbounded) + len(self._bounds)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._unbounded or item in self._bounds
+
+    def add(self, item: Any, bounds: Bounds | None = None) -> None:
+        """Add an item, which is always visible if ``bounds`` is ``None``."""
+        if bounds is None:
+            self._unbounded.add(item)
+            self.generation += 1
+        else:
+            self.set_bounds(item, bounds)
+
+    def set_bounds(self, item: Any, bounds: Bounds) -> None:
+        """Add an item, or update the bounds of an existing item."""
+        x, y, width, height = bounds
+        new_bounds = (x, y, x + width, y + height)
+        old_bounds = self._bounds.get(item)
+        if new_bounds == old_bounds:
+            return
+
+        size = self.cell_size
+        cells = tuple(math.floor(value / size) for value in new_bounds)
+
+        old_cells = self._item_cells.get(item)
+        if old_cells != cells:
+            if old_cells is None:
+                self._unbounded.discard(item)
+            else:
+                self._remove_from_cells(item, old_cells)
+            self._add_to_cells(item, cells)
+            self._item_cells[item] = cells
+
+        self._bounds[item] = new_bounds
+
+        # Items moving within the view, or outside of it, do not change the result of a query:
+        if old_bounds is None or self._in_view(old_bounds) != self._in_view(new_bounds):
+            self.generation += 1
+
+    def get_bounds(self, item: Any) -> Bounds | None:
+        """Get the bounds of an item, or ``None`` if it has none."""
+        try:
+            x, y, x2, y2 = self._bounds[item]
+        except KeyError:
+            return None
+        return x, y, x2 - x, y2 - y
+
+    def remove(self, item: Any) -> Bounds | None:
+        """Remove an item, returning its previous bounds.
+
+        Removing an item which is not in the grid does nothing.
+        """
+        bounds = self.get_bounds(item)
+        if bounds is None:
+            if item in self._unbounded:
+                self._unbounded.discard(item)
+                self.generation += 1
+            return None
+
+        self._remove_from_cells(item, self._item_cells.pop(item))
+        del self._bounds[item]
+        self.generation += 1
+        return bounds
+
+    def query(self, bounds: Bounds | None = None) -> set:
+        """Get all items intersecting the given bounds, or the current view.
+
+        Items without bounds are always included. If neither ``bounds`` nor
+        a :py:attr:`view` is set, all items are returned.
+        """
+        if bounds is None:
+            bounds = self._view
+            if bounds is None:
+                return self._unbounded | self._bounds.keys()
+
+        x, y, width, height = bounds
+        x2 = x + width
+        y2 = y + height
+        size = self.cell_size
+        first_column = math.floor(x / size)
+        first_row = math.floor(y / size)
+        last_column = math.floor(x2 / size)
+        last_row = math.floor(y2 / size)
+
+        if (last_column - first_column + 1) * (last_row - first_row + 1) > len(self._cells):
+            # The view covers more cells than are in use:
+            candidate_cells = [items for (column, row), items in self._cells.items()
+                               if first_column <= column <= last_column and first_row <= row <= last_row]
+        else:
+            cells = self._cells
+            candidate_cells = [cells[column, row]
+                               for column in range(first_column, last_column + 1)
+                               for row in range(first_row, last_row + 1)
+                               if (column, row) in cells]
+
+        found = set(self._unbounded)
+        all_bounds = self._bounds
+        for items in candidate_cells:
+            for item in items:
+                if item in found:
+                    continue
+                ix, iy, ix2, iy2 = all_bounds[item]
+                if ix <= x2 and x <= ix2 and iy <= y2 and y <= iy2:
+                    found.add(item)
+
+        return found
+
+    def _in_view(self, bounds: tuple[float, float, float, float]) -> bool:
+        if self._view is None:
+            return True
+        x, y, width, height = self._view
+        x1, y1, x2, y2 = bounds
+        return x1 <= x + width and x <= x2 and y1 <= y + height and y <= y2
+
+    def _add_to_cells(self, item: Any, cells: tuple[int, int, int, int]) -> None:
+        first_column, first_row, last_column, last_row = cells
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                try:
+                    self._cells[column, row].add(item)
+                except KeyError:
+                    self._cells[column, row] = {item}
+
+    def _remove_from_cells(self, item: Any, cells: tuple[int, int, int, int]) -> None:
+        first_column, first_row, last_column, last_row = cells
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                items = self._cells[column, row]
+                items.discard(item)
+                if not items:
+                    del self._cells[column, row]
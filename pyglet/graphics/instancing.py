@@ -0,0 +1,103 @@
+"""Bookkeeping shared by the instancers of sprites and shapes.
+
+An instancer draws many lightweight objects as the instances of one
+instanced vertex list. Each object is an :py:class:`InstanceRecord`, whose
+data is stored at its index in the instance attribute buffers. The records
+are kept densely packed: removing one moves the last record into its place,
+so the instances can always be drawn with a single call.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from pyglet.gl.gl import GL_TRIANGLES
+
+if TYPE_CHECKING:
+    from pyglet.graphics import Group
+    from pyglet.graphics.vertexdomain import IndexedVertexList, InstancedVertexDomain
+
+__all__ = ['InstanceRecord', 'Instancer']
+
+_R = TypeVar('_R', bound='InstanceRecord')
+
+
+class InstanceRecord:
+    """One instance of an :py:class:`Instancer`.
+
+    Subclasses store their own properties, and write them to the instance
+    attribute buffers at :py:attr:`_index` in :py:meth:`_write`.
+    """
+
+    __slots__ = ('_index', '_instancer')
+
+    def __init__(self, instancer: Instancer, index: int) -> None:  # noqa: D107
+        self._instancer = instancer
+        self._index = index
+
+    def _write(self) -> None:
+        """Write all properties to the instance attribute buffers."""
+        raise NotImplementedError
+
+    def delete(self) -> None:
+        """Remove this instance from its instancer.
+
+        The last instance of the instancer is moved into its place.
+        """
+        if self._instancer is not None:
+            self._instancer._remove(self)  # noqa: SLF001
+            self._instancer = None
+
+    @property
+    def instancer(self) -> Instancer | None:
+        """The instancer drawing this instance, or ``None`` if it has been deleted."""
+        return self._instancer
+
+
+class Instancer(Generic[_R]):
+    """Base class keeping the records of an instanced vertex list packed.
+
+    Subclasses create ``_vertex_list`` and ``_group``, and set ``_domain`` to
+    the domain of the vertex list with an instance count of 0.
+    """
+
+    _records: list[_R]
+    _domain: InstancedVertexDomain
+    _vertex_list: IndexedVertexList | None
+    _group: Group
+
+    def _add(self, record: _R) -> _R:
+        """Write a record created at index ``len(self)``, and start drawing it."""
+        self._domain.set_instance_count(record._index + 1)  # noqa: SLF001
+        record._write()  # noqa: SLF001
+        self._records.append(record)
+        return record
+
+    def _remove(self, record: _R) -> None:
+        index = record._index  # noqa: SLF001
+        last = self._records.pop()
+        if last is not record:
+            # Move the last instance into the removed one's place:
+            self._domain.move_instance(last._index, index)  # noqa: SLF001
+            last._index = index  # noqa: SLF001
+            self._records[index] = last
+        self._domain.set_instance_count(len(self._records))
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def delete(self) -> None:
+        """Delete all instances, and release the graphics resources."""
+        for record in self._records:
+            record._instancer = None  # noqa: SLF001
+        self._records.clear()
+        self._vertex_list.delete()
+        self._vertex_list = None
+
+    def draw(self) -> None:
+        """Draw all instances.
+
+        This is only needed if the instancer was created without a Batch.
+        """
+        self._group.set_state_recursive()
+        self._vertex_list.draw(GL_TRIANGLES)
+        self._group.unset_state_recursive()
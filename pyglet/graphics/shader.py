@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import hashlib
+import os
 import re
+import struct
 import warnings
 import weakref
 from collections import defaultdict
@@ -42,8 +45,6 @@ from pyglet.gl.gl import (
     GL_TRUE,
     GL_UNIFORM_BUFFER,
     glAttachShader,
-    glBindBuffer,
-    glBindBufferBase,
     glCreateProgram,
     glDeleteProgram,
     glDeleteShader,
@@ -57,7 +58,6 @@ from pyglet.gl.gl import (
     glMapBufferRange,
     glMemoryBarrier,
     glUnmapBuffer,
-    glUseProgram,
     glVertexAttribDivisor,
     glVertexAttribPointer,
 )
@@ -331,9 +331,10 @@ class _UniformArray:
     _c_array: Array[GLDataType]
     _ptr: CTypesPointer[GLDataType]
     _idx_to_loc: dict[int, int]
+    _previous: tuple | None
 
     __slots__ = ('_uniform', '_gl_type', '_gl_getter', '_gl_setter', '_is_matrix', '_dsa', '_c_array', '_ptr',
-                 '_idx_to_loc')
+                 '_idx_to_loc', '_previous')
 
     def __init__(self, uniform: _Uniform, gl_getter: GLFunc, gl_setter: GLFunc, gl_type: GLDataType, is_matrix: bool,
                  dsa: bool) -> None:
@@ -344,6 +345,8 @@ class _UniformArray:
         self._is_matrix = is_matrix
         self._idx_to_loc = {}  # Array index to uniform location mapping.
         self._dsa = dsa
+        # The values last set in full, to skip uploading them again.
+        self._previous = None
 
         if self._uniform.length > 1:
             self._c_array = (gl_type * self._uniform.length * self._uniform.size)()
@@ -401,6 +404,8 @@ class _UniformArray:
             raise ShaderException(msg)
 
     def __setitem__(self, key: slice | int, value: Sequence) -> None:
+        self._previous = None
+
         if isinstance(key, slice):
             self._c_array[key] = value
             self._update_uniform(self._ptr)
@@ -426,7 +431,16 @@ class _UniformArray:
         assert len(self._c_array) == len(
             values), f"Size of data ({len(values)}) does not match size of the uniform: {len(self._c_array)}."
 
+        if self._uniform.length > 1:
+            values = tuple(tuple(value) for value in values)
+        else:
+            values = tuple(values)
+
+        if values == self._previous:
+            return
+
         self._c_array[:] = values
+        self._previous = values
         self._update_uniform(self._ptr)
 
     def _update_uniform(self, data: Sequence, offset: int = 0) -> None:
@@ -435,7 +449,10 @@ class _UniformArray:
         else:
             size = self._uniform.size
 
-        location = self._get_location_for_index(offset)
+        try:
+            location = self._idx_to_loc[offset]
+        except KeyError:
+            location = self._idx_to_loc[offset] = self._get_location_for_index(offset)
 
         if self._dsa:
             if self._is_matrix:
@@ -443,7 +460,7 @@ class _UniformArray:
             else:
                 self._gl_setter(self._uniform.program, location, size, data)
         else:
-            glUseProgram(self._uniform.program)
+            pyglet.gl.current_context.bindings.use_program(self._uniform.program)
             if self._is_matrix:
                 self._gl_setter(location, size, GL_FALSE, data)
             else:
@@ -519,20 +536,37 @@ class _Uniform:
     @staticmethod
     def _create_setter_func(program_id: int, location: int, gl_setter: GLFunc, c_array: Array[GLDataType], length: int,
                             ptr: CTypesPointer[GLDataType], is_matrix: bool, dsa: bool) -> Callable[[float], None]:
-        """Factory function for creating simplified Uniform setters."""
+        """Factory function for creating simplified Uniform setters.
+
+        The setters remember the last value they uploaded, and skip the upload
+        if the same value is set again.
+        """
+        previous = None
+
         if dsa:  # Bindless updates:
 
             if is_matrix:
                 def setter_func(value: float) -> None:
-                    c_array[:] = value
+                    nonlocal previous
+                    value = tuple(value)
+                    if value == previous:
+                        return
+                    c_array[:] = previous = value
                     gl_setter(program_id, location, 1, GL_FALSE, ptr)
             elif length == 1:
                 def setter_func(value: float) -> None:
-                    c_array[0] = value
+                    nonlocal previous
+                    if value == previous:
+                        return
+                    c_array[0] = previous = value
                     gl_setter(program_id, location, 1, ptr)
             elif length > 1:
                 def setter_func(values: float) -> None:
-                    c_array[:] = values
+                    nonlocal previous
+                    values = tuple(values)
+                    if values == previous:
+                        return
+                    c_array[:] = previous = values
                     gl_setter(program_id, location, 1, ptr)
 
             else:
@@ -543,18 +577,29 @@ class _Uniform:
 
         if is_matrix:
             def setter_func(value: float) -> None:
-                glUseProgram(program_id)
-                c_array[:] = value
+                nonlocal previous
+                value = tuple(value)
+                if value == previous:
+                    return
+                pyglet.gl.current_context.bindings.use_program(program_id)
+                c_array[:] = previous = value
                 gl_setter(location, 1, GL_FALSE, ptr)
         elif length == 1:
             def setter_func(value: float) -> None:
-                glUseProgram(program_id)
-                c_array[0] = value
+                nonlocal previous
+                if value == previous:
+                    return
+                pyglet.gl.current_context.bindings.use_program(program_id)
+                c_array[0] = previous = value
                 gl_setter(location, 1, ptr)
         elif length > 1:
             def setter_func(values: float) -> None:
-                glUseProgram(program_id)
-                c_array[:] = values
+                nonlocal previous
+                values = tuple(values)
+                if values == previous:
+                    return
+                pyglet.gl.current_context.bindings.use_program(program_id)
+                c_array[:] = previous = values
                 gl_setter(location, 1, ptr)
         else:
             msg = "Uniform type not yet supported."
@@ -580,6 +625,8 @@ class _UBOBindingManager:
     _max_binding_count: int
     _ubo_names: dict[str, int]
     _ubo_programs: defaultdict[Any, weakref.WeakSet[ShaderProgram]]
+    _shared_ubos: dict[str, UniformBufferObject]
+    pending: set[UniformBufferObject]
 
     def __init__(self) -> None:
         self._ubo_programs = defaultdict(weakref.WeakSet)
@@ -588,6 +635,9 @@ class _UBOBindingManager:
         self._max_binding_count = get_maximum_binding_count()
         self._pool = list(range(1, self._max_binding_count))
         self._in_use = {0}
+        self._shared_ubos = {}
+        # Shared UBOs modified since they were last uploaded.
+        self.pending = set()
 
     @property
     def max_value(self) -> int:
@@ -651,6 +701,33 @@ class _UBOBindingManager:
             msg = f"Uniform binding point: {index} is not in use."
             raise ValueError(msg)
 
+    def get_shared_ubo(self, block: UniformBlock) -> UniformBufferObject:
+        """Get the UBO shared by all Uniform Blocks with the same name as ``block``.
+
+        Changes made to a shared UBO are not uploaded right away. Instead, they
+        are uploaded once by :py:meth:`commit_shared` before the next program
+        with a Uniform Block is used, so a UBO modified several times per frame
+        is only uploaded once.
+        """
+        try:
+            ubo = self._shared_ubos[block.name]
+        except KeyError:
+            ubo = self._shared_ubos[block.name] = block.create_ubo()
+            ubo._manager = self  # noqa: SLF001
+            ubo.bind()
+            return ubo
+
+        if ubo.buffer.size != block.size or ubo.binding != block.binding:
+            msg = f"Uniform Block '{block.name}' of {block.program} does not match the layout of the shared UBO."
+            raise ShaderException(msg)
+
+        return ubo
+
+    def commit_shared(self) -> None:
+        """Upload all shared UBOs modified since they were last uploaded."""
+        while self.pending:
+            self.pending.pop().upload()
+
 # Regular expression to detect array indices like [0], [1], etc.
 array_regex = re.compile(r"(\w+)\[(\d+)\]")
 
@@ -682,6 +759,16 @@ class UniformBlock:
             self.view_cls = self._introspect_uniforms()
         return UniformBufferObject(self.view_cls, self.size, self.binding)
 
+    def get_shared_ubo(self) -> UniformBufferObject:
+        """Get the UniformBufferObject shared by every uniform block with this name.
+
+        Uniforms common to many programs, such as a time value, can be kept in
+        one shared UBO. Unlike UBOs returned by :py:meth:`create_ubo`, changes
+        made to it are uploaded once, before the next ShaderProgram with a
+        uniform block is used.
+        """
+        return pyglet.gl.current_context.ubo_manager.get_shared_ubo(self)
+
     def set_binding(self, binding: int) -> None:
         """Rebind the Uniform Block to a new binding index number.
 
@@ -836,7 +923,8 @@ class UniformBufferObject:
     _view_ptr: CTypesPointer[Structure]
     binding: int
     buffer: BufferObject
-    __slots__ = 'buffer', 'view', '_view_ptr', 'binding'
+    _manager: _UBOBindingManager | None
+    __slots__ = 'buffer', 'view', '_view_ptr', 'binding', '_manager'
 
     def __init__(self, view_class: type[Structure], buffer_size: int, binding: int) -> None:
         """Initialize the Uniform Buffer Object with the specified Structure."""
@@ -844,6 +932,13 @@ class UniformBufferObject:
         self.view = view_class()
         self._view_ptr = pointer(self.view)
         self.binding = binding
+        # Set for shared UBOs, which defer their uploads to the manager.
+        self._manager = None
+
+    @property
+    def shared(self) -> bool:
+        """Whether this UBO was created by :py:meth:`UniformBlock.get_shared_ubo`."""
+        return self._manager is not None
 
     @property
     def id(self) -> int:
@@ -852,11 +947,11 @@ class UniformBufferObject:
 
     def bind(self) -> None:
         """Bind this buffer to the bind point established by the UniformBuffer parent."""
-        glBindBufferBase(GL_UNIFORM_BUFFER, self.binding, self.buffer.id)
+        pyglet.gl.current_context.bindings.bind_buffer_base(GL_UNIFORM_BUFFER, self.binding, self.buffer.id)
 
     def read(self) -> bytes:
         """Read the byte contents of the buffer."""
-        glBindBuffer(GL_ARRAY_BUFFER, self.buffer.id)
+        pyglet.gl.current_context.bindings.bind_buffer(GL_ARRAY_BUFFER, self.buffer.id)
         ptr = glMapBufferRange(GL_ARRAY_BUFFER, 0, self.buffer.size, GL_MAP_READ_BIT)
         data = string_at(ptr, size=self.buffer.size)
         glUnmapBuffer(GL_ARRAY_BUFFER)
@@ -866,10 +961,17 @@ class UniformBufferObject:
         # Return the view to the user in a `with` context:
         return self.view
 
-    def __exit__(self, _exc_type, _exc_val, _exc_tb) -> None:  # noqa: ANN001
+    def upload(self) -> None:
+        """Bind this buffer, and upload the contents of the view to it."""
         self.bind()
         self.buffer.set_data(self._view_ptr)
 
+    def __exit__(self, _exc_type, _exc_val, _exc_tb) -> None:  # noqa: ANN001
+        if self._manager is None:
+            self.upload()
+        else:
+            self._manager.pending.add(self)
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(id={self.buffer.id}, binding={self.binding})"
 
@@ -918,17 +1020,132 @@ def _introspect_attributes(program_id: int) -> dict[str, Any]:
     return attributes
 
 
+def _have_program_binary() -> bool:
+    info = pyglet.gl.current_context.get_info()
+    if not (info.have_version(4, 1) or info.have_extension('GL_ARB_get_program_binary')):
+        return False
+
+    formats = gl.GLint()
+    gl.glGetIntegerv(gl.GL_NUM_PROGRAM_BINARY_FORMATS, byref(formats))
+    return formats.value > 0
+
+
+def _get_program_cache_path(shaders: Sequence[Shader]) -> str | None:
+    """Get the file a linked program binary is cached in, if caching is enabled and supported."""
+    directory = pyglet.options['shader_cache']
+    if directory is None or not _have_program_binary():
+        return None
+
+    # Binaries are only valid for the driver that created them:
+    info = pyglet.gl.current_context.get_info()
+    key = hashlib.sha256()
+    for value in (info.get_vendor(), info.get_renderer(), info.get_version_string()):
+        key.update(value.encode('utf-8') + b'\0')
+    for shader in shaders:
+        key.update(f"{shader.type}\0{shader.source}\0".encode('utf-8'))
+
+    return os.path.join(directory, f"{key.hexdigest()}.bin")
+
+
+def _read_program_binary(path: str) -> tuple[int, bytes] | None:
+    """Read the format and data of a cached program binary, if there is one."""
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    if len(data) <= 4:
+        return None
+
+    binary_format, = struct.unpack_from('<I', data)
+    return binary_format, data[4:]
+
+
+def _load_program_binary(program_id: int, binary_format: int, data: bytes) -> bool:
+    """Restore a program from a binary, returning ``False`` if the driver rejects it."""
+    binary = create_string_buffer(data, len(data))
+    try:
+        gl.glProgramBinary(program_id, binary_format, binary, len(data))
+    except GLException:
+        # The format is not supported by this driver.
+        return False
+
+    status = c_int()
+    glGetProgramiv(program_id, GL_LINK_STATUS, byref(status))
+    if _debug_gl_shaders:
+        print(f"Cached program binary {'loaded' if status.value else 'rejected'}.")
+    return bool(status.value)
+
+
+def _save_program_binary(program_id: int, path: str) -> None:
+    length = c_int()
+    glGetProgramiv(program_id, gl.GL_PROGRAM_BINARY_LENGTH, byref(length))
+    if length.value <= 0:
+        return
+
+    binary = create_string_buffer(length.value)
+    binary_format = gl.GLenum()
+    gl.glGetProgramBinary(program_id, length.value, None, byref(binary_format), binary)
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temporary file first, so other processes never read a partial binary.
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(struct.pack('<I', binary_format.value))
+            f.write(binary.raw)
+        os.replace(temp_path, path)
+    except OSError as err:
+        warnings.warn(f"Unable to write shader cache file '{path}': {err}")
+
+
 def _link_program(*shaders: Shader) -> int:
     """Link one or more Shaders into a ShaderProgram.
 
+    If the ``shader_cache`` option is set, the linked program is restored
+    from a cached binary when possible.
+
     Returns:
         The ID assigned to the linked ShaderProgram.
     """
+    program_id, cache_path, linked = _start_link(shaders)
+    if not linked:
+        _finish_link(program_id, shaders, cache_path)
+    return program_id
+
+
+def _start_link(shaders: Sequence[Shader]) -> tuple[int, str | None, bool]:
+    """Start linking Shaders into a program, without waiting for the result.
+
+    Returns:
+        The program ID, the path to cache the program binary in, and whether
+        the program was already linked from a cached binary.
+    """
+    cache_path = _get_program_cache_path(shaders)
+
     program_id = glCreateProgram()
+    if cache_path is not None:
+        binary = _read_program_binary(cache_path)
+        if binary is not None:
+            if _load_program_binary(program_id, *binary):
+                return program_id, cache_path, True
+
+            # A rejected binary leaves the program unlinked; start over with a new one.
+            glDeleteProgram(program_id)
+            program_id = glCreateProgram()
+
+        gl.glProgramParameteri(program_id, gl.GL_PROGRAM_BINARY_RETRIEVABLE_HINT, GL_TRUE)
+
     for shader in shaders:
         glAttachShader(program_id, shader.id)
     glLinkProgram(program_id)
 
+    return program_id, cache_path, False
+
+
+def _finish_link(program_id: int, shaders: Sequence[Shader], cache_path: str | None) -> None:
+    """Wait for a program started by :py:func:`_start_link` to link, and check the result."""
     # Check the link status of program
     status = c_int()
     glGetProgramiv(program_id, GL_LINK_STATUS, byref(status))
@@ -944,7 +1161,8 @@ def _link_program(*shaders: Shader) -> int:
     for shader in shaders:
         glDetachShader(program_id, shader.id)
 
-    return program_id
+    if cache_path is not None:
+        _save_program_binary(program_id, cache_path)
 
 
 def _get_program_log(program_id: int) -> str:
@@ -1088,10 +1306,18 @@ def _introspect_uniform_blocks(program: ShaderProgram | ComputeShaderProgram) ->
 
 # Shader & program classes:
 
+# Matches `#include "name"` or `#include <name>` directives:
+_include_regex = re.compile(r'^\s*#\s*include\s+["<]([^">]+)[">]\s*$')
+
+
 class ShaderSource:
     """GLSL source container for making source parsing simpler.
 
-    We support locating out attributes and applying #defines values.
+    We support resolving ``#include`` directives and applying #defines values.
+
+    Included files are loaded through :py:mod:`pyglet.resource`, and each file
+    is only included once per source. Definitions are inserted after the
+    ``#version`` line.
 
     .. note:: We do assume the source is neat enough to be parsed this way and doesn't contain several statements in
               one line.
@@ -1099,7 +1325,7 @@ class ShaderSource:
     _type: gl.GLenum
     _lines: list[str]
 
-    def __init__(self, source: str, source_type: gl.GLenum) -> None:
+    def __init__(self, source: str, source_type: gl.GLenum, defines: dict[str, Any] | None = None) -> None:
         """Create a shader source wrapper."""
         self._lines = source.strip().splitlines()
         self._type = source_type
@@ -1109,6 +1335,11 @@ class ShaderSource:
             raise ShaderException(msg)
 
         self._version = self._find_glsl_version()
+        self._lines[1:] = self._resolve_includes(self._lines[1:], set(), [])
+
+        if defines:
+            self._lines[1:1] = [f"#define {name}" if value is None else f"#define {name} {value}"
+                                for name, value in defines.items()]
 
         if pyglet.gl.current_context.get_info().get_opengl_api() == "gles":
             self._lines[0] = "#version 310 es"
@@ -1126,6 +1357,37 @@ class ShaderSource:
         """Return the validated shader source."""
         return "\n".join(self._lines)
 
+    def _resolve_includes(self, lines: list[str], included: set[str], stack: list[str]) -> list[str]:
+        resolved = []
+        for line in lines:
+            match = _include_regex.match(line)
+            if match is None:
+                resolved.append(line)
+                continue
+
+            name = match.group(1)
+            if name in stack:
+                msg = f"Shader include '{name}' includes itself: {' -> '.join([*stack, name])}"
+                raise ShaderException(msg)
+            if name in included:
+                continue
+            included.add(name)
+
+            try:
+                with pyglet.resource.file(name, 'r') as f:
+                    include_lines = f.read().strip().splitlines()
+            except pyglet.resource.ResourceNotFoundException as err:
+                msg = f"Shader include '{name}' was not found."
+                raise ShaderException(msg) from err
+
+            if include_lines and include_lines[0].strip().startswith("#version"):
+                msg = f"Shader include '{name}' must not have a #version statement."
+                raise ShaderException(msg)
+
+            resolved.extend(self._resolve_includes(include_lines, included, [*stack, name]))
+
+        return resolved
+
     def _find_glsl_version(self) -> int:
         if self._lines[0].strip().startswith("#version"):
             try:
@@ -1152,14 +1414,16 @@ class Shader:
     """
     _context: Context | None
     _id: int | None
+    _source: str
     type: ShaderType
 
-    def __init__(self, source_string: str, shader_type: ShaderType) -> None:
+    def __init__(self, source_string: str, shader_type: ShaderType, defines: dict[str, Any] | None = None) -> None:
         """Initialize a shader type.
 
         Args:
             source_string:
                 A string containing the source of your shader program.
+                ``#include "name"`` directives are resolved through :py:mod:`pyglet.resource`.
 
             shader_type:
                 A string containing the type of shader program:
@@ -1170,7 +1434,23 @@ class Shader:
                 * ``'compute'``
                 * ``'tesscontrol'``
                 * ``'tessevaluation'``
+
+            defines:
+                Preprocessor definitions to add to the source, such as ``{'MAX_LIGHTS': 4}``.
+                A value of ``None`` defines the name without a value.
         """
+        self._compile(source_string, shader_type, defines)
+        self._check_compile_status()
+
+    @classmethod
+    def _compile_async(cls, source_string: str, shader_type: ShaderType,
+                       defines: dict[str, Any] | None = None) -> Shader:
+        """Create a shader, without waiting for its compilation to finish."""
+        shader = cls.__new__(cls)
+        shader._compile(source_string, shader_type, defines)  # noqa: SLF001
+        return shader
+
+    def _compile(self, source_string: str, shader_type: ShaderType, defines: dict[str, Any] | None) -> None:
         self._context = pyglet.gl.current_context
         self._id = None
         self.type = shader_type
@@ -1184,7 +1464,7 @@ class Shader:
             )
             raise ShaderException(msg) from err
 
-        source_string = ShaderSource(source_string, shader_type).validate()
+        source_string = self._source = ShaderSource(source_string, shader_type, defines).validate()
         shader_source_utf8 = source_string.encode("utf8")
         source_buffer_pointer = cast(c_char_p(shader_source_utf8), POINTER(c_char))
         source_length = c_int(len(shader_source_utf8))
@@ -1194,6 +1474,9 @@ class Shader:
         gl.glShaderSource(shader_id, 1, byref(source_buffer_pointer), source_length)
         gl.glCompileShader(shader_id)
 
+    def _check_compile_status(self) -> None:
+        """Wait for compilation to finish, and raise a ShaderException if it failed."""
+        shader_id = self._id
         status = c_int(0)
         gl.glGetShaderiv(shader_id, gl.GL_COMPILE_STATUS, byref(status))
 
@@ -1217,6 +1500,11 @@ class Shader:
     def id(self) -> int:
         return self._id
 
+    @property
+    def source(self) -> str:
+        """The GLSL source this shader was compiled from, after preprocessing."""
+        return self._source
+
     def _get_shader_log(self, shader_id: int) -> str:
         log_length = c_int(0)
         gl.glGetShaderiv(shader_id, GL_INFO_LOG_LENGTH, byref(log_length))
@@ -1267,14 +1555,46 @@ class ShaderProgram:
     _uniforms: dict[str, _Uniform]
     _uniform_blocks: dict[str, UniformBlock]
 
-    __slots__ = '_id', '_context', '_attributes', '_uniforms', '_uniform_blocks', '__weakref__'
+    __slots__ = '_id', '_context', '_attributes', '_uniforms', '_uniform_blocks', '_ubo_manager', '__weakref__'
 
     def __init__(self, *shaders: Shader) -> None:
         """Initialize the ShaderProgram using at least two Shader instances."""
         self._id = None
 
         assert shaders, "At least one Shader object is required."
-        self._id = _link_program(*shaders)
+        self._setup(_link_program(*shaders))
+
+    @classmethod
+    def compile_async(cls, *shaders: Shader | tuple[str, ShaderType]) -> PendingShaderProgram:
+        """Compile and link a ShaderProgram in the background.
+
+        Where the ``GL_KHR_parallel_shader_compile`` extension is available,
+        the driver compiles and links on its own threads. The returned
+        :py:class:`PendingShaderProgram` can be polled until it is ready,
+        while the application keeps drawing::
+
+            pending = [ShaderProgram.compile_async((vertex_source, 'vertex'), (fragment_source, 'fragment'))
+                       for vertex_source, fragment_source in sources]
+
+            def update(dt):
+                if all(program.ready for program in pending):
+                    start_game([program.get() for program in pending])
+
+        Without the extension, compilation still works, but blocks when the
+        program is polled or retrieved.
+
+        Args:
+            shaders:
+                :py:class:`Shader` instances, or ``(source, shader_type)`` tuples
+                for Shaders which should also be compiled in the background.
+        """
+        assert shaders, "At least one Shader object is required."
+        return PendingShaderProgram([shader if isinstance(shader, Shader) else Shader._compile_async(*shader)  # noqa: SLF001
+                                     for shader in shaders])
+
+    def _setup(self, program_id: int) -> None:
+        """Introspect a linked program."""
+        self._id = program_id
         self._context = pyglet.gl.current_context
 
         if _debug_gl_shaders:
@@ -1285,6 +1605,8 @@ class ShaderProgram:
         self._attributes = _introspect_attributes(self._id)
         self._uniforms = _introspect_uniforms(self._id, have_dsa)
         self._uniform_blocks = _introspect_uniform_blocks(self)
+        # Only programs reading uniform blocks need shared UBOs to be up to date.
+        self._ubo_manager = self._context.ubo_manager if self._uniform_blocks else None
 
     @property
     def id(self) -> int:
@@ -1330,21 +1652,24 @@ class ShaderProgram:
         return self._uniform_blocks
 
     def use(self) -> None:
-        glUseProgram(self._id)
+        if self._ubo_manager is not None and self._ubo_manager.pending:
+            self._ubo_manager.commit_shared()
+        pyglet.gl.current_context.bindings.use_program(self._id)
 
     @staticmethod
     def stop() -> None:
-        glUseProgram(0)
+        pyglet.gl.current_context.bindings.use_program(0)
 
     __enter__ = use
     bind = use
     unbind = stop
 
     def __exit__(self, *_) -> None:  # noqa: ANN002
-        glUseProgram(0)
+        pyglet.gl.current_context.bindings.use_program(0)
 
     def delete(self) -> None:
         glDeleteProgram(self._id)
+        pyglet.gl.current_context.bindings.invalidate()
         self._id = None
 
     def __del__(self) -> None:
@@ -1500,6 +1825,103 @@ class ShaderProgram:
         return f"{self.__class__.__name__}(id={self.id})"
 
 
+def _have_parallel_compile() -> bool:
+    info = pyglet.gl.current_context.get_info()
+    return info.have_extension('GL_KHR_parallel_shader_compile') or \
+        info.have_extension('GL_ARB_parallel_shader_compile')
+
+
+class PendingShaderProgram:
+    """A ShaderProgram which is being compiled and linked in the background.
+
+    This is returned by :py:meth:`ShaderProgram.compile_async`. Poll
+    :py:attr:`ready` until it is ``True``, then call :py:meth:`get` to
+    retrieve the program without blocking.
+    """
+    _shaders: Sequence[Shader]
+    _program_id: int | None
+    _cache_path: str | None
+    _linked: bool
+    _program: ShaderProgram | None
+    _error: ShaderException | None
+
+    def __init__(self, shaders: Sequence[Shader]) -> None:
+        """Wrap Shaders whose compilation has started."""
+        self._shaders = shaders
+        self._parallel = _have_parallel_compile()
+        self._program_id = None
+        self._cache_path = None
+        self._linked = False
+        self._program = None
+        self._error = None
+
+    def _is_complete(self, get_iv: GLFunc, object_id: int) -> bool:
+        if not self._parallel:
+            # The status query would block until completion anyway.
+            return True
+        status = c_int(0)
+        get_iv(object_id, gl.GL_COMPLETION_STATUS_KHR, byref(status))
+        return bool(status.value)
+
+    def _start_link(self) -> None:
+        try:
+            for shader in self._shaders:
+                shader._check_compile_status()  # noqa: SLF001
+        except ShaderException as err:
+            self._error = err
+            return
+
+        self._program_id, self._cache_path, self._linked = _start_link(self._shaders)
+
+    @property
+    def ready(self) -> bool:
+        """``True`` once :py:meth:`get` will not block.
+
+        Polling this also starts linking once all shaders are compiled.
+        """
+        if self._program is not None or self._error is not None:
+            return True
+
+        if self._program_id is None:
+            if not all(self._is_complete(gl.glGetShaderiv, shader.id) for shader in self._shaders):
+                return False
+            self._start_link()
+            if self._error is not None:
+                return True
+
+        return self._linked or self._is_complete(glGetProgramiv, self._program_id)
+
+    def get(self) -> ShaderProgram:
+        """Get the ShaderProgram, waiting for compilation and linking to finish if needed.
+
+        Raises:
+            ShaderException: If a shader failed to compile, or the program failed to link.
+        """
+        if self._program is None:
+            if self._program_id is None and self._error is None:
+                self._start_link()
+            if self._error is not None:
+                raise self._error
+
+            if not self._linked:
+                try:
+                    _finish_link(self._program_id, self._shaders, self._cache_path)
+                except ShaderException as err:
+                    glDeleteProgram(self._program_id)
+                    self._error = err
+                    raise
+
+            program = ShaderProgram.__new__(ShaderProgram)
+            program._setup(self._program_id)  # noqa: SLF001
+            self._program = program
+            self._shaders = ()
+
+        return self._program
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(ready={self.ready})"
+
+
 class ComputeShaderProgram:
     """OpenGL Compute Shader Program."""
     _context: Context | None
@@ -1532,6 +1954,7 @@ class ComputeShaderProgram:
 
         self._uniforms = _introspect_uniforms(self._id, True)
         self._uniform_blocks = _introspect_uniform_blocks(self)
+        self._ubo_manager = self._context.ubo_manager if self._uniform_blocks else None
 
         self.max_work_group_size = self._get_tuple(gl.GL_MAX_COMPUTE_WORK_GROUP_SIZE)  # x, y, z
         self.max_work_group_count = self._get_tuple(gl.GL_MAX_COMPUTE_WORK_GROUP_COUNT)  # x, y, z
@@ -1578,21 +2001,24 @@ class ComputeShaderProgram:
         return self._uniform_blocks
 
     def use(self) -> None:
-        glUseProgram(self._id)
+        if self._ubo_manager is not None and self._ubo_manager.pending:
+            self._ubo_manager.commit_shared()
+        pyglet.gl.current_context.bindings.use_program(self._id)
 
     @staticmethod
     def stop() -> None:
-        glUseProgram(0)
+        pyglet.gl.current_context.bindings.use_program(0)
 
     __enter__ = use
     bind = use
     unbind = stop
 
     def __exit__(self, *_) -> None:  # noqa: ANN002
-        glUseProgram(0)
+        pyglet.gl.current_context.bindings.use_program(0)
 
     def delete(self) -> None:
         glDeleteProgram(self._id)
+        pyglet.gl.current_context.bindings.invalidate()
         self._id = None
 
     def __del__(self) -> None:
@@ -0,0 +1,191 @@
+"""Instrumentation of :py:class:`~pyglet.graphics.Batch` drawing.
+
+Statistics are collected only for batches which have them enabled with
+:py:meth:`~pyglet.graphics.Batch.enable_stats`. The draw list of such a
+batch is rebuilt with counting wrappers, so batches without statistics are
+not slowed down at all::
+
+    batch.enable_stats(gpu_timers=True)
+
+    @window.event
+    def on_draw():
+        window.clear()
+        batch.draw()
+        print(batch.stats)
+"""
+from __future__ import annotations
+
+import functools
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable
+
+from pyglet.gl.gl import (
+    GL_LINE_LOOP,
+    GL_LINE_STRIP,
+    GL_LINES,
+    GL_POINTS,
+    GL_QUERY_RESULT,
+    GL_TIME_ELAPSED,
+    GL_TRIANGLE_FAN,
+    GL_TRIANGLE_STRIP,
+    GL_TRIANGLES,
+    GLuint,
+    GLuint64,
+    glBeginQuery,
+    glDeleteQueries,
+    glEndQuery,
+    glGenQueries,
+    glGetQueryObjectui64v,
+)
+from pyglet.graphics.vertexdomain import IndexedVertexDomain, InstancedVertexDomain
+
+if TYPE_CHECKING:
+    from pyglet.graphics import Group
+    from pyglet.graphics.vertexbuffer import BackedBufferObject
+    from pyglet.graphics.vertexdomain import VertexDomain
+
+__all__ = ['BatchProfiler', 'DrawStats']
+
+
+@dataclass
+class DrawStats:
+    """A snapshot of the work done by a single draw of a Batch."""
+
+    #: Number of groups in the draw list, including those whose state changes were removed.
+    groups: int = 0
+    #: Number of ``set_state`` and ``unset_state`` calls made.
+    state_changes: int = 0
+    #: Number of vertex domains drawn.
+    domains: int = 0
+    #: Number of ``glDrawArrays`` or ``glDrawElements`` calls, including instanced variants.
+    draw_calls: int = 0
+    #: Number of ``glMultiDrawArrays`` or ``glMultiDrawElements`` calls, including indirect variants.
+    multi_draw_calls: int = 0
+    #: Number of primitives (points, lines or triangles) submitted.
+    primitives: int = 0
+    #: Number of bytes uploaded from the vertex domains' buffers.
+    bytes_committed: int = 0
+    #: GPU time in seconds spent on each top-level group, if GPU timers are enabled.
+    #: The results are read back two frames after they were measured, to avoid stalling.
+    gpu_times: dict[Group, float] = field(default_factory=dict)
+
+
+def _count_primitives(mode: int, sizes: list[int]) -> int:
+    if mode == GL_TRIANGLES:
+        return sum(sizes) // 3
+    if mode in (GL_TRIANGLE_STRIP, GL_TRIANGLE_FAN):
+        return sum(max(size - 2, 0) for size in sizes)
+    if mode == GL_LINES:
+        return sum(sizes) // 2
+    if mode == GL_LINE_STRIP:
+        return sum(max(size - 1, 0) for size in sizes)
+    if mode in (GL_POINTS, GL_LINE_LOOP):
+        return sum(sizes)
+    return 0
+
+
+class BatchProfiler:
+    """Collects :py:class:`DrawStats` for each draw of a Batch.
+
+    This is created by :py:meth:`~pyglet.graphics.Batch.enable_stats`, and
+    usually does not need to be used directly.
+    """
+    stats: DrawStats | None
+    gpu_timers: bool
+    group_count: int
+
+    def __init__(self, gpu_timers: bool = False) -> None:
+        """Create a profiler.
+
+        Args:
+            gpu_timers:
+                If ``True``, ``GL_TIME_ELAPSED`` queries are issued around each top-level group.
+        """
+        self.stats = None
+        self.gpu_timers = gpu_timers
+        self.group_count = 0
+        self._current = DrawStats()
+        self._frame = 0
+        self._gpu_times = {}
+        # Two queries per group, used on alternate frames. A query is read before it is reused.
+        self._queries = {}
+        self._issued = set()
+
+    def begin_frame(self) -> None:
+        self._current = DrawStats(groups=self.group_count)
+
+    def end_frame(self) -> None:
+        self._current.gpu_times = dict(self._gpu_times)
+        self.stats = self._current
+        self._frame += 1
+
+    def wrap_state(self, func: Callable[[], None]) -> Callable[[], None]:
+        """Wrap a group's ``set_state`` or ``unset_state`` method to count it."""
+        def _state() -> None:
+            self._current.state_changes += 1
+            func()
+
+        return _state
+
+    def wrap_draw(self, domain: VertexDomain, mode: int) -> Callable[[], None]:
+        """Create a function drawing a domain, recording the work it does."""
+        buffers = [buffer for buffer, _ in domain.buffer_attributes]
+        if isinstance(domain, IndexedVertexDomain):
+            buffers.append(domain.index_buffer)
+
+        return functools.partial(self._draw, domain, mode, buffers)
+
+    def _draw(self, domain: VertexDomain, mode: int, buffers: list[BackedBufferObject]) -> None:
+        committed = sum(buffer.committed_bytes for buffer in buffers)
+        domain.draw(mode)
+
+        stats = self._current
+        stats.domains += 1
+        stats.bytes_committed += sum(buffer.committed_bytes for buffer in buffers) - committed
+
+        if isinstance(domain, InstancedVertexDomain):
+            # Instanced domains draw their first region:
+            if isinstance(domain, IndexedVertexDomain):
+                sizes = domain.index_allocator.sizes
+            else:
+                sizes = domain.allocator.sizes
+            if sizes:
+                stats.draw_calls += 1
+                stats.primitives += _count_primitives(mode, sizes[:1]) * domain._instances  # noqa: SLF001
+            return
+
+        # Count the regions the domain submitted, which are only those in view when culling:
+        primcount, _, sizes = domain._draw_args  # noqa: SLF001
+        if primcount == 0:
+            return
+        if primcount == 1:
+            stats.draw_calls += 1
+        else:
+            stats.multi_draw_calls += 1
+        stats.primitives += _count_primitives(mode, sizes[:primcount])
+
+    def begin_timer(self, group: Group) -> None:
+        try:
+            queries = self._queries[group]
+        except KeyError:
+            queries = self._queries[group] = (GLuint * 2)()
+            glGenQueries(2, queries)
+
+        query = queries[self._frame % 2]
+        if query in self._issued:
+            result = GLuint64()
+            glGetQueryObjectui64v(query, GL_QUERY_RESULT, result)
+            self._gpu_times[group] = result.value / 1e9
+        self._issued.add(query)
+        glBeginQuery(GL_TIME_ELAPSED, query)
+
+    @staticmethod
+    def end_timer(_group: Group) -> None:
+        glEndQuery(GL_TIME_ELAPSED)
+
+    def delete(self) -> None:
+        """Delete the GPU timer queries."""
+        for queries in self._queries.values():
+            glDeleteQueries(2, queries)
+        self._queries.clear()
+        self._issued.clear()
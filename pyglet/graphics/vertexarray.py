@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import pyglet
-from pyglet.gl import GLuint, glBindVertexArray, glDeleteVertexArrays, glGenVertexArrays
+from pyglet.gl import GLuint, glDeleteVertexArrays, glGenVertexArrays
 
 if TYPE_CHECKING:
     from ctypes import c_uint
@@ -29,20 +29,21 @@ class VertexArray:
         return self._id.value
 
     def bind(self) -> None:
-        glBindVertexArray(self._id)
+        pyglet.gl.current_context.bindings.bind_vertex_array(self._id.value)
 
     @staticmethod
     def unbind() -> None:
-        glBindVertexArray(0)
+        pyglet.gl.current_context.bindings.bind_vertex_array(0)
 
     def delete(self) -> None:
         glDeleteVertexArrays(1, self._id)
+        pyglet.gl.current_context.bindings.invalidate()
         self._id = None
 
     __enter__ = bind
 
     def __exit__(self, *_) -> None:  # noqa: ANN002
-        glBindVertexArray(0)
+        pyglet.gl.current_context.bindings.bind_vertex_array(0)
 
     def __del__(self) -> None:
         if self._id is not None:
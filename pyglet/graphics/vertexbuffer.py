@@ -5,6 +5,9 @@ The first is a lightweight abstraction over an OpenGL buffer, as created
 with ``glGenBuffers``. The backed buffer object is similar, but provides a
 full mirror of the data in CPU memory. This allows for delayed uploading of
 changes to GPU memory, which can improve performance is some cases.
+
+For attributes that change every frame, :py:class:`~RingAttributeBufferObject`
+streams the CPU mirror into a persistently mapped ring of buffer sections.
 """
 from __future__ import annotations
 
@@ -12,7 +15,7 @@ import abc
 import ctypes
 import sys
 from functools import lru_cache
-from typing import TYPE_CHECKING, Sequence, Type
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Sequence, Type
 
 from _ctypes import Array, _Pointer, _SimpleCData
 
@@ -25,14 +28,19 @@ from pyglet.gl.gl import (
     GL_MAP_WRITE_BIT,
     GL_MAP_COHERENT_BIT,
     GL_MAP_PERSISTENT_BIT,
+    GL_SYNC_FLUSH_COMMANDS_BIT,
+    GL_SYNC_GPU_COMMANDS_COMPLETE,
+    GL_TIMEOUT_EXPIRED,
     GL_WRITE_ONLY,
     GLubyte,
     GLuint,
-    glBindBuffer,
     glBufferData,
     glBufferStorage,
     glBufferSubData,
+    glClientWaitSync,
     glDeleteBuffers,
+    glDeleteSync,
+    glFenceSync,
     glGenBuffers,
     glMapBuffer,
     glMapBufferRange,
@@ -46,6 +54,31 @@ if TYPE_CHECKING:
 CTypesDataType = Type[_SimpleCData]
 CTypesPointer = _Pointer
 
+# Kinds of buffer protocol formats, used to check if data can be copied directly:
+_format_kinds = {**dict.fromkeys('bhilqn', 'i'), **dict.fromkeys('BHILQN', 'u'), **dict.fromkeys('efd', 'f')}
+_native_byte_orders = ('@', '=', '<' if sys.byteorder == 'little' else '>')
+
+
+def _format_kind(view: memoryview) -> str | None:
+    fmt = view.format
+    if len(fmt) == 2 and fmt[0] in _native_byte_orders:
+        fmt = fmt[1]
+    elif len(fmt) != 1:
+        return None
+    return _format_kinds.get(fmt)
+
+
+def _page_runs(pages: Iterable[int]) -> Iterator[tuple[int, int]]:
+    """Yield the first and last page of each run of consecutive pages."""
+    pages = sorted(pages)
+    first = last = pages[0]
+    for page in pages[1:]:
+        if page != last + 1:
+            yield first, last
+            first = page
+        last = page
+    yield first, last
+
 
 class AbstractBuffer:
     """Abstract buffer of byte data.
@@ -150,7 +183,7 @@ class BufferObject(AbstractBuffer):
         glGenBuffers(1, buffer_id)
         self.id = buffer_id.value
 
-        glBindBuffer(GL_ARRAY_BUFFER, self.id)
+        pyglet.gl.current_context.bindings.bind_buffer(GL_ARRAY_BUFFER, self.id)
         data = (GLubyte * self.size)()
         glBufferData(GL_ARRAY_BUFFER, self.size, data, self.usage)
 
@@ -158,30 +191,30 @@ class BufferObject(AbstractBuffer):
         glBufferData(GL_ARRAY_BUFFER, self.size, None, self.usage)
 
     def bind(self, target: int = GL_ARRAY_BUFFER) -> None:
-        glBindBuffer(target, self.id)
+        pyglet.gl.current_context.bindings.bind_buffer(target, self.id)
 
     def unbind(self) -> None:
-        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        pyglet.gl.current_context.bindings.bind_buffer(GL_ARRAY_BUFFER, 0)
 
     def bind_to_index_buffer(self) -> None:
         """Binds this buffer as an index buffer on the active vertex array."""
-        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.id)
+        pyglet.gl.current_context.bindings.bind_buffer(GL_ELEMENT_ARRAY_BUFFER, self.id)
 
     def set_data(self, data: Sequence[int] | CTypesPointer) -> None:
-        glBindBuffer(GL_ARRAY_BUFFER, self.id)
+        pyglet.gl.current_context.bindings.bind_buffer(GL_ARRAY_BUFFER, self.id)
         glBufferData(GL_ARRAY_BUFFER, self.size, data, self.usage)
 
     def set_data_region(self, data: Sequence[int] | CTypesPointer, start: int, length: int) -> None:
-        glBindBuffer(GL_ARRAY_BUFFER, self.id)
+        pyglet.gl.current_context.bindings.bind_buffer(GL_ARRAY_BUFFER, self.id)
         glBufferSubData(GL_ARRAY_BUFFER, start, length, data)
 
     def map(self) -> CTypesPointer[ctypes.c_byte]:
-        glBindBuffer(GL_ARRAY_BUFFER, self.id)
+        pyglet.gl.current_context.bindings.bind_buffer(GL_ARRAY_BUFFER, self.id)
         return ctypes.cast(glMapBuffer(GL_ARRAY_BUFFER, GL_WRITE_ONLY),
                            ctypes.POINTER(ctypes.c_byte * self.size)).contents
 
     def map_range(self, start: int, size: int, ptr_type: type[CTypesPointer]) -> CTypesPointer:
-        glBindBuffer(GL_ARRAY_BUFFER, self.id)
+        pyglet.gl.current_context.bindings.bind_buffer(GL_ARRAY_BUFFER, self.id)
         return ctypes.cast(glMapBufferRange(GL_ARRAY_BUFFER, start, size, GL_MAP_WRITE_BIT), ptr_type).contents
 
     def unmap(self) -> None:
@@ -189,6 +222,7 @@ class BufferObject(AbstractBuffer):
 
     def delete(self) -> None:
         glDeleteBuffers(1, GLuint(self.id))
+        pyglet.gl.current_context.bindings.invalidate()
         self.id = None
 
     def __del__(self) -> None:
@@ -203,7 +237,7 @@ class BufferObject(AbstractBuffer):
         # Map, create a copy, then reinitialize.
         temp = (ctypes.c_byte * size)()
 
-        glBindBuffer(GL_ARRAY_BUFFER, self.id)
+        pyglet.gl.current_context.bindings.bind_buffer(GL_ARRAY_BUFFER, self.id)
         data = glMapBufferRange(GL_ARRAY_BUFFER, 0, self.size, GL_MAP_READ_BIT)
         ctypes.memmove(temp, data, min(size, self.size))
         glUnmapBuffer(GL_ARRAY_BUFFER)
@@ -222,16 +256,29 @@ class BackedBufferObject(BufferObject):
     in system memory until ``commit`` is called.  The advantage is that fewer
     OpenGL calls are needed, which can increase performance at the expense of
     system memory.
+
+    Changes are tracked in pages of :py:attr:`dirty_page_size` bytes. On
+    ``commit``, each run of changed pages is uploaded separately, so sparse
+    changes in a large buffer do not require uploading everything in between.
+    Once more than :py:attr:`full_upload_ratio` of the buffer has changed, the
+    whole buffer is uploaded in a single call instead.
     """
     data: CTypesDataType
     data_ptr: int
-    _dirty_min: int
-    _dirty_max: int
+    _dirty_pages: set[int]
+    _dirty_all: bool
     _dirty: bool
     stride: int
     count: int
     ctype: CTypesDataType
 
+    #: The granularity, in bytes, at which changes are tracked.
+    dirty_page_size: int = 4096
+    #: The fraction of changed pages above which the entire buffer is uploaded.
+    full_upload_ratio: float = 0.5
+    #: The total number of bytes uploaded by ``commit`` over the buffer's lifetime.
+    committed_bytes: int = 0
+
     def __init__(self, size: int, c_type: CTypesDataType, stride: int, count: int,  # noqa: D107
                  usage: int = GL_DYNAMIC_DRAW) -> None:
         super().__init__(size, usage)
@@ -241,9 +288,10 @@ class BackedBufferObject(BufferObject):
         number = size // self._ctypes_size
         self.data = (c_type * number)()
         self.data_ptr = ctypes.addressof(self.data)
+        self._format_kind = _format_kind(memoryview(self.data))
 
-        self._dirty_min = sys.maxsize
-        self._dirty_max = 0
+        self._dirty_pages = set()
+        self._dirty_all = False
         self._dirty = False
 
         self.stride = stride
@@ -257,17 +305,26 @@ class BackedBufferObject(BufferObject):
         if not self._dirty:
             return
 
-        glBindBuffer(GL_ARRAY_BUFFER, self.id)
-        size = self._dirty_max - self._dirty_min
-        if size > 0:
-            if size == self.size:
-                glBufferData(GL_ARRAY_BUFFER, self.size, self.data, self.usage)
-            else:
-                glBufferSubData(GL_ARRAY_BUFFER, self._dirty_min, size, self.data_ptr + self._dirty_min)
+        pyglet.gl.current_context.bindings.bind_buffer(GL_ARRAY_BUFFER, self.id)
+        page_size = self.dirty_page_size
+        dirty_pages = self._dirty_pages
+        if self._dirty_all or len(dirty_pages) * page_size > self.size * self.full_upload_ratio:
+            glBufferData(GL_ARRAY_BUFFER, self.size, self.data, self.usage)
+            self.committed_bytes += self.size
+        elif dirty_pages:
+            # Upload each run of consecutive pages:
+            for first, last in _page_runs(dirty_pages):
+                self._upload_pages(first, last)
+
+        dirty_pages.clear()
+        self._dirty_all = False
+        self._dirty = False
 
-            self._dirty_min = sys.maxsize
-            self._dirty_max = 0
-            self._dirty = False
+    def _upload_pages(self, first: int, last: int) -> None:
+        byte_start = first * self.dirty_page_size
+        byte_end = min((last + 1) * self.dirty_page_size, self.size)
+        glBufferSubData(GL_ARRAY_BUFFER, byte_start, byte_end - byte_start, self.data_ptr + byte_start)
+        self.committed_bytes += byte_end - byte_start
 
     @lru_cache(maxsize=None)  # noqa: B019
     def get_region(self, start: int, count: int) -> Array[CTypesDataType]:
@@ -280,18 +337,44 @@ class BackedBufferObject(BufferObject):
         array_start = self.count * start
         array_end = self.count * count + array_start
 
-        self.data[array_start:array_end] = data
+        if data.__class__ is tuple or data.__class__ is list or not self._copy_buffer(array_start, array_end, data):
+            self.data[array_start:array_end] = data
 
         # replicated from self.invalidate_region
         byte_start = self.stride * start
-        byte_end = byte_start + self.stride * count
-        # As of Python 3.11, this is faster than min/max:
-        if byte_start < self._dirty_min:
-            self._dirty_min = byte_start
-        if byte_end > self._dirty_max:
-            self._dirty_max = byte_end
+        first = byte_start // self.dirty_page_size
+        last = (byte_start + self.stride * count - 1) // self.dirty_page_size
+        if first == last:
+            self._dirty_pages.add(first)
+        else:
+            self._dirty_pages.update(range(first, last + 1))
         self._dirty = True
 
+    def _copy_buffer(self, array_start: int, array_end: int, data: Any) -> bool:
+        """Copy an object supporting the buffer protocol into the data with a single memmove.
+
+        Objects such as NumPy arrays, ``array.array`` or ``memoryview`` are
+        copied directly, if they are contiguous and their items have the same
+        type and size as this buffer's. Returns ``False`` if that is not the
+        case, and ``data`` must be copied item by item instead.
+        """
+        try:
+            view = memoryview(data)
+        except TypeError:
+            return False
+
+        if (not view.c_contiguous or view.itemsize != self._ctypes_size or
+                _format_kind(view) != self._format_kind):
+            return False
+
+        size = self._ctypes_size
+        if view.nbytes != (array_end - array_start) * size:
+            msg = "Can only assign sequence of same size"
+            raise ValueError(msg)
+
+        memoryview(self.data).cast('B')[array_start * size:array_end * size] = view.cast('B')
+        return True
+
     def resize(self, size: int) -> None:
         # size is the allocator size * attribute.stride
         number = size // ctypes.sizeof(self.c_type)
@@ -301,25 +384,26 @@ class BackedBufferObject(BufferObject):
         self.data_ptr = ctypes.addressof(data)
         self.size = size
 
-        # Set the dirty range to be the entire buffer.
-        self._dirty_min = 0
-        self._dirty_max = self.size
+        # The entire buffer must be uploaded, as its size has changed.
+        self._dirty_pages.clear()
+        self._dirty_all = True
         self._dirty = True
 
         self.get_region.cache_clear()
 
     def invalidate(self) -> None:
         super().invalidate()
+        self._dirty_all = True
         self._dirty = True
 
     def invalidate_region(self, start: int, count: int) -> None:
         byte_start = self.stride * start
-        byte_end = byte_start + self.stride * count
-        # As of Python 3.11, this is faster than min/max:
-        if byte_start < self._dirty_min:
-            self._dirty_min = byte_start
-        if byte_end > self._dirty_max:
-            self._dirty_max = byte_end
+        first = byte_start // self.dirty_page_size
+        last = (byte_start + self.stride * count - 1) // self.dirty_page_size
+        if first == last:
+            self._dirty_pages.add(first)
+        else:
+            self._dirty_pages.update(range(first, last + 1))
         self._dirty = True
 
 
@@ -331,6 +415,134 @@ class AttributeBufferObject(BackedBufferObject):
         super().__init__(size, attribute.c_type, attribute.stride, attribute.count)
 
 
+class RingAttributeBufferObject(AttributeBufferObject):
+    """A backed attribute buffer streamed through a persistently mapped ring.
+
+    Requires OpenGL 4.4, or the ``GL_ARB_buffer_storage`` extension.
+
+    The GPU buffer is divided into :py:attr:`sections` copies of the data. On
+    each ``commit`` with pending changes, the next section is waited on with a
+    fence (so it is never written while the GPU may still read from it), the
+    pages changed since that section was last written are copied straight
+    into the mapped section, and the attribute is pointed at it. No ``glBufferSubData`` calls are made, and
+    the driver does not need to synchronize. This is best suited to attributes
+    which change every frame, such as the positions of moving sprites.
+
+    ``commit`` must be called while the owning vertex array is bound, as the
+    attribute pointer is updated to the new section.
+    """
+    attribute: Attribute
+    sections: int = 3
+    _section: int
+    _fences: list
+    #: The pages changed since each section was last written, or ``None`` if it must be written entirely.
+    _section_pages: list[set[int] | None]
+
+    def __init__(self, size: int, attribute: Attribute) -> None:  # noqa: D107
+        super().__init__(size, attribute)
+        self.attribute = attribute
+        self._section = 0
+        self._fences = [None] * self.sections
+        self._create_storage()
+
+    def _create_storage(self) -> None:
+        # The mutable store created by BufferObject is replaced by an immutable one.
+        flags = GL_MAP_WRITE_BIT | GL_MAP_PERSISTENT_BIT | GL_MAP_COHERENT_BIT
+        pyglet.gl.current_context.bindings.bind_buffer(GL_ARRAY_BUFFER, self.id)
+        glBufferStorage(GL_ARRAY_BUFFER, self.size * self.sections, None, flags)
+        self._mapped_ptr = glMapBufferRange(GL_ARRAY_BUFFER, 0, self.size * self.sections, flags)
+        self._section_pages = [None] * self.sections
+        self._dirty_all = True
+        self._dirty = True
+
+    def _delete_fences(self) -> None:
+        for i, fence in enumerate(self._fences):
+            if fence:
+                glDeleteSync(fence)
+                self._fences[i] = None
+
+    def commit(self) -> None:
+        """Write all saved changes to the next section of the ring, and draw from it."""
+        if not self._dirty:
+            return
+
+        # Fence the section drawn from until now, and wait until the next one is no longer in use:
+        self._fences[self._section] = glFenceSync(GL_SYNC_GPU_COMMANDS_COMPLETE, 0)
+        self._section = (self._section + 1) % self.sections
+        fence = self._fences[self._section]
+        if fence:
+            while glClientWaitSync(fence, GL_SYNC_FLUSH_COMMANDS_BIT, 1000000) == GL_TIMEOUT_EXPIRED:
+                pass
+            glDeleteSync(fence)
+            self._fences[self._section] = None
+
+        # Each section holds the data of its last commit, so it is missing the changes of
+        # every commit since then:
+        for i, pages in enumerate(self._section_pages):
+            if self._dirty_all:
+                self._section_pages[i] = None
+            elif pages is not None:
+                pages.update(self._dirty_pages)
+
+        self.ptr = self._section * self.size
+        pages = self._section_pages[self._section]
+        if pages is None or len(pages) * self.dirty_page_size > self.size * self.full_upload_ratio:
+            ctypes.memmove(self._mapped_ptr + self.ptr, self.data_ptr, self.size)
+            self.committed_bytes += self.size
+        elif pages:
+            for first, last in _page_runs(pages):
+                self._write_pages(first, last)
+        self._section_pages[self._section] = set()
+
+        pyglet.gl.current_context.bindings.bind_buffer(GL_ARRAY_BUFFER, self.id)
+        self.attribute.set_pointer(self.ptr)
+
+        self._dirty_pages.clear()
+        self._dirty_all = False
+        self._dirty = False
+
+    def _write_pages(self, first: int, last: int) -> None:
+        byte_start = first * self.dirty_page_size
+        byte_end = min((last + 1) * self.dirty_page_size, self.size)
+        ctypes.memmove(self._mapped_ptr + self.ptr + byte_start, self.data_ptr + byte_start, byte_end - byte_start)
+        self.committed_bytes += byte_end - byte_start
+
+    def resize(self, size: int) -> None:
+        super().resize(size)
+
+        # Immutable storage cannot be resized, so a new buffer is created.
+        self._delete_fences()
+        glDeleteBuffers(1, GLuint(self.id))
+        pyglet.gl.current_context.bindings.invalidate()
+        buffer_id = GLuint()
+        glGenBuffers(1, buffer_id)
+        self.id = buffer_id.value
+        self._create_storage()
+
+    def invalidate(self) -> None:
+        self._dirty_all = True
+        self._dirty = True
+
+    def set_data(self, data: Sequence[int] | CTypesPointer) -> None:
+        raise NotImplementedError("Use set_region to modify a RingAttributeBufferObject.")
+
+    def set_data_region(self, data: Sequence[int] | CTypesPointer, start: int, length: int) -> None:
+        raise NotImplementedError("Use set_region to modify a RingAttributeBufferObject.")
+
+    def map(self) -> CTypesPointer[ctypes.c_byte]:
+        raise NotImplementedError("RingAttributeBufferObjects are always mapped.")
+
+    def map_range(self, start: int, size: int, ptr_type: type[CTypesPointer]) -> CTypesPointer:
+        raise NotImplementedError("RingAttributeBufferObjects are always mapped.")
+
+    def unmap(self) -> None:
+        raise NotImplementedError("RingAttributeBufferObjects cannot be unmapped.")
+
+    def delete(self) -> None:
+        self._delete_fences()
+        super().delete()
+
+
 class IndexedBufferObject(BackedBufferObject):
     """A backed buffer used for indices."""
 
@@ -365,7 +577,7 @@ class PersistentBufferObject(AbstractBuffer):
         buffer_id = GLuint()
         glGenBuffers(1, buffer_id)
         self.id = buffer_id.value
-        glBindBuffer(GL_ARRAY_BUFFER, self.id)
+        pyglet.gl.current_context.bindings.bind_buffer(GL_ARRAY_BUFFER, self.id)
 
         self.flags = GL_MAP_WRITE_BIT | GL_MAP_PERSISTENT_BIT | GL_MAP_COHERENT_BIT
         data = (GLubyte * size)()
@@ -383,10 +595,10 @@ class PersistentBufferObject(AbstractBuffer):
         raise NotImplementedError("Not yet implemented")
 
     def bind(self, target=GL_ARRAY_BUFFER):
-        glBindBuffer(target, self.id)
+        pyglet.gl.current_context.bindings.bind_buffer(target, self.id)
 
     def unbind(self):
-        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        pyglet.gl.current_context.bindings.bind_buffer(GL_ARRAY_BUFFER, 0)
 
     def map(self) -> CTypesPointer[ctypes.c_ubyte]:
         raise NotImplementedError("PersistentBufferObjects are always mapped.")
@@ -399,6 +611,7 @@ class PersistentBufferObject(AbstractBuffer):
 
     def delete(self) -> None:
         glDeleteBuffers(1, GLuint(self.id))
+        pyglet.gl.current_context.bindings.invalidate()
         self.id = None
 
     @lru_cache(maxsize=None)
@@ -419,6 +632,7 @@ class PersistentBufferObject(AbstractBuffer):
         temp = (GLubyte * size)()
         ctypes.memmove(temp, self.data, min(size, self.size))
         glDeleteBuffers(1, GLuint(self.id))
+        pyglet.gl.current_context.bindings.invalidate()
 
         # Generate new buffer
         buffer_id = GLuint()
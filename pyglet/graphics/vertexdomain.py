@@ -30,6 +30,7 @@ from _ctypes import Array, _Pointer, _SimpleCData
 from pyglet.gl.gl import (
     GL_BYTE,
     GL_DOUBLE,
+    GL_DRAW_INDIRECT_BUFFER,
     GL_FLOAT,
     GL_INT,
     GL_SHORT,
@@ -39,26 +40,44 @@ from pyglet.gl.gl import (
     GLint,
     GLintptr,
     GLsizei,
+    GLuint,
     GLvoid,
     glDrawArrays,
     glDrawArraysInstanced,
     glDrawElements,
     glDrawElementsInstanced,
     glMultiDrawArrays,
+    glMultiDrawArraysIndirect,
     glMultiDrawElements,
+    glMultiDrawElementsIndirect,
 )
+from pyglet.gl import gl_info
 from pyglet.graphics import allocation, shader, vertexarray
-from pyglet.graphics.vertexbuffer import AttributeBufferObject, IndexedBufferObject
+from pyglet.graphics.vertexbuffer import (
+    AttributeBufferObject,
+    BufferObject,
+    IndexedBufferObject,
+    RingAttributeBufferObject,
+)
 
 CTypesDataType = Type[_SimpleCData]
 CTypesPointer = _Pointer
 
 if TYPE_CHECKING:
     from pyglet.graphics.allocation import Allocator
+    from pyglet.graphics.culling import Bounds, SpatialGrid
     from pyglet.graphics.shader import Attribute
     from pyglet.graphics.vertexarray import VertexArray
 
 
+def _have_buffer_storage() -> bool:
+    return gl_info.have_version(4, 4) or gl_info.have_extension('GL_ARB_buffer_storage')
+
+
+def _have_multi_draw_indirect() -> bool:
+    return gl_info.have_version(4, 3) or gl_info.have_extension('GL_ARB_multi_draw_indirect')
+
+
 def _nearest_pow2(v: int) -> int:
     # From http://graphics.stanford.edu/~seander/bithacks.html#RoundUpPowerOf2
     # Credit: Sean Anderson
@@ -93,6 +112,11 @@ _gl_types = {
     'd': GL_DOUBLE,
 }
 
+# Number of GLuint fields in the DrawArraysIndirectCommand and
+# DrawElementsIndirectCommand structures read by the indirect draw calls.
+_DRAW_ARRAYS_COMMAND_LENGTH = 4
+_DRAW_ELEMENTS_COMMAND_LENGTH = 5
+
 
 def _make_attribute_property(name: str) -> property:
     def _attribute_getter(self: VertexList) -> Array[float | int]:
@@ -157,6 +181,27 @@ class VertexList:
     def delete(self) -> None:
         """Delete this group."""
         self.domain.allocator.dealloc(self.start, self.count)
+        self.domain._remove_vertex_list(self)  # noqa: SLF001
+
+    def set_bounds(self, x: float, y: float, width: float, height: float) -> None:
+        """Set the 2D bounds of the vertices, used for culling.
+
+        This has no effect unless the domain has a spatial index, see
+        the ``culling_cell_size`` argument of :py:class:`~pyglet.graphics.Batch`.
+        Vertex lists without bounds are always drawn.
+
+        Args:
+            x:
+                Left edge of the bounds.
+            y:
+                Bottom edge of the bounds.
+            width:
+                Width of the bounds.
+            height:
+                Height of the bounds.
+        """
+        if self.domain.culling is not None:
+            self.domain.culling.set_bounds(self, (x, y, width, height))
 
     def set_instance_source(self, domain: InstancedVertexDomain, instance_attributes: Sequence[str]) -> None:
         assert self.instanced is False, "Vertex list is already an instance."
@@ -176,7 +221,9 @@ class VertexList:
             new_buffer.set_region(new_start, count, old_data)
 
         self.domain.allocator.dealloc(self.start, self.count)
+        bounds = self.domain._remove_vertex_list(self)  # noqa: SLF001
         self.domain = domain
+        self.domain._add_vertex_list(self, bounds)  # noqa: SLF001
         self.start = new_start
         self.instanced = True
 
@@ -201,22 +248,69 @@ class VertexList:
             new_buffer.set_region(new_start, self.count, old_data)
 
         self.domain.allocator.dealloc(self.start, self.count)
+        bounds = self.domain._remove_vertex_list(self)  # noqa: SLF001
         self.domain = domain
+        self.domain._add_vertex_list(self, bounds)  # noqa: SLF001
         self.start = new_start
 
     def set_attribute_data(self, name: str, data: Any) -> None:
-        buffer = self.domain.attrib_name_buffers[name]
-        count = self.count
+        """Set the data of an attribute for all vertices in this list.
 
-        array_start = buffer.count * self.start
-        array_end = buffer.count * count + array_start
+        Besides sequences, ``data`` can be any object supporting the buffer
+        protocol, such as a NumPy array, ``array.array`` or ``memoryview``.
+        If it is contiguous and its items match the type of the attribute,
+        it is copied in a single operation.
+
+        Args:
+            name:
+                Name of the attribute.
+            data:
+                The new data, with one value for each component of each vertex.
+        """
+        buffer = self.domain.attrib_name_buffers[name]
         try:
-            buffer.data[array_start:array_end] = data
-            buffer.invalidate_region(self.start, count)
+            buffer.set_region(self.start, self.count, data)
         except ValueError:
-            msg = f"Invalid data size for '{name}'. Expected {array_end - array_start}, got {len(data)}."
+            msg = f"Invalid data size for '{name}'. Expected {buffer.count * self.count}, got {len(data)}."
             raise ValueError(msg) from None
 
+    def set_attributes(self, **data: Any) -> None:
+        """Set the data of several attributes for all vertices in this list.
+
+        This is equivalent to assigning each attribute, but writes the data
+        directly, without creating an intermediate array for each of them.
+
+        Args:
+            data:
+                The new data of each attribute, by name.
+        """
+        buffers = self.domain.attrib_name_buffers
+        start = self.start
+        count = self.count
+        for name, values in data.items():
+            buffers[name].set_region(start, count, values)
+
+    def attribute_view(self, name: str) -> memoryview:
+        """Get a writable, one-dimensional view of an attribute's data.
+
+        The view directly references the data of the backing buffer, so no
+        copy is made. It can be wrapped without copying, for example with
+        ``numpy.asarray``, to update all vertices with vectorised code.
+
+        The region is marked as changed when the view is created, so a new
+        view should be requested for every frame it is written to. A view is
+        no longer valid once the vertex list or its domain is resized,
+        migrated or compacted.
+
+        Args:
+            name:
+                Name of the attribute.
+        """
+        buffer = self.domain.attrib_name_buffers[name]
+        region = buffer.get_region(self.start, self.count)
+        buffer.invalidate_region(self.start, self.count)
+        return memoryview(region).cast('B').cast(buffer.c_type._type_)  # noqa: SLF001
+
     def add_instance(self, **kwargs: Any) -> VertexInstance:
         assert self.instanced
         self.domain._instances += 1  # noqa: SLF001
@@ -375,11 +469,32 @@ class VertexDomain:
 
     _property_dict: dict[str, property]
     _vertexlist_class: type
+    _draw_generation: int
+    _draw_args: tuple[int, Array[GLint] | None, Array[GLsizei]]
+    _indirect_buffer: BufferObject | None
+    _vertex_lists: set[VertexList]
+    _cull_generation: int
 
     _initial_count: int = 16
     _vertex_class: type[VertexList] = VertexList
 
-    def __init__(self, attribute_meta: dict[str, dict[str, Any]]) -> None:  # noqa: D107
+    #: If set, the domain is compacted before drawing once more than this
+    #: fraction of its capacity is lost to gaps between allocated regions.
+    #: ``None`` disables automatic compaction.
+    compaction_threshold: float | None = None
+
+    #: If ``True`` and the context supports ``glMultiDrawArraysIndirect`` and
+    #: ``glMultiDrawElementsIndirect`` (4.3 or ``GL_ARB_multi_draw_indirect``),
+    #: the allocated regions are written as draw commands into a
+    #: ``GL_DRAW_INDIRECT_BUFFER`` whenever they change, and drawn from there.
+    indirect_draw: bool = False
+
+    #: If set, only vertex lists intersecting the view of this spatial index
+    #: are drawn. See :py:meth:`VertexList.set_bounds`.
+    culling: SpatialGrid | None = None
+
+    def __init__(self, attribute_meta: dict[str, dict[str, Any]],  # noqa: D107
+                 stream_attributes: Sequence[str] = ()) -> None:
         self.attribute_meta = attribute_meta
         self.allocator = allocation.Allocator(self._initial_count)
         self.vao = vertexarray.VertexArray()
@@ -390,6 +505,20 @@ class VertexDomain:
 
         self._property_dict = {}  # name: property(_getter, _setter)
 
+        # Attributes rewritten every frame can be streamed through a persistently mapped ring:
+        if stream_attributes and not _have_buffer_storage():
+            stream_attributes = ()
+
+        # Packed glMultiDrawArrays arguments, rebuilt when the allocator generation changes.
+        # The starts are None when the commands are in the indirect buffer, but the sizes are kept:
+        self._draw_generation = -1
+        self._draw_args = (0, (GLint * 0)(), (GLsizei * 0)())
+        self._indirect_buffer = None
+
+        # Live vertex lists, so they can be moved when compacting:
+        self._vertex_lists = set()
+        self._cull_generation = -1
+
         for name, meta in attribute_meta.items():
             assert meta['format'][0] in _gl_types, f"'{meta['format']}' is not a valid attribute format for '{name}'."
             location = meta['location']
@@ -402,10 +531,9 @@ class VertexDomain:
                                                                       instanced)
 
             # Create buffer:
-            self.attrib_name_buffers[name] = buffer = AttributeBufferObject(attribute.stride * self.allocator.capacity,
-                                                                            attribute)
-            # TODO: use persistent buffer if we have GL support for it:
-            # attribute.buffer = PersistentBufferObject(attribute.stride * self.allocator.capacity, attribute, self.vao)
+            buffer_class = RingAttributeBufferObject if name in stream_attributes else AttributeBufferObject
+            self.attrib_name_buffers[name] = buffer = buffer_class(attribute.stride * self.allocator.capacity,
+                                                                   attribute)
 
             self.buffer_attributes.append((buffer, attribute))
 
@@ -456,35 +584,147 @@ class VertexDomain:
                 Ignored for non indexed VertexDomains
         """
         start = self.safe_alloc(count)
-        return self._vertexlist_class(self, start, count)
+        vertex_list = self._vertexlist_class(self, start, count)
+        self._add_vertex_list(vertex_list)
+        return vertex_list
+
+    def _add_vertex_list(self, vertex_list: VertexList, bounds: Bounds | None = None) -> None:
+        self._vertex_lists.add(vertex_list)
+        if self.culling is not None:
+            self.culling.add(vertex_list, bounds)
+
+    def _remove_vertex_list(self, vertex_list: VertexList) -> Bounds | None:
+        self._vertex_lists.discard(vertex_list)
+        if self.culling is not None:
+            return self.culling.remove(vertex_list)
+        return None
 
     def draw(self, mode: int) -> None:
         """Draw all vertices in the domain.
 
         All vertices in the domain are drawn at once. This is the
-        most efficient way to render primitives.
+        most efficient way to render primitives. If the domain has a
+        spatial index, only the vertex lists in view are drawn.
 
         Args:
             mode:
                 OpenGL drawing mode, e.g. ``GL_POINTS``, ``GL_LINES``, etc.
 
         """
+        culling = self.culling
+        if (self._draw_generation != self.allocator.generation or
+                (culling is not None and self._cull_generation != culling.generation)):
+            if self.compaction_threshold is not None and self._needs_compaction():
+                self.compact()
+            self._update_draw_args()
+
         self.vao.bind()
         for buffer, _ in self.buffer_attributes:
             buffer.commit()
 
-        starts, sizes = self.allocator.get_allocated_regions()
-        primcount = len(starts)
+        primcount, starts, sizes = self._draw_args
         if primcount == 0:
             pass
         elif primcount == 1:
             # Common case
             glDrawArrays(mode, starts[0], sizes[0])
+        elif starts is None:
+            self._indirect_buffer.bind(GL_DRAW_INDIRECT_BUFFER)
+            glMultiDrawArraysIndirect(mode, None, primcount, 0)
         else:
-            starts = (GLint * primcount)(*starts)
-            sizes = (GLsizei * primcount)(*sizes)
             glMultiDrawArrays(mode, starts, sizes, primcount)
 
+    def _update_draw_args(self) -> None:
+        """Pack the allocated regions into ctypes arrays for drawing.
+
+        The arrays are cached until the layout of the allocator changes,
+        so they are not rebuilt every frame. If :py:attr:`indirect_draw` is
+        enabled, the regions are uploaded as indirect draw commands instead.
+        """
+        if self.culling is not None and self.culling.view is not None:
+            starts, sizes = self._get_visible_regions()
+        else:
+            starts, sizes = self.allocator.get_allocated_regions()
+        primcount = len(starts)
+        if primcount > 1 and self.indirect_draw and _have_multi_draw_indirect():
+            # DrawArraysIndirectCommand: count, instanceCount, first, baseInstance
+            commands = (GLuint * (primcount * _DRAW_ARRAYS_COMMAND_LENGTH))()
+            commands[0::_DRAW_ARRAYS_COMMAND_LENGTH] = sizes
+            commands[1::_DRAW_ARRAYS_COMMAND_LENGTH] = [1] * primcount
+            commands[2::_DRAW_ARRAYS_COMMAND_LENGTH] = starts
+            self._upload_indirect_commands(commands)
+            self._draw_args = primcount, None, (GLsizei * primcount)(*sizes)
+        else:
+            self._draw_args = primcount, (GLint * primcount)(*starts), (GLsizei * primcount)(*sizes)
+        self._draw_generation = self.allocator.generation
+        if self.culling is not None:
+            self._cull_generation = self.culling.generation
+
+    def _get_visible_regions(self) -> tuple[list[int], list[int]]:
+        """Get the regions of the vertex lists in view, merging adjacent ones."""
+        regions = sorted(self._get_region(vertex_list) for vertex_list in self.culling.query())
+        starts = []
+        sizes = []
+        end = None
+        for start, size in regions:
+            if start == end:
+                sizes[-1] += size
+            else:
+                starts.append(start)
+                sizes.append(size)
+            end = start + size
+        return starts, sizes
+
+    @staticmethod
+    def _get_region(vertex_list: VertexList) -> tuple[int, int]:
+        return vertex_list.start, vertex_list.count
+
+    def _upload_indirect_commands(self, commands: Array[GLuint]) -> None:
+        size = ctypes.sizeof(commands)
+        if self._indirect_buffer is None or self._indirect_buffer.size < size:
+            if self._indirect_buffer is not None:
+                self._indirect_buffer.delete()
+            self._indirect_buffer = BufferObject(_nearest_pow2(size))
+        self._indirect_buffer.set_data_region(commands, 0, size)
+
+    def _needs_compaction(self) -> bool:
+        allocator = self.allocator
+        return allocator.get_fragmented_free_size() > allocator.capacity * self.compaction_threshold
+
+    def compact(self) -> None:
+        """Remove the gaps left between vertex lists in the domain.
+
+        All vertex lists are moved into one contiguous region at the start of
+        the buffers, which are then shrunk to fit. Afterwards, the domain is
+        drawn with a single draw call. The ``start`` of each moved vertex list
+        is updated.
+
+        This can be called explicitly, or automatically before drawing by
+        setting :py:attr:`compaction_threshold`.
+        """
+        vertex_lists = sorted(self._vertex_lists, key=lambda vl: vl.start)
+        new_starts = []
+        total = 0
+        for vertex_list in vertex_lists:
+            new_starts.append(total)
+            total += vertex_list.count
+
+        capacity = max(_nearest_pow2(total), self._initial_count)
+        for buffer, _ in self.buffer_attributes:
+            stride = buffer.stride
+            # Lists are visited in order of position, so data only ever moves down.
+            for vertex_list, new_start in zip(vertex_lists, new_starts):
+                ctypes.memmove(buffer.data_ptr + new_start * stride, buffer.data_ptr + vertex_list.start * stride,
+                               vertex_list.count * stride)
+            buffer.resize(capacity * stride)
+
+        self.allocator = allocation.Allocator(capacity)
+        self.allocator.alloc(total)
+        for vertex_list, new_start in zip(vertex_lists, new_starts):
+            vertex_list.start = new_start
+
+        self._draw_generation = -1
+
     def draw_subset(self, mode: int, vertex_list: VertexList) -> None:
         """Draw a specific VertexList in the domain.
 
@@ -544,8 +784,9 @@ class InstancedVertexDomain(VertexDomain):  # noqa: D101
     _instance_properties: dict[str, property]
     _vertexinstance_class: type
 
-    def __init__(self, attribute_meta: dict[str, dict[str, Any]]) -> None:
-        super().__init__(attribute_meta)
+    def __init__(self, attribute_meta: dict[str, dict[str, Any]],  # noqa: D107
+                 stream_attributes: Sequence[str] = ()) -> None:
+        super().__init__(attribute_meta, stream_attributes)
         self._instances = 1
         self.instance_allocator = allocation.Allocator(self._initial_count)
 
@@ -575,8 +816,10 @@ class InstancedVertexDomain(VertexDomain):  # noqa: D101
             return self.allocator.alloc(count)
         except allocation.AllocatorMemoryException as e:
             capacity = _nearest_pow2(e.requested_capacity)
-            for buffer, _ in self.buffer_attributes:
-                buffer.resize(capacity * buffer.stride)
+            for buffer, attribute in self.buffer_attributes:
+                # Instance attributes are sized by the instance allocator.
+                if not attribute.instance:
+                    buffer.resize(capacity * buffer.stride)
             self.allocator.set_capacity(capacity)
             return self.allocator.alloc(count)
 
@@ -586,11 +829,50 @@ class InstancedVertexDomain(VertexDomain):  # noqa: D101
             return self.allocator.realloc(start, count, new_count)
         except allocation.AllocatorMemoryException as e:
             capacity = _nearest_pow2(e.requested_capacity)
-            for buffer, _ in self.buffer_attributes:
-                buffer.resize(capacity * buffer.stride)
+            for buffer, attribute in self.buffer_attributes:
+                if not attribute.instance:
+                    buffer.resize(capacity * buffer.stride)
             self.allocator.set_capacity(capacity)
             return self.allocator.realloc(start, count, new_count)
 
+    @property
+    def instance_count(self) -> int:
+        """The number of instances drawn."""
+        return self._instances
+
+    def set_instance_count(self, count: int) -> None:
+        """Set the number of instances drawn, resizing the instance attribute buffers if necessary.
+
+        The data of each instance is stored at its index in the instance
+        attribute buffers. This is an alternative to
+        :py:meth:`VertexList.add_instance`, for users managing that data
+        themselves.
+        """
+        if count > self.instance_allocator.capacity:
+            capacity = _nearest_pow2(count)
+            for buffer, attribute in self.buffer_attributes:
+                if attribute.instance:
+                    buffer.resize(capacity * buffer.stride)
+            self.instance_allocator.set_capacity(capacity)
+
+        self._instances = count
+
+    def move_instance(self, src: int, dst: int) -> None:
+        """Copy the data of one instance to another index of the instance attribute buffers.
+
+        Args:
+            src:
+                Index of the instance to copy.
+            dst:
+                Index the instance data is copied to.
+        """
+        for buffer, attribute in self.buffer_attributes:
+            if attribute.instance:
+                count = buffer.count
+                data = buffer.data
+                data[dst * count:(dst + 1) * count] = data[src * count:(src + 1) * count]
+                buffer.invalidate_region(dst, 1)
+
     def draw(self, mode: int) -> None:
         """Draw all vertices in the domain.
 
@@ -627,6 +909,9 @@ class InstancedVertexDomain(VertexDomain):  # noqa: D101
 
         glDrawArraysInstanced(mode, vertex_list.start, vertex_list.count, self._instances)
 
+    def compact(self) -> None:
+        """Instanced domains are not compacted."""
+
     @property
     def is_empty(self) -> bool:
         return not self.allocator.starts
@@ -647,8 +932,8 @@ class IndexedVertexDomain(VertexDomain):
     _vertex_class = IndexedVertexList
 
     def __init__(self, attribute_meta: dict[str, dict[str, Any]],  # noqa: D107
-                 index_gl_type: int = GL_UNSIGNED_INT) -> None:
-        super().__init__(attribute_meta)
+                 index_gl_type: int = GL_UNSIGNED_INT, stream_attributes: Sequence[str] = ()) -> None:
+        super().__init__(attribute_meta, stream_attributes)
 
         self.index_allocator = allocation.Allocator(self._initial_index_count)
 
@@ -700,38 +985,128 @@ class IndexedVertexDomain(VertexDomain):
         """
         start = self.safe_alloc(count)
         index_start = self.safe_index_alloc(index_count)
-        return self._vertexlist_class(self, start, count, index_start, index_count)
+        vertex_list = self._vertexlist_class(self, start, count, index_start, index_count)
+        self._add_vertex_list(vertex_list)
+        return vertex_list
 
     def draw(self, mode: int) -> None:
         """Draw all vertices in the domain.
 
         All vertices in the domain are drawn at once. This is the
-        most efficient way to render primitives.
+        most efficient way to render primitives. If the domain has a
+        spatial index, only the vertex lists in view are drawn.
 
         Args:
             mode:
                 OpenGL drawing mode, e.g. ``GL_POINTS``, ``GL_LINES``, etc.
 
         """
+        culling = self.culling
+        if (self._draw_generation != self.index_allocator.generation or
+                (culling is not None and self._cull_generation != culling.generation)):
+            if self.compaction_threshold is not None and self._needs_compaction():
+                self.compact()
+            self._update_draw_args()
+
         self.vao.bind()
         for buffer, _ in self.buffer_attributes:
             buffer.commit()
 
         self.index_buffer.commit()
 
-        starts, sizes = self.index_allocator.get_allocated_regions()
-        primcount = len(starts)
+        primcount, starts, sizes = self._draw_args
         if primcount == 0:
             pass
         elif primcount == 1:
             # Common case
-            glDrawElements(mode, sizes[0], self.index_gl_type,
-                           self.index_buffer.ptr + starts[0] * self.index_element_size)
+            glDrawElements(mode, sizes[0], self.index_gl_type, starts[0])
+        elif starts is None:
+            self._indirect_buffer.bind(GL_DRAW_INDIRECT_BUFFER)
+            glMultiDrawElementsIndirect(mode, self.index_gl_type, None, primcount, 0)
+        else:
+            glMultiDrawElements(mode, sizes, self.index_gl_type, starts, primcount)
+
+    def _update_draw_args(self) -> None:
+        """Pack the allocated index regions into ctypes arrays for drawing.
+
+        The arrays are cached until the layout of the index allocator
+        changes, so they are not rebuilt every frame. If
+        :py:attr:`indirect_draw` is enabled, the regions are uploaded as
+        indirect draw commands instead.
+        """
+        if self.culling is not None and self.culling.view is not None:
+            starts, sizes = self._get_visible_regions()
+        else:
+            starts, sizes = self.index_allocator.get_allocated_regions()
+        primcount = len(starts)
+        if primcount > 1 and self.indirect_draw and _have_multi_draw_indirect():
+            # DrawElementsIndirectCommand: count, instanceCount, firstIndex, baseVertex, baseInstance
+            # The indices are absolute, so the base vertex is always 0.
+            commands = (GLuint * (primcount * _DRAW_ELEMENTS_COMMAND_LENGTH))()
+            commands[0::_DRAW_ELEMENTS_COMMAND_LENGTH] = sizes
+            commands[1::_DRAW_ELEMENTS_COMMAND_LENGTH] = [1] * primcount
+            commands[2::_DRAW_ELEMENTS_COMMAND_LENGTH] = starts
+            self._upload_indirect_commands(commands)
+            self._draw_args = primcount, None, (GLsizei * primcount)(*sizes)
         else:
             starts = [s * self.index_element_size + self.index_buffer.ptr for s in starts]
             starts = (ctypes.POINTER(GLvoid) * primcount)(*(GLintptr * primcount)(*starts))
-            sizes = (GLsizei * primcount)(*sizes)
-            glMultiDrawElements(mode, sizes, self.index_gl_type, starts, primcount)
+            self._draw_args = primcount, starts, (GLsizei * primcount)(*sizes)
+        self._draw_generation = self.index_allocator.generation
+        if self.culling is not None:
+            self._cull_generation = self.culling.generation
+
+    @staticmethod
+    def _get_region(vertex_list: IndexedVertexList) -> tuple[int, int]:
+        return vertex_list.index_start, vertex_list.index_count
+
+    def _needs_compaction(self) -> bool:
+        index_allocator = self.index_allocator
+        return (super()._needs_compaction() or
+                index_allocator.get_fragmented_free_size() > index_allocator.capacity * self.compaction_threshold)
+
+    def compact(self) -> None:
+        """Remove the gaps left between vertex lists in the domain.
+
+        Both the vertices and the indices of all vertex lists are moved into
+        one contiguous region at the start of their buffers, which are then
+        shrunk to fit. Afterwards, the domain is drawn with a single draw call.
+        The ``start`` and ``index_start`` of each moved vertex list are updated.
+
+        This can be called explicitly, or automatically before drawing by
+        setting :py:attr:`compaction_threshold`.
+        """
+        old_starts = [(vertex_list, vertex_list.start) for vertex_list in self._vertex_lists]
+        super().compact()
+
+        # The index values refer to vertex positions, so renumber them to match:
+        index_buffer = self.index_buffer
+        for vertex_list, old_start in old_starts:
+            diff = vertex_list.start - old_start
+            if diff:
+                indices = index_buffer.get_region(vertex_list.index_start, vertex_list.index_count)
+                index_buffer.set_region(vertex_list.index_start, vertex_list.index_count, [i + diff for i in indices])
+
+        vertex_lists = sorted(self._vertex_lists, key=lambda vl: vl.index_start)
+        new_starts = []
+        total = 0
+        for vertex_list in vertex_lists:
+            new_starts.append(total)
+            total += vertex_list.index_count
+
+        capacity = max(_nearest_pow2(total), self._initial_index_count)
+        size = self.index_element_size
+        data_ptr = index_buffer.data_ptr
+        for vertex_list, new_start in zip(vertex_lists, new_starts):
+            ctypes.memmove(data_ptr + new_start * size, data_ptr + vertex_list.index_start * size,
+                           vertex_list.index_count * size)
+            vertex_list.index_start = new_start
+        index_buffer.resize(capacity * size)
+
+        self.index_allocator = allocation.Allocator(capacity)
+        self.index_allocator.alloc(total)
+
+        self._draw_generation = -1
 
     def draw_subset(self, mode: int, vertex_list: IndexedVertexList) -> None:
         """Draw a specific IndexedVertexList in the domain.
@@ -765,8 +1140,8 @@ class InstancedIndexedVertexDomain(IndexedVertexDomain, InstancedVertexDomain):
     _initial_index_count: int = 16
 
     def __init__(self, attribute_meta: dict[str, dict[str, Any]],  # noqa: D107
-                 index_gl_type: int = GL_UNSIGNED_INT) -> None:
-        super().__init__(attribute_meta, index_gl_type)
+                 index_gl_type: int = GL_UNSIGNED_INT, stream_attributes: Sequence[str] = ()) -> None:
+        super().__init__(attribute_meta, index_gl_type, stream_attributes)
 
     def safe_index_alloc(self, count: int) -> int:
         """Allocate indices, resizing the buffers if necessary.
@@ -804,7 +1179,9 @@ class InstancedIndexedVertexDomain(IndexedVertexDomain, InstancedVertexDomain):
         """
         start = self.safe_alloc(count)
         index_start = self.safe_index_alloc(index_count)
-        return self._vertexlist_class(self, start, count, index_start, index_count)
+        vertex_list = self._vertexlist_class(self, start, count, index_start, index_count)
+        self._add_vertex_list(vertex_list)
+        return vertex_list
 
     def draw(self, mode: int) -> None:
         """Draw all vertices in the domain.
@@ -821,6 +1198,8 @@ class InstancedIndexedVertexDomain(IndexedVertexDomain, InstancedVertexDomain):
         for buffer, _ in self.buffer_attributes:
             buffer.commit()
 
+        self.index_buffer.commit()
+
         starts, sizes = self.index_allocator.get_allocated_regions()
         glDrawElementsInstanced(mode, sizes[0], self.index_gl_type,
                                 self.index_buffer.ptr + starts[0] * self.index_element_size, self._instances)
@@ -842,6 +1221,11 @@ class InstancedIndexedVertexDomain(IndexedVertexDomain, InstancedVertexDomain):
         for buffer, _ in self.buffer_attributes:
             buffer.commit()
 
+        self.index_buffer.commit()
+
         glDrawElementsInstanced(mode, vertex_list.index_count, self.index_gl_type,
                                 self.index_buffer.ptr +
                                 vertex_list.index_start * self.index_element_size, self._instances)
+
+    def compact(self) -> None:
+        """Instanced domains are not compacted."""
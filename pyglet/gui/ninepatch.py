@@ -170,6 +170,10 @@ class NinePatch(Sprite):
                     x0, y2, z, x1, y2, z, x2, y2, z, x3, y2, z,
                     x0, y3, z, x1, y3, z, x2, y3, z, x3, y3, z)
 
+    def _update_bounds(self) -> None:
+        # The size does not follow the image, so NinePatches are never culled.
+        pass
+
     @property
     def position(self) -> tuple[float, float, float]:
         """The (x, y, z) coordinates of the NinePatch, as a tuple."""
@@ -108,10 +108,10 @@ from pyglet.gl import (
     GL_DRAW_FRAMEBUFFER, GL_FLOAT, GL_FRAMEBUFFER, GL_FRAMEBUFFER_ATTACHMENT_STENCIL_SIZE, GL_LINEAR,
     GL_LINEAR_MIPMAP_LINEAR, GL_LUMINANCE, GL_MAX_TEXTURE_SIZE, GL_MAX_ARRAY_TEXTURE_LAYERS,
     GL_PACK_ALIGNMENT, GL_READ_WRITE, GL_RED, GL_RG, GL_RGB, GL_RGBA, GL_RGBA32F,
-    GL_RGBA8, GL_STENCIL, GL_STENCIL_INDEX, GL_TEXTURE0, GL_TEXTURE_2D, GL_TEXTURE_2D_ARRAY, GL_TEXTURE_3D,
+    GL_RGBA8, GL_STENCIL, GL_STENCIL_INDEX, GL_TEXTURE_2D, GL_TEXTURE_2D_ARRAY, GL_TEXTURE_3D,
     GL_TEXTURE_MAG_FILTER, GL_TEXTURE_MIN_FILTER, GL_TRIANGLES, GL_UNPACK_ALIGNMENT, GL_UNPACK_ROW_LENGTH,
-    GL_UNPACK_SKIP_PIXELS, GL_UNPACK_SKIP_ROWS, GL_UNSIGNED_BYTE, GL_VIEWPORT, GLint, GLubyte, GLuint, glActiveTexture,
-    glBindFramebuffer, glBindImageTexture, glBindTexture, glBindVertexArray, glCheckFramebufferStatus,
+    GL_UNPACK_SKIP_PIXELS, GL_UNPACK_SKIP_ROWS, GL_UNSIGNED_BYTE, GL_VIEWPORT, GLint, GLubyte, GLuint,
+    glBindFramebuffer, glBindImageTexture, glCheckFramebufferStatus,
     glCompressedTexImage2D, glCompressedTexSubImage2D, glCompressedTexSubImage3D, glCopyTexSubImage2D, glCopyTexImage2D,
     glDeleteFramebuffers, glDeleteTextures, glDeleteVertexArrays, glDrawElements, glFlush, glFramebufferTexture2D,
     glGenFramebuffers, glGenTextures, glGenVertexArrays, glGenerateMipmap, glGetFramebufferAttachmentParameteriv,
@@ -667,7 +667,7 @@ class ImageData(AbstractImage):
 
         internalformat = self._get_internalformat(self.format)
 
-        glBindTexture(texture.target, texture.id)
+        pyglet.gl.current_context.bindings.bind_texture(texture.target, texture.id)
         glTexParameteri(texture.target, GL_TEXTURE_MIN_FILTER, GL_LINEAR_MIPMAP_LINEAR)
 
         if self.mipmap_images:
@@ -1023,7 +1023,7 @@ class CompressedImageData(AbstractImage):
             texture.anchor_x = self.anchor_x
             texture.anchor_y = self.anchor_y
 
-        glBindTexture(texture.target, texture.id)
+        pyglet.gl.current_context.bindings.bind_texture(texture.target, texture.id)
         glTexParameteri(texture.target, GL_TEXTURE_MIN_FILTER, texture.min_filter)
         glTexParameteri(texture.target, GL_TEXTURE_MAG_FILTER, texture.mag_filter)
 
@@ -1060,7 +1060,7 @@ class CompressedImageData(AbstractImage):
             texture.anchor_x = self.anchor_x
             texture.anchor_y = self.anchor_y
 
-        glBindTexture(texture.target, texture.id)
+        pyglet.gl.current_context.bindings.bind_texture(texture.target, texture.id)
 
         glTexParameteri(texture.target, GL_TEXTURE_MIN_FILTER, GL_LINEAR_MIPMAP_LINEAR)
 
@@ -1182,6 +1182,7 @@ class Texture(AbstractImage):
         Textures are invalid after deletion, and may no longer be used.
         """
         glDeleteTextures(1, GLuint(self.id))
+        pyglet.gl.current_context.bindings.invalidate()
         self.id = None
 
     def __del__(self):
@@ -1194,8 +1195,7 @@ class Texture(AbstractImage):
 
     def bind(self, texture_unit: int = 0) -> None:
         """Bind to a specific Texture Unit by number."""
-        glActiveTexture(GL_TEXTURE0 + texture_unit)
-        glBindTexture(self.target, self.id)
+        pyglet.gl.current_context.bindings.bind_texture(self.target, self.id, texture_unit)
 
     def bind_image_texture(self, unit: int, level: int = 0, layered: bool = False,
                            layer: int = 0, access: int = GL_READ_WRITE, fmt: int = GL_RGBA32F):
@@ -1241,7 +1241,7 @@ class Texture(AbstractImage):
 
         tex_id = GLuint()
         glGenTextures(1, byref(tex_id))
-        glBindTexture(target, tex_id.value)
+        pyglet.gl.current_context.bindings.bind_texture(target, tex_id.value)
         glTexParameteri(target, GL_TEXTURE_MIN_FILTER, min_filter)
         glTexParameteri(target, GL_TEXTURE_MAG_FILTER, mag_filter)
 
@@ -1272,7 +1272,7 @@ class Texture(AbstractImage):
             z:
                 For 3D textures, the image slice to retrieve.
         """
-        glBindTexture(self.target, self.id)
+        pyglet.gl.current_context.bindings.bind_texture(self.target, self.id)
 
         # Always extract complete RGBA data.  Could check internalformat
         # to only extract used channels. XXX
@@ -1324,13 +1324,12 @@ class Texture(AbstractImage):
         position = x1, y1, z, x2, y1, z, x2, y2, z, x1, y2, z
         indices = [0, 1, 2, 0, 2, 3]
 
-        glActiveTexture(GL_TEXTURE0)
-        glBindTexture(self.target, self.id)
+        pyglet.gl.current_context.bindings.bind_texture(self.target, self.id, 0)
 
         # Create and bind a throwaway VAO
         vao_id = GLuint()
         glGenVertexArrays(1, vao_id)
-        glBindVertexArray(vao_id)
+        pyglet.gl.current_context.bindings.bind_vertex_array(vao_id.value)
 
         # Activate shader program:
         program = pyglet.graphics.get_default_blit_shader()
@@ -1368,14 +1367,14 @@ class Texture(AbstractImage):
         # Discard everything after blitting:
         position_buffer.delete()
         texcoord_buffer.delete()
-        glBindVertexArray(0)
+        pyglet.gl.current_context.bindings.bind_vertex_array(0)
         glDeleteVertexArrays(1, vao_id)
 
     def get_mipmapped_texture(self) -> Texture:
         raise NotImplementedError(f"Not implemented for {self}.")
 
     def blit_into(self, source: AbstractImage, x: int, y: int, z: int):
-        glBindTexture(self.target, self.id)
+        pyglet.gl.current_context.bindings.bind_texture(self.target, self.id)
         source.blit_to_texture(self.target, self.level, x, y, z)
 
     def blit_to_texture(self, target: int, level: int, x: int, y: int, z: int, internalformat: int = None):
@@ -1533,7 +1532,7 @@ class Texture3D(Texture, UniformTextureSequence):
         texture.images = len(images)
 
         blank = (GLubyte * (texture.width * texture.height * texture.images * 4))() if blank_data else None
-        glBindTexture(texture.target, texture.id)
+        pyglet.gl.current_context.bindings.bind_texture(texture.target, texture.id)
         glTexImage3D(texture.target, texture.level,
                      internalformat,
                      texture.width, texture.height, texture.images, 0,
@@ -1565,7 +1564,7 @@ class Texture3D(Texture, UniformTextureSequence):
 
     def __setitem__(self, index, value):
         if type(index) is slice:
-            glBindTexture(self.target, self.id)
+            pyglet.gl.current_context.bindings.bind_texture(self.target, self.id)
 
             for item, image in zip(self[index], value):
                 image.blit_to_texture(self.target, self.level, image.anchor_x, image.anchor_y, item.z)
@@ -1621,7 +1620,7 @@ class TextureArray(Texture, UniformTextureSequence):
 
         tex_id = GLuint()
         glGenTextures(1, byref(tex_id))
-        glBindTexture(GL_TEXTURE_2D_ARRAY, tex_id.value)
+        pyglet.gl.current_context.bindings.bind_texture(GL_TEXTURE_2D_ARRAY, tex_id.value)
         glTexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_MIN_FILTER, min_filter)
         glTexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_MAG_FILTER, mag_filter)
 
@@ -1662,7 +1661,7 @@ class TextureArray(Texture, UniformTextureSequence):
         if len(self.items) + len(images) > self.max_depth:
             raise TextureArrayDepthExceeded("The amount of images being added exceeds the depth of this TextureArray.")
 
-        glBindTexture(self.target, self.id)
+        pyglet.gl.current_context.bindings.bind_texture(self.target, self.id)
 
         start_length = len(self.items)
         for i, image in enumerate(images):
@@ -1687,7 +1686,7 @@ class TextureArray(Texture, UniformTextureSequence):
 
     def __setitem__(self, index, value) -> None:
         if type(index) is slice:
-            glBindTexture(self.target, self.id)
+            pyglet.gl.current_context.bindings.bind_texture(self.target, self.id)
 
             for old_item, image in zip(self[index], value):
                 self._verify_size(image)
@@ -1740,12 +1739,11 @@ class TileableTexture(Texture):
                       u2, v2, t[8],
                       u1, v2, t[11])
 
-        glActiveTexture(GL_TEXTURE0)
-        glBindTexture(self.target, self.id)
+        pyglet.gl.current_context.bindings.bind_texture(self.target, self.id, 0)
         pyglet.graphics.draw_indexed(4, GL_TRIANGLES, [0, 1, 2, 0, 2, 3],
                                      position=('f', vertices),
                                      tex_coords=('f', tex_coords))
-        glBindTexture(self.target, 0)
+        pyglet.gl.current_context.bindings.bind_texture(self.target, 0)
 
     @classmethod
     def create_for_image(cls, image: AbstractImage) -> Texture:
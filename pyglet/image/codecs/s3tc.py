@@ -6,6 +6,7 @@ http://oss.sgi.com/projects/ogl-sample/registry/EXT/texture_compression_s3tc.txt
 import re
 import ctypes
 
+import pyglet
 from pyglet.gl import *
 from pyglet.gl import gl_info
 from pyglet.image import AbstractImage, Texture
@@ -41,7 +42,7 @@ class PackedImageData(AbstractImage):
             return self._current_texture
 
         texture = Texture.create(self.width, self.height, GL_TEXTURE_2D, None)
-        glBindTexture(texture.target, texture.id)
+        pyglet.gl.current_context.bindings.bind_texture(texture.target, texture.id)
         glTexParameteri(texture.target, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
 
         if not gl_info.have_version(1, 2) or True:
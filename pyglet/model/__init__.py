@@ -206,8 +206,7 @@ class TexturedMaterialGroup(BaseMaterialGroup):
         self.texture = texture
 
     def set_state(self) -> None:
-        gl.glActiveTexture(gl.GL_TEXTURE0)
-        gl.glBindTexture(self.texture.target, self.texture.id)
+        pyglet.gl.current_context.bindings.bind_texture(self.texture.target, self.texture.id, 0)
         self.program.use()
         self.program['model'] = self.matrix
 
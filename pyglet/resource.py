@@ -55,7 +55,7 @@ import zipfile
 import weakref
 
 from io import BytesIO, StringIO
-from typing import TYPE_CHECKING, IO
+from typing import TYPE_CHECKING, IO, Any
 
 import pyglet
 
@@ -692,7 +692,7 @@ class Loader:
         fileobj = self.file(name)
         return pyglet.text.load(name, fileobj, 'text/plain')
 
-    def shader(self, name: str, shader_type: str | None = None) -> Shader:
+    def shader(self, name: str, shader_type: str | None = None, defines: dict[str, Any] | None = None) -> Shader:
         """Load a Shader object.
 
         Args:
@@ -702,6 +702,9 @@ class Loader:
                 A hint for the type of shader, such as 'vertex', 'fragment', etc.
                 Not required if your shader has a standard file extension, such
                 as ``.vert``, ``.frag``, etc..
+            defines:
+                Preprocessor definitions to add to the source.
+                See :py:class:`~pyglet.graphics.shader.Shader`.
         """
         self._ensure_index()
         # https://www.khronos.org/opengles/sdk/tools/Reference-Compiler/
@@ -724,7 +727,7 @@ class Loader:
         if shader_type not in shader_extensions.values():
             raise UndetectableShaderType(name=name)
 
-        return pyglet.graphics.shader.Shader(source_string, shader_type)
+        return pyglet.graphics.shader.Shader(source_string, shader_type, defines)
 
 
 #: Default resource search path.
@@ -68,12 +68,23 @@ from __future__ import annotations
 
 import math
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Sequence, Tuple, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Sequence, Tuple, Union
 
 import pyglet
 from pyglet.extlibs import earcut
-from pyglet.gl import GL_BLEND, GL_ONE_MINUS_SRC_ALPHA, GL_SRC_ALPHA, GL_TRIANGLES, glBlendFunc, glDisable, glEnable
+from pyglet.gl import (
+    GL_BLEND,
+    GL_LINE_STRIP_ADJACENCY,
+    GL_ONE_MINUS_SRC_ALPHA,
+    GL_SRC_ALPHA,
+    GL_TRIANGLES,
+    glBlendFunc,
+    glDisable,
+    glEnable,
+)
 from pyglet.graphics import Batch, Group
+from pyglet.graphics.instancing import InstanceRecord, Instancer
 from pyglet.math import Vec2
 
 if TYPE_CHECKING:
@@ -127,11 +138,183 @@ fragment_source = """#version 150 core
 """
 
 
+instanced_vertex_source = """#version 150 core
+    in vec2 position;
+    in vec2 inset;
+    in vec2 translation;
+    in float zposition;
+    in vec2 size;
+    in float thickness;
+    in float rotation;
+    in vec4 color;
+
+    out vec4 vertex_color;
+
+    uniform WindowBlock
+    {
+        mat4 projection;
+        mat4 view;
+    } window;
+
+    void main()
+    {
+        // The unit mesh is scaled by the size, and inset vertices are moved inward by the thickness:
+        vec2 local = position * size + inset * thickness;
+
+        float angle = -radians(rotation);
+        mat2 m_rotation = mat2(cos(angle), sin(angle), -sin(angle), cos(angle));
+
+        gl_Position = window.projection * window.view * vec4(translation + m_rotation * local, zposition, 1.0);
+        vertex_color = color;
+    }
+"""
+
+
+polyline_vertex_source = """#version 150 core
+    in vec2 position;
+    in vec2 translation;
+    in vec4 color;
+    in float zposition;
+    in float rotation;
+    in float thickness;
+
+    out vec4 line_color;
+    out float line_thickness;
+
+    void main()
+    {
+        // Points are only moved into place here, and are expanded into segments by the geometry shader:
+        float angle = -radians(rotation);
+        mat2 m_rotation = mat2(cos(angle), sin(angle), -sin(angle), cos(angle));
+
+        gl_Position = vec4(translation + m_rotation * position, zposition, 1.0);
+        line_color = color;
+        line_thickness = thickness;
+    }
+"""
+
+polyline_geometry_source = """#version 150 core
+    // Each segment is drawn with its previous and next points, and expanded into a quad.
+    layout (lines_adjacency) in;
+    layout (triangle_strip, max_vertices = 7) out;
+
+    in vec4 line_color[];
+    in float line_thickness[];
+
+    out vec4 vertex_color;
+
+    uniform WindowBlock
+    {
+        mat4 projection;
+        mat4 view;
+    } window;
+
+    // Joins longer than this, relative to half the thickness, are beveled instead of mitered.
+    const float MITER_LIMIT = 4.0;
+
+    mat4 m_pv;
+    float z;
+
+    void emit(vec2 point, int index)
+    {
+        gl_Position = m_pv * vec4(point, z, 1.0);
+        vertex_color = line_color[index];
+        EmitVertex();
+    }
+
+    // Return the offset of the join at a point, given the normal of the segment and the
+    // normal of the adjacent segment, or the offset of a square end if the join is beveled.
+    vec2 get_join(vec2 normal, vec2 adjacent_normal, float half_thickness, out bool beveled)
+    {
+        vec2 miter = normal + adjacent_normal;
+        float miter_length = length(miter);
+        // The cosine of the angle between the miter and the normal:
+        float cosine = miter_length > 0.0 ? dot(miter, normal) / miter_length : 0.0;
+        beveled = cosine * MITER_LIMIT < 1.0;
+        if (beveled) {
+            return normal * half_thickness;
+        }
+        return miter / miter_length * (half_thickness / cosine);
+    }
+
+    void main()
+    {
+        // Vertices without a thickness mark the ends of the line. A negative thickness marks
+        // a vertex only used for the join of the previous segment, which starts no segment:
+        float half_thickness = line_thickness[1] * 0.5;
+        vec2 p0 = gl_in[0].gl_Position.xy;
+        vec2 p1 = gl_in[1].gl_Position.xy;
+        vec2 p2 = gl_in[2].gl_Position.xy;
+        vec2 p3 = gl_in[3].gl_Position.xy;
+        if (half_thickness <= 0.0 || line_thickness[2] <= 0.0 || p1 == p2) {
+            return;
+        }
+
+        m_pv = window.projection * window.view;
+        z = gl_in[1].gl_Position.z;
+
+        vec2 direction = normalize(p2 - p1);
+        vec2 normal = vec2(-direction.y, direction.x);
+
+        bool beveled = false;
+        vec2 start = normal * half_thickness;
+        if (line_thickness[0] != 0.0 && p0 != p1) {
+            vec2 previous = normalize(p1 - p0);
+            start = get_join(normal, vec2(-previous.y, previous.x), half_thickness, beveled);
+        }
+
+        beveled = false;
+        vec2 end = normal * half_thickness;
+        vec2 next_normal = normal;
+        if (line_thickness[3] != 0.0 && p3 != p2) {
+            vec2 next = normalize(p3 - p2);
+            next_normal = vec2(-next.y, next.x);
+            end = get_join(normal, next_normal, half_thickness, beveled);
+        }
+
+        emit(p1 + start, 1);
+        emit(p1 - start, 1);
+        emit(p2 + end, 2);
+        emit(p2 - end, 2);
+        EndPrimitive();
+
+        // Fill the outside of a beveled join, which is shared with the next segment:
+        if (beveled) {
+            // The outside is on the left of a right turn, and on the right of a left turn:
+            float side = dot(direction, next_normal) > 0.0 ? 1.0 : -1.0;
+            emit(p2, 2);
+            emit(p2 + normal * half_thickness * side, 2);
+            emit(p2 + next_normal * half_thickness * side, 2);
+            EndPrimitive();
+        }
+    }
+"""
+
+
 def get_default_shader() -> ShaderProgram:
     return pyglet.gl.current_context.create_program((vertex_source, 'vertex'),
                                                     (fragment_source, 'fragment'))
 
 
+def get_default_instanced_shader() -> ShaderProgram:
+    """Create and return the default shader used by :py:class:`ShapeInstancer`.
+
+    This method allows the module to be imported without an OpenGL Context.
+    """
+    return pyglet.gl.current_context.create_program((instanced_vertex_source, 'vertex'),
+                                                    (fragment_source, 'fragment'))
+
+
+def get_default_polyline_shader() -> ShaderProgram:
+    """Create and return the default shader used by :py:class:`Polyline`.
+
+    This method allows the module to be imported without an OpenGL Context.
+    """
+    return pyglet.gl.current_context.create_program((polyline_vertex_source, 'vertex'),
+                                                    (polyline_geometry_source, 'geometry'),
+                                                    (fragment_source, 'fragment'))
+
+
 def _rotate_point(center: tuple[float, float], point: tuple[float, float], angle: float) -> tuple[float, float]:
     prev_angle = math.atan2(point[1] - center[1], point[0] - center[0])
     now_angle = prev_angle + angle
@@ -242,6 +425,133 @@ def _get_segment(p0: tuple[float, float] | list[float], p1: tuple[float, float]
     return v_miter2, scale2, v1[0], v1[1], v2[0], v2[1], v3[0], v3[1], v4[0], v4[1], v5[0], v5[1], v6[0], v6[1]
 
 
+@lru_cache(maxsize=256)
+def _get_unit_arc(segments: int, angle: float) -> tuple[tuple[float, float], ...]:
+    """Return the points dividing an arc of a unit circle into segments.
+
+    The arc starts on the positive X axis, and spans ``angle`` radians.
+    Results are cached, so shapes only compute trigonometry when their
+    segment count or angle changes, and not when they are resized.
+    """
+    step = angle / segments
+    return tuple((math.cos(i * step), math.sin(i * step)) for i in range(segments + 1))
+
+
+@lru_cache(maxsize=64)
+def _get_unit_fan(segments: int) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """Return the X and Y coordinates of a triangle fan filling a unit circle."""
+    points = _get_unit_arc(segments, math.tau)
+    xs = []
+    ys = []
+    for i in range(segments):
+        (x1, y1), (x2, y2) = points[i - 1 if i else segments - 1], points[i]
+        xs += 0.0, x1, x2
+        ys += 0.0, y1, y2
+    return tuple(xs), tuple(ys)
+
+
+def _get_arc_points(x: float, y: float, radius: float, segments: int,
+                    angle: float, start: float) -> list[tuple[float, float]]:
+    """Return the points of an arc around ``(x, y)``, starting at ``start`` radians."""
+    cos_start = math.cos(start)
+    sin_start = math.sin(start)
+    rx = radius * cos_start
+    ry = radius * sin_start
+    return [(x + rx * c - ry * s, y + ry * c + rx * s) for c, s in _get_unit_arc(segments, angle)]
+
+
+def _get_arc_outline(points: Sequence[tuple[float, float]], closed: bool, wrap: bool,
+                     thickness: float) -> list[float]:
+    """Return the triangles of a thick line through the points of an arc."""
+    vertices = []
+    prev_miter = None
+    prev_scale = None
+    for i in range(len(points) - 1):
+        prev_point = None
+        next_point = None
+        if i > 0:
+            prev_point = points[i - 1]
+        elif closed:
+            prev_point = points[-1]
+        elif wrap:
+            prev_point = points[-2]
+
+        if i + 2 < len(points):
+            next_point = points[i + 2]
+        elif closed:
+            next_point = points[0]
+        elif wrap:
+            next_point = points[1]
+
+        prev_miter, prev_scale, *segment = _get_segment(prev_point, points[i], points[i + 1], next_point,
+                                                        thickness, prev_miter, prev_scale)
+        vertices.extend(segment)
+
+    if closed:
+        prev_point = None
+        next_point = None
+        if len(points) > 2:
+            prev_point = points[-2]
+            next_point = points[1]
+        prev_miter, prev_scale, *segment = _get_segment(prev_point, points[-1], points[0], next_point,
+                                                        thickness, prev_miter, prev_scale)
+        vertices.extend(segment)
+
+    return vertices
+
+
+@lru_cache(maxsize=256)
+def _get_unit_arc_outline(segments: int, angle: float, closed: bool,
+                          wrap: bool) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """Return the outline of a unit arc, split into positions and offsets.
+
+    The miters of an arc only depend on its angles, so the vertices of an
+    arc with any radius and thickness are ``radius * position + thickness * offset``.
+    """
+    points = _get_unit_arc(segments, angle)
+    outline = _get_arc_outline(points, closed, wrap, 1.0)
+
+    positions = []
+    for i in range(len(points) - 1):
+        (x1, y1), (x2, y2) = points[i], points[i + 1]
+        positions += x1, y1, x2, y2, x1, y1, x2, y2, x2, y2, x1, y1
+    if closed:
+        (x1, y1), (x2, y2) = points[-1], points[0]
+        positions += x1, y1, x2, y2, x1, y1, x2, y2, x2, y2, x1, y1
+
+    return tuple(positions), tuple(v - p for v, p in zip(outline, positions))
+
+
+@lru_cache(maxsize=64)
+def _triangulate(vertices: tuple[float, ...]) -> tuple[int, ...]:
+    """Triangulate a polygon, given as flat coordinates relative to its first point.
+
+    Moving a polygon does not change these coordinates, so the cached
+    triangulation is reused, as it is for polygons with the same outline.
+    """
+    return tuple(earcut.earcut(vertices))
+
+
+def _is_triangulation_valid(vertices: Sequence[float], indices: Sequence[int]) -> bool:
+    """Check whether all triangles of a polygon have the same, non-zero, winding.
+
+    A triangulation of a simple polygon stays valid as its points move, as
+    long as no triangle is flipped or collapsed.
+    """
+    if not indices:
+        return False
+
+    winding = 0.0
+    for i in range(0, len(indices), 3):
+        a, b, c = indices[i] * 2, indices[i + 1] * 2, indices[i + 2] * 2
+        ax, ay = vertices[a], vertices[a + 1]
+        cross = (vertices[b] - ax) * (vertices[c + 1] - ay) - (vertices[b + 1] - ay) * (vertices[c] - ax)
+        if cross * winding < 0 or cross == 0:
+            return False
+        winding = cross
+    return True
+
+
 class _ShapeGroup(Group):
     """Shared Shape rendering Group.
 
@@ -279,6 +589,13 @@ class _ShapeGroup(Group):
         glDisable(GL_BLEND)
         self.program.unbind()
 
+    def has_same_state(self, other: Group) -> bool:
+        # Subclasses may set state of their own, so they are never coalesced:
+        return (self.__class__ is _ShapeGroup and other.__class__ is _ShapeGroup and
+                self.program == other.program and
+                self.blend_src == other.blend_src and
+                self.blend_dest == other.blend_dest)
+
     def __eq__(self, other: Group | _ShapeGroup) -> None:
         return (other.__class__ is self.__class__ and
                 self.program == other.program and
@@ -290,6 +607,14 @@ class _ShapeGroup(Group):
         return hash((self.program, self.parent, self.blend_src, self.blend_dest))
 
 
+# Updates of the vertex data of a shape, see ShapeBase._schedule_update:
+_UPDATE_VERTICES = 1
+_UPDATE_TRANSLATION = 2
+_UPDATE_COLOR = 4
+_UPDATE_ROTATION = 8
+_UPDATE_ZPOSITION = 16
+
+
 class ShapeBase(ABC):
     """Base class for all shape objects.
 
@@ -314,6 +639,7 @@ class ShapeBase(ABC):
     _batch: Batch | None = None
     _group: _ShapeGroup | Group | None = None
     _num_verts: int = 0
+    _pending_updates: int = 0
     _user_group: Group | None = None
     _vertex_list = None
     _draw_mode: int = GL_TRIANGLES
@@ -386,6 +712,50 @@ class ShapeBase(ABC):
     def _update_translation(self) -> None:
         self._vertex_list.translation[:] = (self._x, self._y) * self._num_verts
 
+    def _update_rotation(self) -> None:
+        self._vertex_list.rotation[:] = (self._rotation,) * self._num_verts
+
+    def _update_zposition(self) -> None:
+        self._vertex_list.zposition[:] = (self._z,) * self._num_verts
+
+    def _schedule_update(self, updates: int) -> None:
+        """Update the vertex data of the shape before it is next drawn.
+
+        Shapes in a :py:class:`~pyglet.graphics.Batch` combine all changes
+        made between draws, so each kind of update is only done once, just
+        before the batch is drawn. Other shapes are updated immediately.
+
+        Args:
+            updates:
+                The updates to make, combined from the ``_UPDATE_*`` flags.
+        """
+        if self._batch is None:
+            self._pending_updates |= updates
+            self._apply_updates()
+            return
+
+        if not self._pending_updates:
+            self._batch.schedule_update(self._apply_updates)
+        self._pending_updates |= updates
+
+    def _apply_updates(self) -> None:
+        updates = self._pending_updates
+        self._pending_updates = 0
+        if self._vertex_list is None:
+            # The shape was deleted.
+            return
+
+        if updates & _UPDATE_VERTICES:
+            self._update_vertices()
+        if updates & _UPDATE_TRANSLATION:
+            self._update_translation()
+        if updates & _UPDATE_COLOR:
+            self._update_color()
+        if updates & _UPDATE_ROTATION:
+            self._update_rotation()
+        if updates & _UPDATE_ZPOSITION:
+            self._update_zposition()
+
     def _create_vertex_list(self) -> None:
         """Build internal vertex list.
 
@@ -451,7 +821,7 @@ class ShapeBase(ABC):
         self._group = self.get_shape_group()
 
         if (self._batch and
-                self._batch.update_shader(self._vertex_list, GL_TRIANGLES, self._group, program)):
+                self._batch.update_shader(self._vertex_list, self._draw_mode, self._group, program)):
             # Exit early if changing domain is not needed.
             return
 
@@ -490,7 +860,7 @@ class ShapeBase(ABC):
     @rotation.setter
     def rotation(self, rotation: float) -> None:
         self._rotation = rotation
-        self._vertex_list.rotation[:] = (rotation,) * self._num_verts
+        self._schedule_update(_UPDATE_ROTATION)
 
     def draw(self) -> None:
         """Debug method to draw a single shape at its current position.
@@ -501,6 +871,8 @@ class ShapeBase(ABC):
                      and call its :py:meth:`~Batch.draw` method.
 
         """
+        if self._pending_updates:
+            self._apply_updates()
         self._group.set_state_recursive()
         self._vertex_list.draw(self._draw_mode)
         self._group.unset_state_recursive()
@@ -536,7 +908,7 @@ class ShapeBase(ABC):
     @x.setter
     def x(self, value: float) -> None:
         self._x = value
-        self._update_translation()
+        self._schedule_update(_UPDATE_TRANSLATION)
 
     @property
     def y(self) -> float:
@@ -555,7 +927,7 @@ class ShapeBase(ABC):
     @y.setter
     def y(self, value: float) -> None:
         self._y = value
-        self._update_translation()
+        self._schedule_update(_UPDATE_TRANSLATION)
 
     @property
     def z(self) -> float:
@@ -571,7 +943,7 @@ class ShapeBase(ABC):
     @z.setter
     def z(self, value: float) -> None:
         self._z = value
-        self._vertex_list.zposition = (value,) * self._num_verts
+        self._schedule_update(_UPDATE_ZPOSITION)
 
     @property
     def position(self) -> tuple[float, float]:
@@ -599,7 +971,7 @@ class ShapeBase(ABC):
     @position.setter
     def position(self, values: tuple[float, float]) -> None:
         self._x, self._y = values
-        self._update_translation()
+        self._schedule_update(_UPDATE_TRANSLATION)
 
     @property
     def anchor_x(self) -> float:
@@ -613,7 +985,7 @@ class ShapeBase(ABC):
     @anchor_x.setter
     def anchor_x(self, value: float) -> None:
         self._anchor_x = value
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
     @property
     def anchor_y(self) -> float:
@@ -627,7 +999,7 @@ class ShapeBase(ABC):
     @anchor_y.setter
     def anchor_y(self, value: float) -> None:
         self._anchor_y = value
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
     @property
     def anchor_position(self) -> tuple[float, float]:
@@ -649,7 +1021,7 @@ class ShapeBase(ABC):
     @anchor_position.setter
     def anchor_position(self, values: tuple[float, float]) -> None:
         self._anchor_x, self._anchor_y = values
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
     @property
     def color(self) -> tuple[int, int, int, int]:
@@ -678,7 +1050,7 @@ class ShapeBase(ABC):
         else:
             self._rgba = r, g, b, self._rgba[3]
 
-        self._update_color()
+        self._schedule_update(_UPDATE_COLOR)
 
     @property
     def opacity(self) -> int:
@@ -713,7 +1085,7 @@ class ShapeBase(ABC):
     @opacity.setter
     def opacity(self, value: int) -> None:
         self._rgba = (*self._rgba[:3], value)
-        self._update_color()
+        self._schedule_update(_UPDATE_COLOR)
 
     @property
     def visible(self) -> bool:
@@ -726,7 +1098,7 @@ class ShapeBase(ABC):
     @visible.setter
     def visible(self, value: bool) -> None:
         self._visible = value
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
     @property
     def group(self) -> Group | None:
@@ -767,6 +1139,10 @@ class ShapeBase(ABC):
         if self._batch == batch:
             return
 
+        # The previous batch would apply these updates only when it is drawn:
+        if self._pending_updates:
+            self._apply_updates()
+
         if batch is not None and self._batch is not None:
             self._batch.migrate(self._vertex_list, self._draw_mode, self._group, batch)
             self._batch = batch
@@ -872,48 +1248,25 @@ class Arc(ShapeBase):
         x = -self._anchor_x
         y = -self._anchor_y
         r = self._radius
-        segment_radians = math.radians(self._angle) / self._segments
+        t = self._thickness
         start_radians = math.radians(self._start_angle - self._rotation)
-
-        # Calculate the outer points of the arc:
-        points = [(x + (r * math.cos((i * segment_radians) + start_radians)),
-                   y + (r * math.sin((i * segment_radians) + start_radians))) for i in range(self._segments + 1)]
-
-        # Create a list of quads from the points
-        vertices = []
-        prev_miter = None
-        prev_scale = None
-        for i in range(len(points) - 1):
-            prev_point = None
-            next_point = None
-            if i > 0:
-                prev_point = points[i - 1]
-            elif self._closed:
-                prev_point = points[-1]
-            elif abs(self._angle - math.tau) <= 1e-9:
-                prev_point = points[-2]
-
-            if i + 2 < len(points):
-                next_point = points[i + 2]
-            elif self._closed:
-                next_point = points[0]
-            elif abs(self._angle - math.tau) <= 1e-9:
-                next_point = points[1]
-
-            prev_miter, prev_scale, *segment = _get_segment(prev_point, points[i], points[i + 1], next_point,
-                                                            self._thickness, prev_miter, prev_scale)
-            vertices.extend(segment)
-
-        if self._closed:
-            prev_point = None
-            next_point = None
-            if len(points) > 2:
-                prev_point = points[-2]
-                next_point = points[1]
-            prev_miter, prev_scale, *segment = _get_segment(prev_point, points[-1], points[0], next_point,
-                                                            self._thickness, prev_miter, prev_scale)
-            vertices.extend(segment)
-
+        cos_start = math.cos(start_radians)
+        sin_start = math.sin(start_radians)
+
+        if r <= 0:
+            # The miters of a degenerate arc are not defined by its angles:
+            points = _get_arc_points(x, y, r, self._segments, math.radians(self._angle), start_radians)
+            return _get_arc_outline(points, self._closed, abs(self._angle - math.tau) <= 1e-9, t)
+
+        positions, offsets = _get_unit_arc_outline(self._segments, math.radians(self._angle), self._closed,
+                                                   abs(self._angle - math.tau) <= 1e-9)
+
+        # Scale the unit outline, then rotate it to the start angle:
+        xs = [r * p + t * o for p, o in zip(positions[0::2], offsets[0::2])]
+        ys = [r * p + t * o for p, o in zip(positions[1::2], offsets[1::2])]
+        vertices = [0.0] * len(positions)
+        vertices[0::2] = [x + vx * cos_start - vy * sin_start for vx, vy in zip(xs, ys)]
+        vertices[1::2] = [y + vx * sin_start + vy * cos_start for vx, vy in zip(xs, ys)]
         return vertices
 
     def _update_vertices(self) -> None:
@@ -927,7 +1280,7 @@ class Arc(ShapeBase):
     @radius.setter
     def radius(self, value: float) -> None:
         self._radius = value
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
     @property
     def thickness(self) -> float:
@@ -937,7 +1290,7 @@ class Arc(ShapeBase):
     @thickness.setter
     def thickness(self, thickness: float) -> None:
         self._thickness = thickness
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
     @property
     def angle(self) -> float:
@@ -947,7 +1300,7 @@ class Arc(ShapeBase):
     @angle.setter
     def angle(self, value: float) -> None:
         self._angle = value
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
     @property
     def start_angle(self) -> float:
@@ -957,7 +1310,7 @@ class Arc(ShapeBase):
     @start_angle.setter
     def start_angle(self, angle: float) -> None:
         self._start_angle = angle
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
 
 class BezierCurve(ShapeBase):
@@ -1080,7 +1433,7 @@ class BezierCurve(ShapeBase):
     @points.setter
     def points(self, value: list[tuple[float, float]]) -> None:
         self._points = value
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
     @property
     def t(self) -> float:
@@ -1090,7 +1443,7 @@ class BezierCurve(ShapeBase):
     @t.setter
     def t(self, value: float) -> None:
         self._t = value
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
     @property
     def thickness(self) -> float:
@@ -1100,7 +1453,7 @@ class BezierCurve(ShapeBase):
     @thickness.setter
     def thickness(self, thickness: float) -> None:
         self._thickness = thickness
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
 
 class Circle(ShapeBase):
@@ -1179,18 +1532,12 @@ class Circle(ShapeBase):
         x = -self._anchor_x
         y = -self._anchor_y
         r = self._radius
-        tau_segs = math.pi * 2 / self._segments
-
-        # Calculate the outer points of the circle:
-        points = [(x + (r * math.cos(i * tau_segs)),
-                   y + (r * math.sin(i * tau_segs))) for i in range(self._segments)]
-
-        # Create a list of triangles from the points:
-        vertices = []
-        for i, point in enumerate(points):
-            triangle = x, y, *points[i - 1], *point
-            vertices.extend(triangle)
 
+        # Scale the cached triangles of a unit circle:
+        xs, ys = _get_unit_fan(self._segments)
+        vertices = [0.0] * (len(xs) * 2)
+        vertices[0::2] = [x + r * u for u in xs]
+        vertices[1::2] = [y + r * v for v in ys]
         return vertices
 
     def _update_vertices(self) -> None:
@@ -1204,7 +1551,7 @@ class Circle(ShapeBase):
     @radius.setter
     def radius(self, value: float) -> None:
         self._radius = value
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
 
 class Ellipse(ShapeBase):
@@ -1296,18 +1643,14 @@ class Ellipse(ShapeBase):
 
         x = -self._anchor_x
         y = -self._anchor_y
-        tau_segs = math.pi * 2 / self._segments
-
-        # Calculate the points of the ellipse by formula:
-        points = [(x + self._a * math.cos(i * tau_segs),
-                   y + self._b * math.sin(i * tau_segs)) for i in range(self._segments)]
-
-        # Create a list of triangles from the points:
-        vertices = []
-        for i, point in enumerate(points):
-            triangle = x, y, *points[i - 1], *point
-            vertices.extend(triangle)
-
+        a = self._a
+        b = self._b
+
+        # Scale the cached triangles of a unit circle:
+        xs, ys = _get_unit_fan(self._segments)
+        vertices = [0.0] * (len(xs) * 2)
+        vertices[0::2] = [x + a * u for u in xs]
+        vertices[1::2] = [y + b * v for v in ys]
         return vertices
 
     def _update_vertices(self) -> None:
@@ -1321,7 +1664,7 @@ class Ellipse(ShapeBase):
     @a.setter
     def a(self, value: float) -> None:
         self._a = value
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
     @property
     def b(self) -> float:
@@ -1331,7 +1674,7 @@ class Ellipse(ShapeBase):
     @b.setter
     def b(self, value: float) -> None:
         self._b = value
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
 
 class Sector(ShapeBase):
@@ -1429,13 +1772,10 @@ class Sector(ShapeBase):
 
         x = -self._anchor_x
         y = -self._anchor_y
-        r = self._radius
-        segment_radians = math.radians(self._angle) / self._segments
         start_radians = math.radians(self._start_angle - self._rotation)
 
         # Calculate the outer points of the sector.
-        points = [(x + (r * math.cos((i * segment_radians) + start_radians)),
-                   y + (r * math.sin((i * segment_radians) + start_radians))) for i in range(self._segments + 1)]
+        points = _get_arc_points(x, y, self._radius, self._segments, math.radians(self._angle), start_radians)
 
         # Create a list of triangles from the points
         vertices = []
@@ -1456,7 +1796,7 @@ class Sector(ShapeBase):
     @angle.setter
     def angle(self, value: float) -> None:
         self._angle = value
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
     @property
     def start_angle(self) -> float:
@@ -1466,7 +1806,7 @@ class Sector(ShapeBase):
     @start_angle.setter
     def start_angle(self, angle: float) -> None:
         self._start_angle = angle
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
     @property
     def radius(self) -> float:
@@ -1480,7 +1820,7 @@ class Sector(ShapeBase):
     @radius.setter
     def radius(self, value: float) -> None:
         self._radius = value
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
 
 class Line(ShapeBase):
@@ -1601,7 +1941,7 @@ class Line(ShapeBase):
     @thickness.setter
     def thickness(self, thickness: float) -> None:
         self._thickness = thickness
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
     @property
     def x2(self) -> float:
@@ -1611,7 +1951,7 @@ class Line(ShapeBase):
     @x2.setter
     def x2(self, value: float) -> None:
         self._x2 = value
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
     @property
     def y2(self) -> float:
@@ -1621,7 +1961,7 @@ class Line(ShapeBase):
     @y2.setter
     def y2(self, value: float) -> None:
         self._y2 = value
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
 
 class Rectangle(ShapeBase):
@@ -1717,7 +2057,7 @@ class Rectangle(ShapeBase):
     @width.setter
     def width(self, value: float) -> None:
         self._width = value
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
     @property
     def height(self) -> float:
@@ -1731,7 +2071,7 @@ class Rectangle(ShapeBase):
     @height.setter
     def height(self, value: float) -> None:
         self._height = value
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
 
 class BorderedRectangle(ShapeBase):
@@ -1869,7 +2209,7 @@ class BorderedRectangle(ShapeBase):
     @border.setter
     def border(self, thickness: float) -> None:
         self._border = thickness
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
     @property
     def width(self) -> float:
@@ -1883,7 +2223,7 @@ class BorderedRectangle(ShapeBase):
     @width.setter
     def width(self, value: float) -> None:
         self._width = value
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
     @property
     def height(self) -> float:
@@ -1897,7 +2237,7 @@ class BorderedRectangle(ShapeBase):
     @height.setter
     def height(self, value: float) -> None:
         self._height = value
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
     @property
     def border_color(self) -> tuple[int, int, int, int]:
@@ -1932,7 +2272,7 @@ class BorderedRectangle(ShapeBase):
         self._border_rgba = r, g, b, alpha
         self._rgba = *self._rgba[:3], alpha
 
-        self._update_color()
+        self._schedule_update(_UPDATE_COLOR)
 
     @property
     def color(self) -> tuple[int, int, int, int] | tuple[int, int, int]:
@@ -1968,7 +2308,7 @@ class BorderedRectangle(ShapeBase):
 
         self._rgba = r, g, b, alpha
         self._border_rgba = *self._border_rgba[:3], alpha
-        self._update_color()
+        self._schedule_update(_UPDATE_COLOR)
 
 
 class Box(ShapeBase):
@@ -2087,7 +2427,7 @@ class Box(ShapeBase):
     @width.setter
     def width(self, value: float) -> None:
         self._width = value
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
     @property
     def height(self) -> float:
@@ -2101,7 +2441,7 @@ class Box(ShapeBase):
     @height.setter
     def height(self, value: float) -> None:
         self._height = float(value)
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
     @property
     def thickness(self) -> float:
@@ -2111,7 +2451,7 @@ class Box(ShapeBase):
     @thickness.setter
     def thickness(self, thickness: float) -> None:
         self._thickness = thickness
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
 
 _RadiusT = Union[float, Tuple[float, float]]
@@ -2280,7 +2620,7 @@ class RoundedRectangle(pyglet.shapes.ShapeBase):
     @width.setter
     def width(self, value: float) -> None:
         self._width = value
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
     @property
     def height(self) -> float:
@@ -2294,7 +2634,7 @@ class RoundedRectangle(pyglet.shapes.ShapeBase):
     @height.setter
     def height(self, value: float) -> None:
         self._height = value
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
     @property
     def radius(self) -> tuple[tuple[float, float], tuple[float, float], tuple[float, float], tuple[float, float]]:
@@ -2303,7 +2643,7 @@ class RoundedRectangle(pyglet.shapes.ShapeBase):
     @radius.setter
     def radius(self, value: _RadiusT | tuple[_RadiusT, _RadiusT, _RadiusT, _RadiusT]) -> None:
         self._set_radius(value)
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
 
 class Triangle(ShapeBase):
@@ -2401,7 +2741,7 @@ class Triangle(ShapeBase):
     @x2.setter
     def x2(self, value: float) -> None:
         self._x2 = value
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
     @property
     def y2(self) -> float:
@@ -2411,7 +2751,7 @@ class Triangle(ShapeBase):
     @y2.setter
     def y2(self, value: float) -> None:
         self._y2 = value
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
     @property
     def x3(self) -> float:
@@ -2421,7 +2761,7 @@ class Triangle(ShapeBase):
     @x3.setter
     def x3(self, value: float) -> None:
         self._x3 = value
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
     @property
     def y3(self) -> float:
@@ -2431,7 +2771,7 @@ class Triangle(ShapeBase):
     @y3.setter
     def y3(self, value: float) -> None:
         self._y3 = value
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
 
 class Star(ShapeBase):
@@ -2554,7 +2894,7 @@ class Star(ShapeBase):
     @outer_radius.setter
     def outer_radius(self, value: float) -> None:
         self._outer_radius = value
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
     @property
     def inner_radius(self) -> float:
@@ -2564,7 +2904,7 @@ class Star(ShapeBase):
     @inner_radius.setter
     def inner_radius(self, value: float) -> None:
         self._inner_radius = value
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
     @property
     def num_spikes(self) -> int:
@@ -2574,7 +2914,7 @@ class Star(ShapeBase):
     @num_spikes.setter
     def num_spikes(self, value: int) -> None:
         self._num_spikes = value
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
 
 
 class Polygon(ShapeBase):
@@ -2616,6 +2956,7 @@ class Polygon(ShapeBase):
         self._rotation = 0
         self._coordinates = list(coordinates)
         self._x, self._y = self._coordinates[0]
+        self._relative = self._get_relative_coordinates()
 
         r, g, b, *a = color
         self._rgba = r, g, b, a[0] if a else 255
@@ -2626,17 +2967,23 @@ class Polygon(ShapeBase):
 
     def __contains__(self, point: tuple[float, float]) -> bool:
         assert len(point) == 2
-        point = _rotate_point(self._coordinates[0], point, math.radians(self._rotation))
-        return _point_in_polygon(self._coordinates + [self._coordinates[0]], point)
+        coordinates = self.coordinates
+        point = _rotate_point(coordinates[0], point, math.radians(self._rotation))
+        return _point_in_polygon(coordinates + [coordinates[0]], point)
+
+    def _get_relative_coordinates(self) -> tuple[float, ...]:
+        x0, y0 = self._coordinates[0]
+        return tuple(value for x, y in self._coordinates for value in (x - x0, y - y0))
 
     def _create_vertex_list(self) -> None:
-        vertices = self._get_vertices()
+        self._indices = _triangulate(self._relative)
         self._vertex_list = self._program.vertex_list_indexed(
             self._num_verts, self._draw_mode,
-            earcut.earcut(vertices),
+            self._indices,
             self._batch, self._group,
-            position=('f', vertices),
+            position=('f', self._get_vertices()),
             color=('Bn', self._rgba * self._num_verts),
+            rotation=('f', (self._rotation,) * self._num_verts),
             translation=('f', (self._x, self._y) * self._num_verts))
 
     def _get_vertices(self) -> Sequence[float]:
@@ -2644,17 +2991,59 @@ class Polygon(ShapeBase):
             return (0, 0) * self._num_verts
 
         # Adjust all coordinates by the anchor.
-        trans_x, trans_y = self._coordinates[0]
-        trans_x += self._anchor_x
-        trans_y += self._anchor_y
-        coords = [[x - trans_x, y - trans_y] for x, y in self._coordinates]
-
-        # Return the flattened coords.
-        return earcut.flatten([coords])["vertices"]
+        relative = self._relative
+        vertices = [0.0] * len(relative)
+        vertices[0::2] = [x - self._anchor_x for x in relative[0::2]]
+        vertices[1::2] = [y - self._anchor_y for y in relative[1::2]]
+        return vertices
 
     def _update_vertices(self) -> None:
         self._vertex_list.position[:] = self._get_vertices()
 
+    @property
+    def coordinates(self) -> list[tuple[float, float]]:
+        """Get/set the coordinates of the polygon's points.
+
+        Moving all points by the same offset only updates the polygon's
+        :py:attr:`.position`. If the number of points is unchanged, and no
+        triangle of the current triangulation is flipped by the new
+        coordinates, the triangulation is reused instead of recomputed.
+        """
+        relative = self._relative
+        return [(self._x + x, self._y + y) for x, y in zip(relative[0::2], relative[1::2])]
+
+    @coordinates.setter
+    def coordinates(self, coordinates: Sequence[tuple[float, float]]) -> None:
+        old_x, old_y = self._x, self._y
+        self._coordinates = list(coordinates)
+        self._x, self._y = self._coordinates[0]
+        relative = self._get_relative_coordinates()
+
+        # Subtracting the first point is not exact, so allow for rounding errors:
+        tolerance = 1e-9 * (1 + max(abs(old_x), abs(old_y), abs(self._x), abs(self._y)))
+        if len(relative) != len(self._relative) or any(
+                abs(new - old) > tolerance * (1 + abs(old)) for new, old in zip(relative, self._relative)):
+            self._relative = relative
+            if len(self._coordinates) != self._num_verts:
+                # The vertex list must be resized:
+                self._num_verts = len(self._coordinates)
+                self._vertex_list.delete()
+                self._create_vertex_list()
+                return
+
+            if not _is_triangulation_valid(relative, self._indices):
+                indices = _triangulate(relative)
+                if len(indices) != len(self._indices):
+                    self._vertex_list.delete()
+                    self._create_vertex_list()
+                    return
+                self._indices = indices
+                self._vertex_list.indices = indices
+
+            self._schedule_update(_UPDATE_VERTICES)
+
+        self._schedule_update(_UPDATE_TRANSLATION)
+
 
 class MultiLine(ShapeBase):
 
@@ -2763,8 +3152,623 @@ class MultiLine(ShapeBase):
     @thickness.setter
     def thickness(self, thickness: float) -> None:
         self._thickness = thickness
-        self._update_vertices()
+        self._schedule_update(_UPDATE_VERTICES)
+
+
+class Polyline(ShapeBase):
+    """Multiple connected lines, expanded into segments on the GPU.
+
+    Unlike :py:class:`MultiLine`, only the points of the line are stored.
+    A geometry shader expands each segment into a quad, with miter joins
+    between segments, or bevel joins where the angle between them is too
+    sharp. This makes it well suited to lines with many points, such as
+    graphs and plots.
+
+    Points can be added to the end of the line with :py:meth:`add_points`.
+    Only the new points are sent to the GPU.
+    """
+
+    _draw_mode: int = GL_LINE_STRIP_ADJACENCY
+
+    def __init__(
+            self,
+            *coordinates: tuple[float, float] | Sequence[float],
+            closed: bool = False,
+            thickness: float = 1.0,
+            color: tuple[int, int, int, int] = (255, 255, 255, 255),
+            blend_src: int = GL_SRC_ALPHA,
+            blend_dest: int = GL_ONE_MINUS_SRC_ALPHA,
+            batch: Batch | None = None,
+            group: Group | None = None,
+            program: ShaderProgram | None = None,
+    ) -> None:
+        """Create multiple connected lines from a series of coordinates.
+
+        The shape's anchor point defaults to the first vertex point.
+
+        Args:
+            coordinates:
+                The coordinates for each point in the shape. Each must
+                unpack like a tuple consisting of an X and Y float-like
+                value.
+            closed:
+                Set this to ``True`` to add a line connecting the first
+                and last points. The default is ``False``
+            thickness:
+                The desired thickness or width used for the line segments.
+            color:
+                The RGB or RGBA color of the shape, specified as a
+                tuple of 3 or 4 ints in the range of 0-255. RGB colors
+                will be treated as having an opacity of 255.
+            blend_src:
+                OpenGL blend source mode; for example, ``GL_SRC_ALPHA``.
+            blend_dest:
+                OpenGL blend destination mode; for example, ``GL_ONE_MINUS_SRC_ALPHA``.
+            batch:
+                Optional batch to add the shape to.
+            group:
+                Optional parent group of the shape.
+            program:
+                Optional shader program of the shape. It must have a
+                geometry shader taking ``lines_adjacency`` input, such as
+                the one from :py:func:`get_default_polyline_shader`.
+        """
+        self._thickness = thickness
+        self._closed = closed
+        self._rotation = 0
+        self._coordinates = list(coordinates)
+        self._x, self._y = self._coordinates[0]
+
+        r, g, b, *a = color
+        self._rgba = r, g, b, a[0] if a else 255
+
+        super().__init__(
+            self._get_vertex_count(),
+            blend_src, blend_dest, batch, group, program or get_default_polyline_shader(),
+        )
+
+    def _get_vertex_count(self) -> int:
+        # The points are drawn as a line strip with adjacency. It starts with the point before
+        # the first segment, and ends with the point after the last one. For open lines these
+        # have no thickness, and closed lines wrap around to the first two points. The second
+        # point is only used for the last join, so has a negative thickness.
+        return len(self._coordinates) + (3 if self._closed else 2)
+
+    def _create_vertex_list(self) -> None:
+        self._vertex_list = self._program.vertex_list(
+            self._num_verts, self._draw_mode, self._batch, self._group,
+            position=('f', self._get_vertices()),
+            thickness=('f', self._get_thicknesses()),
+            color=('Bn', self._rgba * self._num_verts),
+            zposition=('f', (self._z,) * self._num_verts),
+            rotation=('f', (self._rotation,) * self._num_verts),
+            translation=('f', (self._x, self._y) * self._num_verts))
+
+    def _get_point_vertices(self, start: int, stop: int) -> list[float]:
+        trans_x, trans_y = self._coordinates[0]
+        trans_x += self._anchor_x
+        trans_y += self._anchor_y
+        return [value for x, y in self._coordinates[start:stop] for value in (x - trans_x, y - trans_y)]
+
+    def _get_vertices(self) -> Sequence[float]:
+        vertices = self._get_point_vertices(0, len(self._coordinates))
+        if self._closed:
+            vertices = vertices[-2:] + vertices + (vertices * 2)[:4]
+        else:
+            vertices = [0.0, 0.0, *vertices]
+
+        # Vertices past the end of the line are unused capacity:
+        return vertices + [0.0] * (self._num_verts * 2 - len(vertices))
+
+    def _get_thicknesses(self) -> Sequence[float]:
+        thickness = self._thickness if self._visible else 0.0
+        count = self._get_vertex_count()
+        thicknesses = [thickness] * count
+        if self._closed:
+            thicknesses[-1] = -thickness
+        else:
+            thicknesses[0] = thicknesses[-1] = 0.0
+        return thicknesses + [0.0] * (self._num_verts - count)
+
+    def _update_vertices(self) -> None:
+        self._vertex_list.position[:] = self._get_vertices()
+        self._vertex_list.thickness[:] = self._get_thicknesses()
+
+    def _set_region(self, name: str, start: int, count: int, data: Sequence[float]) -> None:
+        buffer = self._vertex_list.domain.attrib_name_buffers[name]
+        buffer.set_region(self._vertex_list.start + start, count, data)
+
+    def add_points(self, *coordinates: tuple[float, float] | Sequence[float]) -> None:
+        """Add points to the end of the line.
+
+        Only the new points are sent to the GPU. Space for more points is
+        reserved as the line grows, so adding points takes time proportional
+        to the number of new points.
+
+        Args:
+            coordinates:
+                The coordinates of each new point. Each must unpack like a
+                tuple consisting of an X and Y float-like value.
+        """
+        if not coordinates:
+            return
+
+        old_count = len(self._coordinates)
+        self._coordinates.extend(coordinates)
+
+        vertex_count = self._get_vertex_count()
+        if vertex_count > self._num_verts:
+            # Grow the vertex list, and fill the new vertices with the shape's attributes:
+            old_num_verts = self._num_verts
+            self._num_verts = max(vertex_count, self._num_verts * 2)
+            self._vertex_list.resize(self._num_verts)
+            new = self._num_verts - old_num_verts
+            self._set_region('position', old_num_verts, new, (0.0, 0.0) * new)
+            self._set_region('thickness', old_num_verts, new, (0.0,) * new)
+            self._set_region('color', old_num_verts, new, self._rgba * new)
+            self._set_region('zposition', old_num_verts, new, (self._z,) * new)
+            self._set_region('rotation', old_num_verts, new, (self._rotation,) * new)
+            self._set_region('translation', old_num_verts, new, (self._x, self._y) * new)
+
+        # The new points start at the previous end of the line:
+        vertices = self._get_point_vertices(old_count, len(self._coordinates))
+        if self._closed:
+            vertices += self._get_point_vertices(0, 2)
+            self._set_region('position', 0, 1, vertices[-6:-4])
+        count = len(vertices) // 2
+        thicknesses = [self._thickness if self._visible else 0.0] * count
+        if self._closed:
+            thicknesses[-1] = -thicknesses[-1]
+        self._set_region('position', old_count + 1, count, vertices)
+        self._set_region('thickness', old_count + 1, count, thicknesses)
+
+    @property
+    def coordinates(self) -> list[tuple[float, float]]:
+        """Get/set the coordinates of the line's points.
+
+        Setting the coordinates sends all points to the GPU. Use
+        :py:meth:`add_points` to add points to the end of the line.
+        """
+        return list(self._coordinates)
+
+    @coordinates.setter
+    def coordinates(self, coordinates: Sequence[tuple[float, float]]) -> None:
+        self._coordinates = list(coordinates)
+        self._x, self._y = self._coordinates[0]
+        if self._get_vertex_count() > self._num_verts:
+            self._num_verts = self._get_vertex_count()
+            self._vertex_list.delete()
+            self._create_vertex_list()
+            return
+
+        self._schedule_update(_UPDATE_VERTICES)
+        self._schedule_update(_UPDATE_TRANSLATION)
+
+    @property
+    def thickness(self) -> float:
+        """Get/set the line thickness of the polyline."""
+        return self._thickness
+
+    @thickness.setter
+    def thickness(self, thickness: float) -> None:
+        self._thickness = thickness
+        self._vertex_list.thickness[:] = self._get_thicknesses()
+
+    @property
+    def visible(self) -> bool:
+        """Get/set whether the shape will be drawn at all."""
+        return self._visible
+
+    @visible.setter
+    def visible(self, value: bool) -> None:
+        self._visible = value
+        self._vertex_list.thickness[:] = self._get_thicknesses()
+
+
+class InstancedShape(InstanceRecord):
+    """A lightweight shape, drawn as one instance of a :py:class:`ShapeInstancer`.
+
+    Instanced shapes are created with :py:meth:`ShapeInstancer.create`. They
+    share the mesh of their instancer, and only store a position, size,
+    rotation, thickness and color.
+    """
+
+    __slots__ = ('_height', '_rgba', '_rotation', '_thickness', '_visible', '_width', '_x', '_y', '_z')
+
+    def __init__(self, instancer: ShapeInstancer, index: int,
+                 x: float, y: float, z: float, width: float, height: float,
+                 rotation: float, thickness: float, rgba: tuple[int, int, int, int]) -> None:
+        """Create an instanced shape.
+
+        Applications should use :py:meth:`ShapeInstancer.create` instead.
+        """
+        super().__init__(instancer, index)
+        self._x = x
+        self._y = y
+        self._z = z
+        self._width = width
+        self._height = height
+        self._rotation = rotation
+        self._thickness = thickness
+        self._rgba = rgba
+        self._visible = True
+
+    def _write(self) -> None:
+        self._update_translation()
+        self._update_zposition()
+        self._update_size()
+        self._update_rotation()
+        self._update_color()
+
+    def _update_translation(self) -> None:
+        self._instancer._translation.set_region(self._index, 1, (self._x, self._y))  # noqa: SLF001
+
+    def _update_zposition(self) -> None:
+        self._instancer._zposition.set_region(self._index, 1, (self._z,))  # noqa: SLF001
+
+    def _update_size(self) -> None:
+        # Hidden shapes are collapsed to a point:
+        if self._visible:
+            size, thickness = (self._width, self._height), (self._thickness,)
+        else:
+            size, thickness = (0, 0), (0,)
+        self._instancer._size.set_region(self._index, 1, size)  # noqa: SLF001
+        self._instancer._thickness.set_region(self._index, 1, thickness)  # noqa: SLF001
+
+    def _update_rotation(self) -> None:
+        self._instancer._rotation.set_region(self._index, 1, (self._rotation,))  # noqa: SLF001
+
+    def _update_color(self) -> None:
+        self._instancer._color.set_region(self._index, 1, self._rgba)  # noqa: SLF001
+
+    @property
+    def x(self) -> float:
+        """Get/set the X coordinate of the shape."""
+        return self._x
+
+    @x.setter
+    def x(self, value: float) -> None:
+        self._x = value
+        self._update_translation()
+
+    @property
+    def y(self) -> float:
+        """Get/set the Y coordinate of the shape."""
+        return self._y
+
+    @y.setter
+    def y(self, value: float) -> None:
+        self._y = value
+        self._update_translation()
+
+    @property
+    def z(self) -> float:
+        """Get/set the Z coordinate of the shape."""
+        return self._z
+
+    @z.setter
+    def z(self, value: float) -> None:
+        self._z = value
+        self._update_zposition()
+
+    @property
+    def position(self) -> tuple[float, float]:
+        """Get/set the ``(x, y)`` coordinates of the shape."""
+        return self._x, self._y
+
+    @position.setter
+    def position(self, values: tuple[float, float]) -> None:
+        self._x, self._y = values
+        self._update_translation()
+
+    @property
+    def width(self) -> float:
+        """Get/set the horizontal size the mesh is scaled to."""
+        return self._width
+
+    @width.setter
+    def width(self, value: float) -> None:
+        self._width = value
+        self._update_size()
+
+    @property
+    def height(self) -> float:
+        """Get/set the vertical size the mesh is scaled to."""
+        return self._height
+
+    @height.setter
+    def height(self, value: float) -> None:
+        self._height = value
+        self._update_size()
+
+    @property
+    def size(self) -> tuple[float, float]:
+        """Get/set the ``(width, height)`` of the shape."""
+        return self._width, self._height
+
+    @size.setter
+    def size(self, values: tuple[float, float]) -> None:
+        self._width, self._height = values
+        self._update_size()
+
+    @property
+    def thickness(self) -> float:
+        """Get/set the line thickness of outlined meshes, such as :py:meth:`ShapeInstancer.box`."""
+        return self._thickness
+
+    @thickness.setter
+    def thickness(self, value: float) -> None:
+        self._thickness = value
+        self._update_size()
+
+    @property
+    def rotation(self) -> float:
+        """Get/set the shape's clockwise rotation in degrees, around its position."""
+        return self._rotation
+
+    @rotation.setter
+    def rotation(self, rotation: float) -> None:
+        self._rotation = rotation
+        self._update_rotation()
+
+    @property
+    def color(self) -> tuple[int, int, int, int]:
+        """Get/set the shape's color, as an RGBA or RGB tuple of integers.
+
+        If an RGB color is set, the current alpha will be preserved.
+        """
+        return self._rgba
+
+    @color.setter
+    def color(self, values: tuple[int, int, int, int] | tuple[int, int, int]) -> None:
+        r, g, b, *a = values
+        self._rgba = r, g, b, a[0] if a else self._rgba[3]
+        self._update_color()
+
+    @property
+    def opacity(self) -> int:
+        """Get/set the blend opacity of the shape."""
+        return self._rgba[3]
+
+    @opacity.setter
+    def opacity(self, value: int) -> None:
+        self._rgba = (*self._rgba[:3], value)
+        self._update_color()
+
+    @property
+    def visible(self) -> bool:
+        """Get/set whether the shape will be drawn at all."""
+        return self._visible
+
+    @visible.setter
+    def visible(self, value: bool) -> None:
+        self._visible = value
+        self._update_size()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(index={self._index}, position={self.position})"
+
+
+class ShapeInstancer(Instancer[InstancedShape]):
+    """Draw many shapes sharing one mesh with a single instanced draw call.
+
+    The mesh is uploaded once, and each :py:class:`InstancedShape` only stores
+    its position, size, rotation, thickness and color. Moving or recoloring a
+    shape writes a few bytes, instead of regenerating all of its vertices.
+
+    Meshes for the fixed-topology shapes of this module are created with
+    :py:meth:`rectangle`, :py:meth:`box`, :py:meth:`circle`,
+    :py:meth:`triangle` and :py:meth:`star`. The mesh is scaled by the
+    width and height of each shape, and rotated around the mesh origin.
+
+    Example::
+
+        circles = shapes.ShapeInstancer.circle(segments=32, batch=batch)
+        ball = circles.create(100, 100, 20, 20, color=(255, 0, 0))
+        ball.position = (120, 100)
+    """
+
+    _instance_attributes = ('translation', 'zposition', 'size', 'thickness', 'rotation', 'color')
+
+    def __init__(self,
+                 vertices: Sequence[float],
+                 indices: Sequence[int],
+                 insets: Sequence[float] | None = None,
+                 blend_src: int = GL_SRC_ALPHA,
+                 blend_dest: int = GL_ONE_MINUS_SRC_ALPHA,
+                 batch: Batch | None = None,
+                 group: Group | None = None,
+                 program: ShaderProgram | None = None) -> None:
+        """Create a ShapeInstancer from a custom mesh.
+
+        Args:
+            vertices:
+                The 2D vertex positions of the mesh, as a flat sequence of
+                ``(x, y)`` pairs. They are scaled by the size of each shape.
+            indices:
+                The vertex indices of the mesh triangles.
+            insets:
+                Optional offsets of each vertex, as a flat sequence of
+                ``(x, y)`` pairs. They are scaled by the thickness of each
+                shape, independently of its size.
+            blend_src:
+                OpenGL blend source mode; for example, ``GL_SRC_ALPHA``.
+            blend_dest:
+                OpenGL blend destination mode; for example, ``GL_ONE_MINUS_SRC_ALPHA``.
+            batch:
+                Optional batch to add the shapes to.
+            group:
+                Optional parent group of the shapes.
+            program:
+                A custom ShaderProgram, with the attributes of the default
+                instanced shader.
+        """
+        count = len(vertices) // 2
+        self._batch = batch
+        self._records = []
+
+        program = program or get_default_instanced_shader()
+        self._group = _ShapeGroup(blend_src, blend_dest, program, group)
+
+        self._vertex_list = program.vertex_list_instanced_indexed(
+            count, GL_TRIANGLES, indices, self._instance_attributes, batch, self._group,
+            position=('f', vertices),
+            inset=('f', insets or (0, 0) * count),
+            translation='f', zposition='f', size='f', thickness='f', rotation='f', color='Bn')
+
+        self._domain = self._vertex_list.domain
+        self._domain.set_instance_count(0)
+
+        buffers = self._domain.attrib_name_buffers
+        self._translation = buffers['translation']
+        self._zposition = buffers['zposition']
+        self._size = buffers['size']
+        self._thickness = buffers['thickness']
+        self._rotation = buffers['rotation']
+        self._color = buffers['color']
+
+    @classmethod
+    def rectangle(cls, **kwargs: Any) -> ShapeInstancer:
+        """Create an instancer of rectangles.
+
+        The mesh is a unit square with its origin at the bottom left, so the
+        width and height of each shape are its size in pixels, as with
+        :py:class:`Rectangle`. Keyword arguments are passed to the constructor.
+        """
+        return cls((0, 0, 1, 0, 1, 1, 0, 1), (0, 1, 2, 0, 2, 3), **kwargs)
+
+    @classmethod
+    def box(cls, **kwargs: Any) -> ShapeInstancer:
+        """Create an instancer of unfilled rectangles.
+
+        The mesh is a unit square with its origin at the bottom left, as with
+        :py:meth:`rectangle`. The walls extend inward by the thickness of each
+        shape, as with :py:class:`Box`. Keyword arguments are passed to the
+        constructor.
+        """
+        #   3        6
+        #     2    7
+        #     1    4
+        #   0        5
+        vertices = (0, 0, 0, 0, 0, 1, 0, 1, 1, 0, 1, 0, 1, 1, 1, 1)
+        insets = (0, 0, 1, 1, 1, -1, 0, 0, -1, 1, 0, 0, 0, 0, -1, -1)
+        indices = (0, 1, 2, 0, 2, 3, 0, 5, 4, 0, 4, 1, 4, 5, 6, 4, 6, 7, 2, 7, 6, 2, 6, 3)
+        return cls(vertices, indices, insets, **kwargs)
+
+    @classmethod
+    def circle(cls, segments: int = 32, **kwargs: Any) -> ShapeInstancer:
+        """Create an instancer of circles, or ellipses.
+
+        The mesh is a circle with a diameter of 1 around its origin, so the
+        width and height of each shape are its horizontal and vertical
+        diameter. Keyword arguments are passed to the constructor.
+
+        Args:
+            segments:
+                The number of triangles the circle is made from.
+        """
+        tau_segs = math.pi * 2 / segments
+        vertices = [0.0, 0.0]
+        for i in range(segments):
+            vertices += 0.5 * math.cos(i * tau_segs), 0.5 * math.sin(i * tau_segs)
+        indices = []
+        for i in range(segments):
+            indices += 0, i + 1, (i + 1) % segments + 1
+        return cls(vertices, indices, **kwargs)
+
+    @classmethod
+    def triangle(cls, x2: float, y2: float, x3: float, y3: float, **kwargs: Any) -> ShapeInstancer:
+        """Create an instancer of triangles.
+
+        The mesh origin is the first vertex, as with :py:class:`Triangle`. A
+        width and height of 1 draws the triangle as given, and other sizes
+        scale it. Keyword arguments are passed to the constructor.
+
+        Args:
+            x2:
+                The X coordinate of the second vertex, relative to the first.
+            y2:
+                The Y coordinate of the second vertex, relative to the first.
+            x3:
+                The X coordinate of the third vertex, relative to the first.
+            y3:
+                The Y coordinate of the third vertex, relative to the first.
+        """
+        return cls((0, 0, x2, y2, x3, y3), (0, 1, 2), **kwargs)
+
+    @classmethod
+    def star(cls, num_spikes: int, inner_ratio: float = 0.5, **kwargs: Any) -> ShapeInstancer:
+        """Create an instancer of stars.
+
+        The mesh is a star with an outer diameter of 1 around its origin, and
+        one spike along the X axis, as with :py:class:`Star`. The width and
+        height of each shape are its outer diameter. Keyword arguments are
+        passed to the constructor.
+
+        Args:
+            num_spikes:
+                The number of spikes of the star.
+            inner_ratio:
+                The inner radius of the star, relative to its outer radius.
+        """
+        d_theta = math.pi / num_spikes
+        vertices = [0.0, 0.0]
+        for i in range(num_spikes * 2):
+            radius = 0.5 if i % 2 == 0 else 0.5 * inner_ratio
+            vertices += radius * math.cos(i * d_theta), radius * math.sin(i * d_theta)
+        indices = []
+        for i in range(num_spikes * 2):
+            indices += 0, i + 1, (i + 1) % (num_spikes * 2) + 1
+        return cls(vertices, indices, **kwargs)
+
+    def create(self,
+               x: float, y: float,
+               width: float = 1.0, height: float = 1.0,
+               rotation: float = 0.0,
+               thickness: float = 1.0,
+               color: tuple[int, int, int, int] | tuple[int, int, int] = (255, 255, 255, 255),
+               z: float = 0.0) -> InstancedShape:
+        """Create a new shape.
+
+        Args:
+            x:
+                X coordinate of the shape.
+            y:
+                Y coordinate of the shape.
+            width:
+                The horizontal size the mesh is scaled to.
+            height:
+                The vertical size the mesh is scaled to.
+            rotation:
+                Clockwise rotation of the shape, in degrees.
+            thickness:
+                The line thickness of outlined meshes.
+            color:
+                The RGB or RGBA color of the shape.
+            z:
+                Z coordinate of the shape.
+        """
+        r, g, b, *a = color
+
+        return self._add(InstancedShape(self, len(self._records), x, y, z, width, height, rotation, thickness,
+                                        (r, g, b, a[0] if a else 255)))
+
+    @property
+    def shapes(self) -> list[InstancedShape]:
+        """The shapes of this instancer, in drawing order."""
+        return self._records[:]
+
+    @property
+    def batch(self) -> Batch | None:
+        """The Batch the shapes are drawn in."""
+        return self._batch
+
+    @property
+    def program(self) -> ShaderProgram:
+        """The ShaderProgram used to draw the shapes."""
+        return self._group.program
 
 
 __all__ = ('Arc', 'Box', 'BezierCurve', 'Circle', 'Ellipse', 'Line', 'MultiLine', 'Rectangle',
-           'BorderedRectangle', 'Triangle', 'Star', 'Polygon', 'Sector', 'ShapeBase')
+           'BorderedRectangle', 'Triangle', 'Star', 'Polygon', 'Polyline', 'Sector', 'ShapeBase',
+           'InstancedShape', 'ShapeInstancer')
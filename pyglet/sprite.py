@@ -66,30 +66,33 @@ sprites within batches.
 """
 from __future__ import annotations
 
+import math
 import sys
 import warnings
-from typing import TYPE_CHECKING, ClassVar, Literal
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 import pyglet
 from pyglet import clock, event, graphics, image
 from pyglet.gl import (
     GL_BLEND,
     GL_ONE_MINUS_SRC_ALPHA,
+    GL_POINTS,
     GL_SRC_ALPHA,
-    GL_TEXTURE0,
     GL_TRIANGLES,
-    glActiveTexture,
-    glBindTexture,
     glBlendFunc,
     glDisable,
     glEnable,
 )
+from pyglet.graphics.instancing import InstanceRecord, Instancer
 
 _is_pyglet_doc_run = hasattr(sys, "is_pyglet_doc_run") and sys.is_pyglet_doc_run
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
     from pyglet.graphics import Batch, Group
     from pyglet.graphics.shader import ShaderProgram
+    from pyglet.graphics.vertexbuffer import AttributeBufferObject
     from pyglet.image import AbstractImage, Animation, Texture
 
 vertex_source: str = """#version 150 core
@@ -158,6 +161,190 @@ fragment_array_source: str = """#version 150 core
     }
 """
 
+instanced_vertex_source: str = """#version 150 core
+    in vec2 corner;
+    in vec3 translate;
+    in vec4 colors;
+    in vec2 scale;
+    in float rotation;
+    in vec4 bounds;
+    in vec4 tex_region;
+
+    out vec4 vertex_colors;
+    out vec3 texture_coords;
+
+    uniform WindowBlock
+    {
+        mat4 projection;
+        mat4 view;
+    } window;
+
+    void main()
+    {
+        // The quad corner, relative to the anchor, and the matching texture coordinate:
+        vec2 position = mix(bounds.xy, bounds.zw, corner) * scale;
+        float angle = -radians(rotation);
+        mat2 m_rotation = mat2(cos(angle), sin(angle), -sin(angle), cos(angle));
+
+        gl_Position = window.projection * window.view * vec4(translate + vec3(m_rotation * position, 0.0), 1.0);
+
+        vertex_colors = colors;
+        texture_coords = vec3(mix(tex_region.xy, tex_region.zw, corner), 0.0);
+    }
+"""
+
+sprite_array_vertex_source: str = """#version 150 core
+    in vec2 corner;
+    in vec3 translate;
+    in vec4 colors;
+    in vec2 scale;
+    in float rotation;
+#ifdef ANIMATED
+    in float start_time;
+#else
+    in float frame;
+#endif
+
+    out vec4 vertex_colors;
+    out vec3 texture_coords;
+
+    // The anchored bounds and texture region of each frame. FRAME_COUNT is defined by SpriteArray.
+    uniform vec4 frame_bounds[FRAME_COUNT];
+    uniform vec4 frame_regions[FRAME_COUNT];
+
+#ifdef ANIMATED
+    // The time each frame ends, since the start of the animation.
+    uniform float frame_ends[FRAME_COUNT];
+    // The duration of the animation if it loops, or 0.
+    uniform float loop_duration;
+    uniform float time;
+
+    int get_frame()
+    {
+        float elapsed = max(time - start_time, 0.0);
+        if (loop_duration > 0.0) {
+            elapsed = mod(elapsed, loop_duration);
+        }
+        for (int i = 0; i < FRAME_COUNT; i++) {
+            if (elapsed < frame_ends[i]) {
+                return i;
+            }
+        }
+        return FRAME_COUNT - 1;
+    }
+#else
+    int get_frame()
+    {
+        return clamp(int(frame), 0, FRAME_COUNT - 1);
+    }
+#endif
+
+    uniform WindowBlock
+    {
+        mat4 projection;
+        mat4 view;
+    } window;
+
+    void main()
+    {
+        int index = get_frame();
+        vec4 bounds = frame_bounds[index];
+        vec4 tex_region = frame_regions[index];
+
+        vec2 position = mix(bounds.xy, bounds.zw, corner) * scale;
+        float angle = -radians(rotation);
+        mat2 m_rotation = mat2(cos(angle), sin(angle), -sin(angle), cos(angle));
+
+        gl_Position = window.projection * window.view * vec4(translate + vec3(m_rotation * position, 0.0), 1.0);
+
+        vertex_colors = colors;
+        texture_coords = vec3(mix(tex_region.xy, tex_region.zw, corner), 0.0);
+    }
+"""
+
+
+geometry_vertex_source: str = """#version 150 core
+    in vec3 translate;
+    in vec4 colors;
+    in vec2 scale;
+    in float rotation;
+    in vec4 bounds;
+    in vec4 tex_coords_bottom;
+    in vec4 tex_coords_top;
+    in float tex_layer;
+
+    out vec4 geo_colors;
+    out vec2 geo_scale;
+    out float geo_rotation;
+    out vec4 geo_bounds;
+    out vec4 geo_tex_coords_bottom;
+    out vec4 geo_tex_coords_top;
+    out float geo_tex_layer;
+
+    void main()
+    {
+        gl_Position = vec4(translate, 1.0);
+        geo_colors = colors;
+        geo_scale = scale;
+        geo_rotation = rotation;
+        geo_bounds = bounds;
+        geo_tex_coords_bottom = tex_coords_bottom;
+        geo_tex_coords_top = tex_coords_top;
+        geo_tex_layer = tex_layer;
+    }
+"""
+
+geometry_source: str = """#version 150 core
+    // Each sprite is a single point, expanded here into a quad.
+    layout (points) in;
+    layout (triangle_strip, max_vertices = 4) out;
+
+    in vec4 geo_colors[];
+    in vec2 geo_scale[];
+    in float geo_rotation[];
+    in vec4 geo_bounds[];
+    in vec4 geo_tex_coords_bottom[];
+    in vec4 geo_tex_coords_top[];
+    in float geo_tex_layer[];
+
+    out vec4 vertex_colors;
+    out vec3 texture_coords;
+
+    uniform WindowBlock
+    {
+        mat4 projection;
+        mat4 view;
+    } window;
+
+    mat4 m_pv;
+    mat2 m_rotation;
+
+    void emit_corner(vec2 corner, vec2 uv)
+    {
+        vec3 translate = gl_in[0].gl_Position.xyz;
+        gl_Position = m_pv * vec4(translate + vec3(m_rotation * (corner * geo_scale[0]), 0.0), 1.0);
+        vertex_colors = geo_colors[0];
+        texture_coords = vec3(uv, geo_tex_layer[0]);
+        EmitVertex();
+    }
+
+    void main()
+    {
+        m_pv = window.projection * window.view;
+        float angle = -radians(geo_rotation[0]);
+        m_rotation = mat2(cos(angle), sin(angle), -sin(angle), cos(angle));
+
+        // Bounds are (x1, y1, x2, y2) relative to the anchor. The texture coordinates
+        // are the bottom-left, bottom-right, top-right and top-left corners, in order.
+        vec4 bounds = geo_bounds[0];
+        emit_corner(bounds.xy, geo_tex_coords_bottom[0].xy);
+        emit_corner(bounds.zy, geo_tex_coords_bottom[0].zw);
+        emit_corner(bounds.xw, geo_tex_coords_top[0].zw);
+        emit_corner(bounds.zw, geo_tex_coords_top[0].xy);
+        EndPrimitive();
+    }
+"""
+
 
 def get_default_shader() -> ShaderProgram:
     """Create and return the default sprite shader.
@@ -177,6 +364,51 @@ def get_default_array_shader() -> ShaderProgram:
                                                     (fragment_array_source, 'fragment'))
 
 
+def get_default_instanced_shader() -> ShaderProgram:
+    """Create and return the default shader used by :py:class:`SpriteInstancer`.
+
+    This method allows the module to be imported without an OpenGL Context.
+    """
+    return pyglet.gl.current_context.create_program((instanced_vertex_source, 'vertex'),
+                                                    (fragment_source, 'fragment'))
+
+
+def get_default_geometry_shader() -> ShaderProgram:
+    """Create and return the default shader used by :py:class:`GeometrySprite`.
+
+    This method allows the module to be imported without an OpenGL Context.
+    """
+    return pyglet.gl.current_context.create_program((geometry_vertex_source, 'vertex'),
+                                                    (geometry_source, 'geometry'),
+                                                    (fragment_source, 'fragment'))
+
+
+def get_default_geometry_array_shader() -> ShaderProgram:
+    """Create and return the :py:class:`GeometrySprite` shader for texture arrays.
+
+    This method allows the module to be imported without an OpenGL Context.
+    """
+    return pyglet.gl.current_context.create_program((geometry_vertex_source, 'vertex'),
+                                                    (geometry_source, 'geometry'),
+                                                    (fragment_array_source, 'fragment'))
+
+
+def get_default_sprite_array_shader(frame_count: int, animated: bool = False) -> ShaderProgram:
+    """Create and return the default shader used by :py:class:`SpriteArray`.
+
+    A program is created for each number of frames, which is at least 2,
+    and for arrays showing an Animation.
+
+    This method allows the module to be imported without an OpenGL Context.
+    """
+    defines = {'FRAME_COUNT': max(frame_count, 2)}
+    if animated:
+        defines['ANIMATED'] = None
+    return pyglet.gl.current_context.create_program((sprite_array_vertex_source, 'vertex'),
+                                                    (fragment_source, 'fragment'),
+                                                    defines=defines)
+
+
 class SpriteGroup(graphics.Group):
     """Shared Sprite rendering Group.
 
@@ -215,8 +447,7 @@ class SpriteGroup(graphics.Group):
     def set_state(self) -> None:
         self.program.use()
 
-        glActiveTexture(GL_TEXTURE0)
-        glBindTexture(self.texture.target, self.texture.id)
+        pyglet.gl.current_context.bindings.bind_texture(self.texture.target, self.texture.id, 0)
 
         glEnable(GL_BLEND)
         glBlendFunc(self.blend_src, self.blend_dest)
@@ -228,6 +459,20 @@ class SpriteGroup(graphics.Group):
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.texture})"
 
+    def has_same_state(self, other: Group) -> bool:
+        """Whether another SpriteGroup uses the same program, texture and blend modes.
+
+        Subclasses are never considered to have the same state, as they may
+        set state of their own. They must override this method to be
+        coalesced.
+        """
+        return (self.__class__ is SpriteGroup and other.__class__ is SpriteGroup and
+                self.program is other.program and
+                self.texture.target == other.texture.target and
+                self.texture.id == other.texture.id and
+                self.blend_src == other.blend_src and
+                self.blend_dest == other.blend_dest)
+
     def __eq__(self, other: SpriteGroup) -> bool:
         return (other.__class__ is self.__class__ and
                 self.program is other.program and
@@ -250,6 +495,8 @@ class Sprite(event.EventDispatcher):
     """
 
     _batch = None
+    # Whether the batch culls vertex lists, so the bounds of the sprite are needed:
+    _culling = False
     _animation = None
     _frame_index = 0
     _paused = False
@@ -261,6 +508,10 @@ class Sprite(event.EventDispatcher):
     _visible = True
     _vertex_list = None
 
+    # The primitive, and the number of vertices written for each sprite:
+    _mode = GL_TRIANGLES
+    _vertex_count = 4
+
     #: Default class used to create the rendering group.
     group_class: ClassVar[type[SpriteGroup | Group]] = SpriteGroup
 
@@ -317,14 +568,9 @@ class Sprite(event.EventDispatcher):
         else:
             self._texture = img.get_texture()
 
-        if not program:
-            if isinstance(img, image.TextureArrayRegion):
-                program = get_default_array_shader()
-            else:
-                program = get_default_shader()
-
-        self._program = program
+        self._program = program or self._get_default_program(img)
         self._batch = batch
+        self._culling = batch is not None and batch.culling_cell_size is not None
         self._blend_src = blend_src
         self._blend_dest = blend_dest
         self._user_group = group
@@ -393,7 +639,7 @@ class Sprite(event.EventDispatcher):
 
         self._group = self.get_sprite_group()
         if self._batch is not None:
-            self._batch.migrate(self._vertex_list, GL_TRIANGLES, self._group, self._batch)
+            self._batch.migrate(self._vertex_list, self._mode, self._group, self._batch)
 
     @property
     def program(self) -> ShaderProgram:
@@ -411,7 +657,7 @@ class Sprite(event.EventDispatcher):
         self._group = self.get_sprite_group()
 
         if (self._batch and
-                self._batch.update_shader(self._vertex_list, GL_TRIANGLES, self._group, program)):
+                self._batch.update_shader(self._vertex_list, self._mode, self._group, program)):
             # Exit early if changing domain is not needed.
             return
 
@@ -436,11 +682,14 @@ class Sprite(event.EventDispatcher):
             return
 
         if batch is not None and self._batch is not None:
-            self._batch.migrate(self._vertex_list, GL_TRIANGLES, self._group, batch)
+            self._batch.migrate(self._vertex_list, self._mode, self._group, batch)
             self._batch = batch
+            self._culling = batch.culling_cell_size is not None
+            self._update_bounds()
         else:
             self._vertex_list.delete()
             self._batch = batch
+            self._culling = batch is not None and batch.culling_cell_size is not None
             self._create_vertex_list()
 
     @property
@@ -460,7 +709,7 @@ class Sprite(event.EventDispatcher):
         self._user_group = group
         self._group = self.get_sprite_group()
         if self._batch is not None:
-            self._batch.migrate(self._vertex_list, GL_TRIANGLES, self._group, self._batch)
+            self._batch.migrate(self._vertex_list, self._mode, self._group, self._batch)
 
     @property
     def image(self) -> AbstractImage | Animation:
@@ -496,8 +745,18 @@ class Sprite(event.EventDispatcher):
             self._group = self.get_sprite_group()
             self._create_vertex_list()
         else:
-            self._vertex_list.tex_coords[:] = texture.tex_coords
-        self._texture = texture
+            self._texture = texture
+            self._update_tex_coords()
+            self._update_bounds()
+
+    def _update_tex_coords(self) -> None:
+        self._vertex_list.tex_coords[:] = self._texture.tex_coords
+
+    @staticmethod
+    def _get_default_program(img: AbstractImage | Animation) -> ShaderProgram:
+        if isinstance(img, image.TextureArrayRegion):
+            return get_default_array_shader()
+        return get_default_shader()
 
     def _create_vertex_list(self) -> None:
         self._vertex_list = self.program.vertex_list_indexed(
@@ -508,6 +767,7 @@ class Sprite(event.EventDispatcher):
             scale=('f', (self._scale * self._scale_x, self._scale * self._scale_y) * 4),
             rotation=('f', (self._rotation,) * 4),
             tex_coords=('f', self._texture.tex_coords))
+        self._update_bounds()
 
     def _get_vertices(self) -> tuple:
         if not self._visible:
@@ -528,6 +788,18 @@ class Sprite(event.EventDispatcher):
     def _update_position(self) -> None:
         self._vertex_list.position[:] = self._get_vertices()
 
+    def _update_bounds(self) -> None:
+        # Only needed if the batch culls vertex lists outside its view.
+        if not self._culling:
+            return
+
+        # A circle around the anchor, so the bounds do not change with rotation:
+        img = self._texture
+        half_width = max(img.anchor_x, img.width - img.anchor_x)
+        half_height = max(img.anchor_y, img.height - img.anchor_y)
+        radius = math.hypot(half_width, half_height) * abs(self._scale) * max(abs(self._scale_x), abs(self._scale_y))
+        self._vertex_list.set_bounds(self._x - radius, self._y - radius, radius * 2, radius * 2)
+
     def get_sprite_group(self) -> SpriteGroup | Group:
         """Creates and returns a group to be used to render the sprite.
 
@@ -548,7 +820,9 @@ class Sprite(event.EventDispatcher):
     @position.setter
     def position(self, position: tuple[float, float, float]) -> None:
         self._x, self._y, self._z = position
-        self._vertex_list.translate[:] = position * 4
+        self._vertex_list.translate[:] = position * self._vertex_count
+        if self._culling:
+            self._update_bounds()
 
     @property
     def x(self) -> float:
@@ -558,7 +832,9 @@ class Sprite(event.EventDispatcher):
     @x.setter
     def x(self, x: float) -> None:
         self._x = x
-        self._vertex_list.translate[:] = (x, self._y, self._z) * 4
+        self._vertex_list.translate[:] = (x, self._y, self._z) * self._vertex_count
+        if self._culling:
+            self._update_bounds()
 
     @property
     def y(self) -> float:
@@ -568,7 +844,9 @@ class Sprite(event.EventDispatcher):
     @y.setter
     def y(self, y: float) -> None:
         self._y = y
-        self._vertex_list.translate[:] = (self._x, y, self._z) * 4
+        self._vertex_list.translate[:] = (self._x, y, self._z) * self._vertex_count
+        if self._culling:
+            self._update_bounds()
 
     @property
     def z(self) -> float:
@@ -578,7 +856,7 @@ class Sprite(event.EventDispatcher):
     @z.setter
     def z(self, z: float) -> None:
         self._z = z
-        self._vertex_list.translate[:] = (self._x, self._y, z) * 4
+        self._vertex_list.translate[:] = (self._x, self._y, z) * self._vertex_count
 
     @property
     def rotation(self) -> float:
@@ -592,7 +870,7 @@ class Sprite(event.EventDispatcher):
     @rotation.setter
     def rotation(self, rotation: float) -> None:
         self._rotation = rotation
-        self._vertex_list.rotation[:] = (self._rotation,) * 4
+        self._vertex_list.rotation[:] = (self._rotation,) * self._vertex_count
 
     @property
     def scale(self) -> float:
@@ -606,7 +884,9 @@ class Sprite(event.EventDispatcher):
     @scale.setter
     def scale(self, scale: float) -> None:
         self._scale = scale
-        self._vertex_list.scale[:] = (scale * self._scale_x, scale * self._scale_y) * 4
+        self._vertex_list.scale[:] = (scale * self._scale_x, scale * self._scale_y) * self._vertex_count
+        if self._culling:
+            self._update_bounds()
 
     @property
     def scale_x(self) -> float:
@@ -620,7 +900,9 @@ class Sprite(event.EventDispatcher):
     @scale_x.setter
     def scale_x(self, scale_x: float) -> None:
         self._scale_x = scale_x
-        self._vertex_list.scale[:] = (self._scale * scale_x, self._scale * self._scale_y) * 4
+        self._vertex_list.scale[:] = (self._scale * scale_x, self._scale * self._scale_y) * self._vertex_count
+        if self._culling:
+            self._update_bounds()
 
     @property
     def scale_y(self) -> float:
@@ -634,15 +916,18 @@ class Sprite(event.EventDispatcher):
     @scale_y.setter
     def scale_y(self, scale_y: float) -> None:
         self._scale_y = scale_y
-        self._vertex_list.scale[:] = (self._scale * self._scale_x, self._scale * scale_y) * 4
+        self._vertex_list.scale[:] = (self._scale * self._scale_x, self._scale * scale_y) * self._vertex_count
+        if self._culling:
+            self._update_bounds()
 
     def update(self, x: float | None = None, y: float | None = None, z: float | None = None,
                rotation: float | None = None, scale: float | None = None,
                scale_x: float | None = None, scale_y: float | None = None) -> None:
         """Simultaneously change the position, rotation or scale.
 
-        This method is provided for convenience. There is not much
-        performance benefit to updating multiple Sprite attributes at once.
+        All changed attributes are written to the vertex data in one pass,
+        which is faster than setting each property. To update many sprites
+        at once, see :py:func:`update_many`.
 
         Args:
             x:
@@ -659,49 +944,37 @@ class Sprite(event.EventDispatcher):
                 Horizontal scaling factor.
             scale_y:
                 Vertical scaling factor.
-
-        .. deprecated:: 2.0.x
-           No longer calculated with the vertices on the CPU. Now calculated within a shader.
-
-           * Use ``x``, ``y``, ``z``, or ``position`` to update position.
-           * Use ``rotation`` to update rotation.
-           * Use ``scale_x``, ``scale_y``, or ``scale`` to update scale.
         """
-        translations_outdated = False
+        data = {}
 
         # only bother updating if the translation actually changed
-        if x is not None:
-            self._x = x
-            translations_outdated = True
-        if y is not None:
-            self._y = y
-            translations_outdated = True
-        if z is not None:
-            self._z = z
-            translations_outdated = True
-
-        if translations_outdated:
-            self._vertex_list.translate[:] = (self._x, self._y, self._z) * 4
+        if x is not None or y is not None or z is not None:
+            if x is not None:
+                self._x = x
+            if y is not None:
+                self._y = y
+            if z is not None:
+                self._z = z
+            data['translate'] = (self._x, self._y, self._z) * self._vertex_count
 
         if rotation is not None and rotation != self._rotation:
             self._rotation = rotation
-            self._vertex_list.rotation[:] = (rotation,) * 4
-
-        scales_outdated = False
+            data['rotation'] = (rotation,) * self._vertex_count
 
         # only bother updating if the scale actually changed
-        if scale is not None:
-            self._scale = scale
-            scales_outdated = True
-        if scale_x is not None:
-            self._scale_x = scale_x
-            scales_outdated = True
-        if scale_y is not None:
-            self._scale_y = scale_y
-            scales_outdated = True
-
-        if scales_outdated:
-            self._vertex_list.scale[:] = (self._scale * self._scale_x, self._scale * self._scale_y) * 4
+        if scale is not None or scale_x is not None or scale_y is not None:
+            if scale is not None:
+                self._scale = scale
+            if scale_x is not None:
+                self._scale_x = scale_x
+            if scale_y is not None:
+                self._scale_y = scale_y
+            data['scale'] = (self._scale * self._scale_x, self._scale * self._scale_y) * self._vertex_count
+
+        if data:
+            self._vertex_list.set_attributes(**data)
+            if self._culling and ('translate' in data or 'scale' in data):
+                self._update_bounds()
 
     @property
     def width(self) -> float:
@@ -747,7 +1020,7 @@ class Sprite(event.EventDispatcher):
     def opacity(self, opacity: int):
         r, g, b, _ = self._rgba
         self._rgba = r, g, b, opacity
-        self._vertex_list.colors[:] = self._rgba * 4
+        self._vertex_list.colors[:] = self._rgba * self._vertex_count
 
     @property
     def color(self) -> tuple[int, int, int, int]:
@@ -776,7 +1049,7 @@ class Sprite(event.EventDispatcher):
         # Only update if we actually have to
         if new_color != self._rgba:
             self._rgba = new_color
-            self._vertex_list.colors[:] = new_color * 4
+            self._vertex_list.colors[:] = new_color * self._vertex_count
 
     @property
     def visible(self) -> bool:
@@ -845,7 +1118,7 @@ class Sprite(event.EventDispatcher):
         efficiently.
         """
         self._group.set_state_recursive()
-        self._vertex_list.draw(GL_TRIANGLES)
+        self._vertex_list.draw(self._mode)
         self._group.unset_state_recursive()
 
     if _is_pyglet_doc_run:
@@ -863,3 +1136,1034 @@ class Sprite(event.EventDispatcher):
 
 
 Sprite.register_event_type('on_animation_end')
+
+
+class GeometrySprite(Sprite):
+    """A Sprite stored as a single point, and expanded into a quad by a geometry shader.
+
+    The API is the same as :py:class:`Sprite`, including animations, blend
+    modes and subpixel positioning. Each sprite only stores one vertex instead
+    of four, which reduces the vertex data written when sprites move, rotate or
+    scale, and the memory used for each sprite.
+
+    Rendering is selected per sprite: GeometrySprites can be added to the same
+    :py:class:`~pyglet.graphics.Batch` as Sprites, and are drawn in their own
+    vertex domain. A custom ``program`` must include a geometry shader taking
+    the same attributes as :py:data:`geometry_vertex_source`.
+
+    .. note:: Geometry shaders require OpenGL 3.2, and are not available
+              on OpenGL ES 3.1 contexts without an extension.
+    """
+
+    _mode = GL_POINTS
+    _vertex_count = 1
+
+    @staticmethod
+    def _get_default_program(img: AbstractImage | Animation) -> ShaderProgram:
+        if isinstance(img, image.TextureArrayRegion):
+            return get_default_geometry_array_shader()
+        return get_default_geometry_shader()
+
+    def _get_tex_coords(self) -> tuple[tuple, tuple, tuple]:
+        u0, v0, r, u1, v1, _, u2, v2, _, u3, v3, _ = self._texture.tex_coords
+        return (u0, v0, u1, v1), (u2, v2, u3, v3), (r,)
+
+    def _create_vertex_list(self) -> None:
+        bottom, top, layer = self._get_tex_coords()
+        self._vertex_list = self.program.vertex_list(
+            1, GL_POINTS, self._batch, self._group,
+            bounds=('f', self._get_vertices()),
+            colors=('Bn', self._rgba),
+            translate=('f', (self._x, self._y, self._z)),
+            scale=('f', (self._scale * self._scale_x, self._scale * self._scale_y)),
+            rotation=('f', (self._rotation,)),
+            tex_coords_bottom=('f', bottom),
+            tex_coords_top=('f', top),
+            tex_layer=('f', layer))
+        self._update_bounds()
+
+    def _update_tex_coords(self) -> None:
+        bottom, top, layer = self._get_tex_coords()
+        data = {'tex_coords_bottom': bottom, 'tex_coords_top': top}
+        # The layer is only used, and so only available, when drawing from a texture array:
+        if 'tex_layer' in self._vertex_list.domain.attrib_name_buffers:
+            data['tex_layer'] = layer
+        self._vertex_list.set_attributes(**data)
+
+    def _get_vertices(self) -> tuple:
+        if not self._visible:
+            return 0, 0, 0, 0
+
+        img = self._texture
+        x1 = -img.anchor_x
+        y1 = -img.anchor_y
+        x2 = x1 + img.width
+        y2 = y1 + img.height
+
+        if not self._subpixel:
+            return int(x1), int(y1), int(x2), int(y2)
+
+        return x1, y1, x2, y2
+
+    def _update_position(self) -> None:
+        self._vertex_list.bounds[:] = self._get_vertices()
+
+
+def update_many(sprites: Sequence[Sprite],
+                xs: Sequence[float] | None = None, ys: Sequence[float] | None = None,
+                zs: Sequence[float] | None = None, rotations: Sequence[float] | None = None,
+                scales: Sequence[float] | None = None, scale_xs: Sequence[float] | None = None,
+                scale_ys: Sequence[float] | None = None) -> None:
+    """Change the position, rotation or scale of many sprites at once.
+
+    This is equivalent to calling :py:meth:`Sprite.update` for each sprite,
+    with the values at its index in each of the given sequences. The vertex
+    data is written directly, and the changed region of each buffer is only
+    marked once, which amortizes most of the per-sprite overhead.
+
+    Args:
+        sprites:
+            The sprites to update.
+        xs:
+            The new X coordinate of each sprite.
+        ys:
+            The new Y coordinate of each sprite.
+        zs:
+            The new Z coordinate of each sprite.
+        rotations:
+            The new clockwise rotation of each sprite, in degrees.
+        scales:
+            The new scaling factor of each sprite.
+        scale_xs:
+            The new horizontal scaling factor of each sprite.
+        scale_ys:
+            The new vertical scaling factor of each sprite.
+    """
+    for values in (xs, ys, zs, rotations, scales, scale_xs, scale_ys):
+        if values is not None and len(values) != len(sprites):
+            msg = f"Expected {len(sprites)} values, got {len(values)}."
+            raise ValueError(msg)
+
+    translate = xs is not None or ys is not None or zs is not None
+    scale = scales is not None or scale_xs is not None or scale_ys is not None
+    names = [name for name, changed in (('translate', translate), ('rotation', rotations is not None),
+                                        ('scale', scale)) if changed]
+    if not names:
+        return
+
+    # The range of vertices changed in each domain:
+    regions = {}
+    domain = None
+    translate_data = rotation_data = scale_data = None
+
+    for i, sprite in enumerate(sprites):
+        vertex_list = sprite._vertex_list  # noqa: SLF001
+        start = vertex_list.start
+        count = vertex_list.count
+        end = start + count
+
+        if vertex_list.domain is not domain:
+            domain = vertex_list.domain
+            buffers = domain.attrib_name_buffers
+            translate_data = buffers['translate'].data
+            rotation_data = buffers['rotation'].data
+            scale_data = buffers['scale'].data
+            region = regions.setdefault(domain, [start, end])
+
+        if start < region[0]:
+            region[0] = start
+        if end > region[1]:
+            region[1] = end
+
+        if translate:
+            if xs is not None:
+                sprite._x = xs[i]  # noqa: SLF001
+            if ys is not None:
+                sprite._y = ys[i]  # noqa: SLF001
+            if zs is not None:
+                sprite._z = zs[i]  # noqa: SLF001
+            translate_data[start * 3:end * 3] = (sprite._x, sprite._y, sprite._z) * count  # noqa: SLF001
+
+        if rotations is not None:
+            sprite._rotation = rotations[i]  # noqa: SLF001
+            rotation_data[start:end] = (sprite._rotation,) * count  # noqa: SLF001
+
+        if scale:
+            if scales is not None:
+                sprite._scale = scales[i]  # noqa: SLF001
+            if scale_xs is not None:
+                sprite._scale_x = scale_xs[i]  # noqa: SLF001
+            if scale_ys is not None:
+                sprite._scale_y = scale_ys[i]  # noqa: SLF001
+            scale_data[start * 2:end * 2] = (sprite._scale * sprite._scale_x,  # noqa: SLF001
+                                             sprite._scale * sprite._scale_y) * count  # noqa: SLF001
+
+        if sprite._culling and (translate or scale):  # noqa: SLF001
+            sprite._update_bounds()  # noqa: SLF001
+
+    for changed_domain, (first, last) in regions.items():
+        for name in names:
+            changed_domain.attrib_name_buffers[name].invalidate_region(first, last - first)
+
+
+class InstancedSprite(InstanceRecord):
+    """A lightweight sprite, drawn as one instance of a :py:class:`SpriteInstancer`.
+
+    Instanced sprites are created with :py:meth:`SpriteInstancer.create`. They
+    support the transforms and colors of a :py:class:`Sprite`, but not
+    Animations, events, or their own Batch and Group.
+    """
+
+    __slots__ = ('_rgba', '_rotation', '_scale', '_scale_x', '_scale_y', '_texture', '_visible', '_x', '_y', '_z')
+
+    def __init__(self, instancer: SpriteInstancer, index: int, texture: Texture,
+                 x: float, y: float, z: float, rotation: float,
+                 scale: float, scale_x: float, scale_y: float,
+                 rgba: tuple[int, int, int, int]) -> None:
+        """Create an instanced sprite.
+
+        Applications should use :py:meth:`SpriteInstancer.create` instead.
+        """
+        super().__init__(instancer, index)
+        self._texture = texture
+        self._x = x
+        self._y = y
+        self._z = z
+        self._rotation = rotation
+        self._scale = scale
+        self._scale_x = scale_x
+        self._scale_y = scale_y
+        self._rgba = rgba
+        self._visible = True
+
+    def _write(self) -> None:
+        self._update_translate()
+        self._update_colors()
+        self._update_scale()
+        self._update_rotation()
+        self._update_bounds()
+        self._update_tex_region()
+
+    def _update_translate(self) -> None:
+        self._instancer._translate.set_region(self._index, 1, (self._x, self._y, self._z))  # noqa: SLF001
+
+    def _update_colors(self) -> None:
+        self._instancer._colors.set_region(self._index, 1, self._rgba)  # noqa: SLF001
+
+    def _update_scale(self) -> None:
+        self._instancer._scale.set_region(  # noqa: SLF001
+            self._index, 1, (self._scale * self._scale_x, self._scale * self._scale_y))
+
+    def _update_rotation(self) -> None:
+        self._instancer._rotation.set_region(self._index, 1, (self._rotation,))  # noqa: SLF001
+
+    def _update_bounds(self) -> None:
+        if not self._visible:
+            bounds = (0, 0, 0, 0)
+        else:
+            img = self._texture
+            x1 = -img.anchor_x
+            y1 = -img.anchor_y
+            x2 = x1 + img.width
+            y2 = y1 + img.height
+            if self._instancer._subpixel:  # noqa: SLF001
+                bounds = (x1, y1, x2, y2)
+            else:
+                bounds = (int(x1), int(y1), int(x2), int(y2))
+        self._instancer._bounds.set_region(self._index, 1, bounds)  # noqa: SLF001
+
+    def _update_tex_region(self) -> None:
+        # The texture coordinates of the bottom left and top right corners:
+        tex_coords = self._texture.tex_coords
+        self._instancer._tex_region.set_region(  # noqa: SLF001
+            self._index, 1, (tex_coords[0], tex_coords[1], tex_coords[6], tex_coords[7]))
+
+    @property
+    def image(self) -> AbstractImage:
+        """The sprite's image.
+
+        The new image must be a region of the same texture as the other
+        images of the SpriteInstancer, or :py:class:`ValueError` is raised.
+        """
+        return self._texture
+
+    @image.setter
+    def image(self, img: AbstractImage) -> None:
+        self._texture = self._instancer._check_texture(img)  # noqa: SLF001
+        self._update_bounds()
+        self._update_tex_region()
+
+    @property
+    def position(self) -> tuple[float, float, float]:
+        """The (x, y, z) coordinates of the sprite, as a tuple."""
+        return self._x, self._y, self._z
+
+    @position.setter
+    def position(self, position: tuple[float, float, float]) -> None:
+        self._x, self._y, self._z = position
+        self._update_translate()
+
+    @property
+    def x(self) -> float:
+        """X coordinate of the sprite."""
+        return self._x
+
+    @x.setter
+    def x(self, x: float) -> None:
+        self._x = x
+        self._update_translate()
+
+    @property
+    def y(self) -> float:
+        """Y coordinate of the sprite."""
+        return self._y
+
+    @y.setter
+    def y(self, y: float) -> None:
+        self._y = y
+        self._update_translate()
+
+    @property
+    def z(self) -> float:
+        """Z coordinate of the sprite."""
+        return self._z
+
+    @z.setter
+    def z(self, z: float) -> None:
+        self._z = z
+        self._update_translate()
+
+    @property
+    def rotation(self) -> float:
+        """Clockwise rotation of the sprite, in degrees."""
+        return self._rotation
+
+    @rotation.setter
+    def rotation(self, rotation: float) -> None:
+        self._rotation = rotation
+        self._update_rotation()
+
+    @property
+    def scale(self) -> float:
+        """Base scaling factor, multiplied with :py:attr:`scale_x` and :py:attr:`scale_y`."""
+        return self._scale
+
+    @scale.setter
+    def scale(self, scale: float) -> None:
+        self._scale = scale
+        self._update_scale()
+
+    @property
+    def scale_x(self) -> float:
+        """Horizontal scaling factor."""
+        return self._scale_x
+
+    @scale_x.setter
+    def scale_x(self, scale_x: float) -> None:
+        self._scale_x = scale_x
+        self._update_scale()
+
+    @property
+    def scale_y(self) -> float:
+        """Vertical scaling factor."""
+        return self._scale_y
+
+    @scale_y.setter
+    def scale_y(self, scale_y: float) -> None:
+        self._scale_y = scale_y
+        self._update_scale()
+
+    @property
+    def opacity(self) -> int:
+        """Blend opacity, from 0 (transparent) to 255 (opaque)."""
+        return self._rgba[3]
+
+    @opacity.setter
+    def opacity(self, opacity: int) -> None:
+        r, g, b, _ = self._rgba
+        self._rgba = r, g, b, opacity
+        self._update_colors()
+
+    @property
+    def color(self) -> tuple[int, int, int, int]:
+        """Blend color, as an RGBA or RGB tuple of integers."""
+        return self._rgba
+
+    @color.setter
+    def color(self, rgba: tuple[int, int, int, int] | tuple[int, int, int]) -> None:
+        r, g, b, *a = rgba
+        self._rgba = r, g, b, a[0] if a else 255
+        self._update_colors()
+
+    @property
+    def visible(self) -> bool:
+        """True if the sprite will be drawn."""
+        return self._visible
+
+    @visible.setter
+    def visible(self, visible: bool) -> None:
+        self._visible = visible
+        self._update_bounds()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(index={self._index}, position={self.position})"
+
+
+class SpriteInstancer(Instancer[InstancedSprite]):
+    """Draw many sprites sharing one texture with a single instanced draw call.
+
+    Each :py:class:`InstancedSprite` is one instance of a shared quad. Instead
+    of four vertices and six indices, it stores a single record of its position,
+    rotation, scale, color and texture region. This needs roughly a quarter of
+    the memory and upload bandwidth of a :py:class:`Sprite`.
+
+    All sprites must show regions of the same texture, such as the images of a
+    :py:class:`~pyglet.image.atlas.TextureAtlas` or
+    :py:class:`~pyglet.image.ImageGrid`. Images rotated with
+    :py:meth:`~pyglet.image.AbstractImage.get_transform` are not supported.
+
+    Example::
+
+        instancer = pyglet.sprite.SpriteInstancer(atlas.texture, batch=batch)
+        ball = instancer.create(ball_image, x=50, y=50)
+        ball.rotation = 45
+    """
+
+    _instance_attributes = ('translate', 'colors', 'scale', 'rotation', 'bounds', 'tex_region')
+
+    def __init__(self,
+                 img: AbstractImage,
+                 blend_src: int = GL_SRC_ALPHA,
+                 blend_dest: int = GL_ONE_MINUS_SRC_ALPHA,
+                 batch: Batch | None = None,
+                 group: Group | None = None,
+                 subpixel: bool = False,
+                 program: ShaderProgram | None = None) -> None:
+        """Create a SpriteInstancer.
+
+        Args:
+            img:
+                An image or texture region of the texture shared by all sprites.
+            blend_src:
+                OpenGL blend source mode.  The default is suitable for
+                compositing sprites drawn from back-to-front.
+            blend_dest:
+                OpenGL blend destination mode.  The default is suitable for
+                compositing sprites drawn from back-to-front.
+            batch:
+                Optional batch to add the sprites to.
+            group:
+                Optional parent group of the sprites.
+            subpixel:
+                Allow floating-point coordinates for the sprite corners.
+            program:
+                A custom ShaderProgram, with the attributes of the default
+                instanced shader.
+        """
+        self._texture = img.get_texture()
+        self._batch = batch
+        self._subpixel = subpixel
+        self._records = []
+
+        program = program or get_default_instanced_shader()
+        self._group = SpriteGroup(self._texture, blend_src, blend_dest, program, group)
+
+        self._vertex_list = program.vertex_list_instanced_indexed(
+            4, GL_TRIANGLES, [0, 1, 2, 0, 2, 3], self._instance_attributes, batch, self._group,
+            corner=('f', (0, 0, 1, 0, 1, 1, 0, 1)),
+            translate='f', colors='Bn', scale='f', rotation='f', bounds='f', tex_region='f')
+
+        self._domain = self._vertex_list.domain
+        self._domain.set_instance_count(0)
+
+        buffers = self._domain.attrib_name_buffers
+        self._translate = buffers['translate']
+        self._colors = buffers['colors']
+        self._scale = buffers['scale']
+        self._rotation = buffers['rotation']
+        self._bounds = buffers['bounds']
+        self._tex_region = buffers['tex_region']
+
+    def _check_texture(self, img: AbstractImage) -> Texture:
+        texture = img.get_texture()
+        if texture.id != self._texture.id:
+            msg = "All images of a SpriteInstancer must be regions of the same texture."
+            raise ValueError(msg)
+        return texture
+
+    def create(self,
+               img: AbstractImage | None = None,
+               x: float = 0, y: float = 0, z: float = 0,
+               rotation: float = 0,
+               scale: float = 1.0, scale_x: float = 1.0, scale_y: float = 1.0,
+               color: tuple[int, int, int, int] | tuple[int, int, int] = (255, 255, 255, 255)) -> InstancedSprite:
+        """Create a new sprite.
+
+        Args:
+            img:
+                The image to display; a region of the instancer's texture.
+                Defaults to the image given to the instancer.
+            x:
+                X coordinate of the sprite.
+            y:
+                Y coordinate of the sprite.
+            z:
+                Z coordinate of the sprite.
+            rotation:
+                Clockwise rotation of the sprite, in degrees.
+            scale:
+                Base scaling factor.
+            scale_x:
+                Horizontal scaling factor.
+            scale_y:
+                Vertical scaling factor.
+            color:
+                The RGBA or RGB blend color of the sprite.
+        """
+        texture = self._texture if img is None else self._check_texture(img)
+        r, g, b, *a = color
+
+        return self._add(InstancedSprite(self, len(self._records), texture, x, y, z, rotation,
+                                         scale, scale_x, scale_y, (r, g, b, a[0] if a else 255)))
+
+    @property
+    def sprites(self) -> list[InstancedSprite]:
+        """The sprites of this instancer, in drawing order."""
+        return self._records[:]
+
+    @property
+    def batch(self) -> Batch | None:
+        """The Batch the sprites are drawn in."""
+        return self._batch
+
+    @property
+    def program(self) -> ShaderProgram:
+        """The ShaderProgram used to draw the sprites."""
+        return self._group.program
+
+
+class SpriteArrayGroup(SpriteGroup):
+    """The rendering Group of a :py:class:`SpriteArray`.
+
+    Besides the state of a :py:class:`SpriteGroup`, this sets the table of
+    frames used by the array, and the animation time if it is animated. As
+    the table belongs to one array, the Group is never coalesced with others.
+    """
+
+    def __init__(self, texture: Texture, frame_bounds: Sequence[tuple[float, float, float, float]],
+                 frame_regions: Sequence[tuple[float, float, float, float]], blend_src: int, blend_dest: int,
+                 program: ShaderProgram, parent: Group | None = None,
+                 frame_ends: Sequence[float] | None = None, loop_duration: float = 0.0,
+                 epoch: float = 0.0) -> None:
+        """Create a sprite array group.
+
+        Args:
+            texture:
+                The (top-level) texture containing the frame images.
+            frame_bounds:
+                The anchored (x1, y1, x2, y2) bounds of each frame.
+            frame_regions:
+                The (u1, v1, u2, v2) texture region of each frame.
+            blend_src:
+                OpenGL blend source mode; for example,
+                ``GL_SRC_ALPHA``.
+            blend_dest:
+                OpenGL blend destination mode; for example,
+                ``GL_ONE_MINUS_SRC_ALPHA``.
+            program:
+                A ShaderProgram with ``frame_bounds`` and ``frame_regions``
+                uniform arrays.
+            parent:
+                Optional parent group.
+            frame_ends:
+                For animations, the time each frame ends, since the start
+                of the animation.
+            loop_duration:
+                The duration of a looping animation, or 0.
+            epoch:
+                The :py:mod:`~pyglet.clock` time at which the animation
+                time is 0.
+        """
+        super().__init__(texture, blend_src, blend_dest, program, parent)
+        self.frame_bounds = frame_bounds
+        self.frame_regions = frame_regions
+        self.frame_ends = frame_ends
+        self.loop_duration = loop_duration
+        self.epoch = epoch
+
+    def set_state(self) -> None:
+        super().set_state()
+        # Uploads are skipped while the program holds this array's table:
+        self.program['frame_bounds'] = self.frame_bounds
+        self.program['frame_regions'] = self.frame_regions
+        if self.frame_ends is not None:
+            self.program['frame_ends'] = self.frame_ends
+            self.program['loop_duration'] = self.loop_duration
+            self.program['time'] = clock.get_default().time() - self.epoch
+
+    def has_same_state(self, other: Group) -> bool:
+        return other is self
+
+    def __eq__(self, other: Group) -> bool:
+        return other is self
+
+    def __hash__(self) -> int:
+        return id(self)
+
+
+class SpriteArrayView:
+    """A view of a single sprite of a :py:class:`SpriteArray`.
+
+    Views are returned by indexing a SpriteArray, and read and write the
+    array's data directly. They are meant for code that updates few sprites,
+    or expects the properties of a :py:class:`Sprite`.
+    """
+
+    __slots__ = ('_array', '_index')
+
+    def __init__(self, array: SpriteArray, index: int) -> None:
+        """Create a view of a sprite in a SpriteArray.
+
+        Applications should index the SpriteArray instead.
+        """
+        self._array = array
+        self._index = index
+
+    def _get(self, buffer: AttributeBufferObject) -> list[float]:
+        count = buffer.count
+        return buffer.data[self._index * count:(self._index + 1) * count]
+
+    @property
+    def index(self) -> int:
+        """The index of this sprite in the array."""
+        return self._index
+
+    @property
+    def position(self) -> tuple[float, float, float]:
+        """The (x, y, z) coordinates of the sprite, as a tuple."""
+        return tuple(self._get(self._array._translate))  # noqa: SLF001
+
+    @position.setter
+    def position(self, position: tuple[float, float, float]) -> None:
+        self._array._translate.set_region(self._index, 1, position)  # noqa: SLF001
+
+    @property
+    def x(self) -> float:
+        """X coordinate of the sprite."""
+        return self._get(self._array._translate)[0]  # noqa: SLF001
+
+    @x.setter
+    def x(self, x: float) -> None:
+        _, y, z = self.position
+        self.position = x, y, z
+
+    @property
+    def y(self) -> float:
+        """Y coordinate of the sprite."""
+        return self._get(self._array._translate)[1]  # noqa: SLF001
+
+    @y.setter
+    def y(self, y: float) -> None:
+        x, _, z = self.position
+        self.position = x, y, z
+
+    @property
+    def z(self) -> float:
+        """Z coordinate of the sprite."""
+        return self._get(self._array._translate)[2]  # noqa: SLF001
+
+    @z.setter
+    def z(self, z: float) -> None:
+        x, y, _ = self.position
+        self.position = x, y, z
+
+    @property
+    def rotation(self) -> float:
+        """Clockwise rotation of the sprite, in degrees."""
+        return self._get(self._array._rotation)[0]  # noqa: SLF001
+
+    @rotation.setter
+    def rotation(self, rotation: float) -> None:
+        self._array._rotation.set_region(self._index, 1, (rotation,))  # noqa: SLF001
+
+    @property
+    def scale_x(self) -> float:
+        """Horizontal scaling factor."""
+        return self._get(self._array._scale)[0]  # noqa: SLF001
+
+    @scale_x.setter
+    def scale_x(self, scale_x: float) -> None:
+        self._array._scale.set_region(self._index, 1, (scale_x, self.scale_y))  # noqa: SLF001
+
+    @property
+    def scale_y(self) -> float:
+        """Vertical scaling factor."""
+        return self._get(self._array._scale)[1]  # noqa: SLF001
+
+    @scale_y.setter
+    def scale_y(self, scale_y: float) -> None:
+        self._array._scale.set_region(self._index, 1, (self.scale_x, scale_y))  # noqa: SLF001
+
+    @property
+    def color(self) -> tuple[int, int, int, int]:
+        """Blend color, as an RGBA or RGB tuple of integers."""
+        return tuple(self._get(self._array._colors))  # noqa: SLF001
+
+    @color.setter
+    def color(self, rgba: tuple[int, int, int, int] | tuple[int, int, int]) -> None:
+        r, g, b, *a = rgba
+        self._array._colors.set_region(self._index, 1, (r, g, b, a[0] if a else 255))  # noqa: SLF001
+
+    @property
+    def opacity(self) -> int:
+        """Blend opacity, from 0 (transparent) to 255 (opaque)."""
+        return self._get(self._array._colors)[3]  # noqa: SLF001
+
+    @opacity.setter
+    def opacity(self, opacity: int) -> None:
+        r, g, b, _ = self.color
+        self.color = r, g, b, opacity
+
+    @property
+    def frame_index(self) -> int:
+        """The index of the frame image shown by the sprite.
+
+        Not available if the array shows an Animation.
+        """
+        return int(self._get(self._array._get_buffer('frame'))[0])  # noqa: SLF001
+
+    @frame_index.setter
+    def frame_index(self, index: int) -> None:
+        self._array._get_buffer('frame').set_region(self._index, 1, (index,))  # noqa: SLF001
+
+    @property
+    def start_time(self) -> float:
+        """The animation time at which the sprite's Animation started.
+
+        Only available if the array shows an Animation. Set it to
+        :py:attr:`SpriteArray.time` to restart the animation.
+        """
+        return self._get(self._array._get_buffer('start_time'))[0]  # noqa: SLF001
+
+    @start_time.setter
+    def start_time(self, time: float) -> None:
+        self._array._get_buffer('start_time').set_region(self._index, 1, (time,))  # noqa: SLF001
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(index={self._index}, position={self.position})"
+
+
+class SpriteArray:
+    """A resizable array of sprites, stored as one contiguous array per property.
+
+    Rather than sprite objects, a SpriteArray holds the positions, rotations,
+    scales, colors and frame indices of all of its sprites in arrays that are
+    directly backed by the vertex buffers. Each array can be replaced in a
+    single call with a sequence, or any object supporting the buffer protocol
+    such as a NumPy array. The arrays can also be accessed as writable
+    memoryviews, so that simulation code can update every sprite with a single
+    vectorised operation::
+
+        sprites = pyglet.sprite.SpriteArray(frames, count=50_000, batch=batch)
+        positions = numpy.asarray(sprites.positions)    # Shape (50000, 3)
+        positions[:, 0] += velocities * dt
+
+    Every sprite shows one of the frame images, by index. The frames must be
+    regions of the same texture. Indexing the array returns a
+    :py:class:`SpriteArrayView`, with properties like those of a
+    :py:class:`Sprite`.
+
+    If an :py:class:`~pyglet.image.Animation` is given instead of frames,
+    the frame of each sprite is computed by the shader, from the time its
+    animation started. No clock callbacks are scheduled, and no data is
+    uploaded when frames change. The ``on_animation_end`` event of
+    :py:class:`Sprite` is not available.
+    """
+
+    def __init__(self,
+                 frames: Sequence[AbstractImage] | AbstractImage | Animation,
+                 count: int = 0,
+                 blend_src: int = GL_SRC_ALPHA,
+                 blend_dest: int = GL_ONE_MINUS_SRC_ALPHA,
+                 batch: Batch | None = None,
+                 group: Group | None = None,
+                 subpixel: bool = False,
+                 program: ShaderProgram | None = None) -> None:
+        """Create a SpriteArray.
+
+        Args:
+            frames:
+                The images the sprites can show, or an Animation played by
+                all sprites. The images must be regions of a single texture,
+                see :py:meth:`~pyglet.image.Animation.add_to_texture_bin`.
+                The number of frames is limited by the uniform storage of
+                the OpenGL implementation, to around a hundred.
+            count:
+                The initial number of sprites.
+            blend_src:
+                OpenGL blend source mode.  The default is suitable for
+                compositing sprites drawn from back-to-front.
+            blend_dest:
+                OpenGL blend destination mode.  The default is suitable for
+                compositing sprites drawn from back-to-front.
+            batch:
+                Optional batch to add the sprites to.
+            group:
+                Optional parent group of the sprites.
+            subpixel:
+                Allow floating-point coordinates for the sprite corners.
+            program:
+                A custom ShaderProgram, with the attributes and uniforms of
+                the default sprite array shader.
+        """
+        animation = None
+        if isinstance(frames, image.Animation):
+            animation = frames
+            frames = [frame.image for frame in animation.frames]
+        elif isinstance(frames, image.AbstractImage):
+            frames = (frames,)
+
+        textures = [frame.get_texture() for frame in frames]
+        texture = textures[0]
+        if any(frame.id != texture.id for frame in textures):
+            msg = "All frames of a SpriteArray must be regions of the same texture."
+            raise ValueError(msg)
+
+        self._frames = textures
+        self._animation = animation
+        self._batch = batch
+        self._epoch = clock.get_default().time()
+
+        frame_bounds = []
+        frame_regions = []
+        for frame in textures:
+            x1 = -frame.anchor_x
+            y1 = -frame.anchor_y
+            x2 = x1 + frame.width
+            y2 = y1 + frame.height
+            if not subpixel:
+                x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
+            tex_coords = frame.tex_coords
+            frame_bounds.append((x1, y1, x2, y2))
+            frame_regions.append((tex_coords[0], tex_coords[1], tex_coords[6], tex_coords[7]))
+
+        frame_ends = None
+        loop_duration = 0.0
+        if animation:
+            frame_ends = []
+            end = 0.0
+            for frame in animation.frames:
+                # A frame without a duration is shown forever:
+                end = math.inf if frame.duration is None else end + frame.duration
+                frame_ends.append(end)
+            if end != math.inf:
+                loop_duration = end
+
+        # The uniform arrays have at least two items:
+        if len(textures) == 1:
+            frame_bounds *= 2
+            frame_regions *= 2
+            if frame_ends:
+                frame_ends.append(math.inf)
+
+        program = program or get_default_sprite_array_shader(len(textures), animation is not None)
+        self._group = SpriteArrayGroup(texture, frame_bounds, frame_regions, blend_src, blend_dest, program, group,
+                                       frame_ends, loop_duration, self._epoch)
+
+        # Animated sprites have the time their animation started, instead of a frame:
+        per_sprite = 'start_time' if animation else 'frame'
+        self._vertex_list = program.vertex_list_instanced_indexed(
+            4, GL_TRIANGLES, [0, 1, 2, 0, 2, 3], ('translate', 'colors', 'scale', 'rotation', per_sprite),
+            batch, self._group,
+            corner=('f', (0, 0, 1, 0, 1, 1, 0, 1)),
+            translate='f', colors='Bn', scale='f', rotation='f', **{per_sprite: 'f'})
+
+        self._domain = self._vertex_list.domain
+        self._count = 0
+        self._domain.set_instance_count(0)
+
+        buffers = self._domain.attrib_name_buffers
+        self._translate = buffers['translate']
+        self._colors = buffers['colors']
+        self._scale = buffers['scale']
+        self._rotation = buffers['rotation']
+        self._per_sprite = buffers[per_sprite]
+
+        self.resize(count)
+
+    def resize(self, count: int) -> None:
+        """Change the number of sprites.
+
+        New sprites are placed at the origin, with a scale of 1, no rotation,
+        a white color and the first frame. If the array is animated, their
+        animation starts at the current :py:attr:`time`. Previously created
+        memoryviews are no longer valid.
+        """
+        old_count = self._count
+        self._domain.set_instance_count(count)
+        self._count = count
+
+        if count > old_count:
+            new = count - old_count
+            self._translate.set_region(old_count, new, (0.0, 0.0, 0.0) * new)
+            self._colors.set_region(old_count, new, (255, 255, 255, 255) * new)
+            self._scale.set_region(old_count, new, (1.0, 1.0) * new)
+            self._rotation.set_region(old_count, new, (0.0,) * new)
+            start = self.time if self._animation else 0.0
+            self._per_sprite.set_region(old_count, new, (start,) * new)
+
+    def _get_buffer(self, name: str) -> AttributeBufferObject:
+        try:
+            return self._domain.attrib_name_buffers[name]
+        except KeyError:
+            kind = "animated" if self._animation else "not animated"
+            msg = f"The '{name}' attribute is not available, as the SpriteArray is {kind}."
+            raise ValueError(msg) from None
+
+    def _view(self, buffer: AttributeBufferObject) -> memoryview:
+        region = buffer.get_region(0, self._count)
+        buffer.invalidate_region(0, self._count)
+        view = memoryview(region).cast('B')
+        # Memoryviews cannot have a shape containing zero:
+        if buffer.count > 1 and self._count:
+            return view.cast(buffer.c_type._type_, (self._count, buffer.count))  # noqa: SLF001
+        return view.cast(buffer.c_type._type_)  # noqa: SLF001
+
+    def _set(self, buffer: AttributeBufferObject, data: Any) -> None:
+        try:
+            buffer.set_region(0, self._count, data)
+        except ValueError:
+            msg = f"Invalid data size. Expected {buffer.count * self._count} values."
+            raise ValueError(msg) from None
+
+    @property
+    def positions(self) -> memoryview:
+        """The (x, y, z) position of each sprite, with a shape of (count, 3).
+
+        Reading this property returns a writable view of the vertex data,
+        which is marked as changed. A new view should be requested for every
+        frame it is written to. Setting the property copies the data, which
+        must have ``count * 3`` values.
+        """
+        return self._view(self._translate)
+
+    @positions.setter
+    def positions(self, data: Any) -> None:
+        self._set(self._translate, data)
+
+    @property
+    def rotations(self) -> memoryview:
+        """The clockwise rotation of each sprite, in degrees.
+
+        See :py:attr:`positions` for the use of this view.
+        """
+        return self._view(self._rotation)
+
+    @rotations.setter
+    def rotations(self, data: Any) -> None:
+        self._set(self._rotation, data)
+
+    @property
+    def scales(self) -> memoryview:
+        """The (scale_x, scale_y) factors of each sprite, with a shape of (count, 2).
+
+        See :py:attr:`positions` for the use of this view.
+        """
+        return self._view(self._scale)
+
+    @scales.setter
+    def scales(self, data: Any) -> None:
+        self._set(self._scale, data)
+
+    @property
+    def colors(self) -> memoryview:
+        """The RGBA color of each sprite, as unsigned bytes with a shape of (count, 4).
+
+        See :py:attr:`positions` for the use of this view.
+        """
+        return self._view(self._colors)
+
+    @colors.setter
+    def colors(self, data: Any) -> None:
+        self._set(self._colors, data)
+
+    @property
+    def frame_indices(self) -> memoryview:
+        """The index of the frame image shown by each sprite, stored as floats.
+
+        Not available if the array shows an Animation. See
+        :py:attr:`positions` for the use of this view.
+        """
+        return self._view(self._get_buffer('frame'))
+
+    @frame_indices.setter
+    def frame_indices(self, data: Any) -> None:
+        self._set(self._get_buffer('frame'), data)
+
+    @property
+    def start_times(self) -> memoryview:
+        """The animation time at which the Animation of each sprite started.
+
+        Only available if the array shows an Animation. Setting a start time
+        to the current :py:attr:`time` restarts that sprite's animation. See
+        :py:attr:`positions` for the use of this view.
+        """
+        return self._view(self._get_buffer('start_time'))
+
+    @start_times.setter
+    def start_times(self, data: Any) -> None:
+        self._set(self._get_buffer('start_time'), data)
+
+    @property
+    def time(self) -> float:
+        """The current animation time, in seconds since the array was created."""
+        return clock.get_default().time() - self._epoch
+
+    @property
+    def animation(self) -> Animation | None:
+        """The Animation shown by the sprites, if any."""
+        return self._animation
+
+    @property
+    def frames(self) -> list[Texture]:
+        """The frame images of the sprites."""
+        return self._frames[:]
+
+    @property
+    def batch(self) -> Batch | None:
+        """The Batch the sprites are drawn in."""
+        return self._batch
+
+    @property
+    def program(self) -> ShaderProgram:
+        """The ShaderProgram used to draw the sprites."""
+        return self._group.program
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> SpriteArrayView:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            msg = "SpriteArray index out of range"
+            raise IndexError(msg)
+        return SpriteArrayView(self, index)
+
+    def __iter__(self) -> Iterator[SpriteArrayView]:
+        return (SpriteArrayView(self, index) for index in range(self._count))
+
+    def delete(self) -> None:
+        """Release the graphics resources of the array."""
+        self._vertex_list.delete()
+        self._vertex_list = None
+        self._count = 0
+
+    def draw(self) -> None:
+        """Draw all sprites of this array.
+
+        This is only needed if the array was created without a Batch.
+        """
+        self._group.set_state_recursive()
+        self._vertex_list.draw(GL_TRIANGLES)
+        self._group.unset_state_recursive()
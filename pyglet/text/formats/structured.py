@@ -10,9 +10,6 @@ from pyglet.gl import (
     GL_BLEND,
     GL_ONE_MINUS_SRC_ALPHA,
     GL_SRC_ALPHA,
-    GL_TEXTURE0,
-    glActiveTexture,
-    glBindTexture,
     glBlendFunc,
     glDisable,
     glEnable,
@@ -37,8 +34,7 @@ class _InlineElementGroup(pyglet.graphics.Group):
     def set_state(self) -> None:
         self.program.use()
 
-        glActiveTexture(GL_TEXTURE0)
-        glBindTexture(self.texture.target, self.texture.id)
+        pyglet.gl.current_context.bindings.bind_texture(self.texture.target, self.texture.id, 0)
 
         glEnable(GL_BLEND)
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
@@ -23,10 +23,7 @@ from pyglet.gl import (
     GL_NEAREST,
     GL_ONE_MINUS_SRC_ALPHA,
     GL_SRC_ALPHA,
-    GL_TEXTURE0,
     GL_TRIANGLES,
-    glActiveTexture,
-    glBindTexture,
     glBlendFunc,
     glDisable,
     glEnable,
@@ -768,8 +765,7 @@ class TextLayoutGroup(graphics.Group):
         self.program.use()
         self.program["scissor"] = False
 
-        glActiveTexture(GL_TEXTURE0)
-        glBindTexture(self.texture.target, self.texture.id)
+        pyglet.gl.current_context.bindings.bind_texture(self.texture.target, self.texture.id, 0)
 
         glEnable(GL_BLEND)
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
@@ -781,6 +777,18 @@ class TextLayoutGroup(graphics.Group):
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.texture})"
 
+    def has_same_state(self, other: graphics.Group) -> bool:
+        """Whether another TextLayoutGroup uses the same program and texture.
+
+        Subclasses are never considered to have the same state, as they may
+        set state of their own. They must override this method to be
+        coalesced.
+        """
+        return (self.__class__ is TextLayoutGroup and other.__class__ is TextLayoutGroup and
+                self.program.id == other.program.id and
+                self.texture.target == other.texture.target and
+                self.texture.id == other.texture.id)
+
     def __eq__(self, other: object) -> bool:
         return (other.__class__ is self.__class__ and
                 self.parent is other.parent and
@@ -0,0 +1,25 @@
+import pytest
+
+from pyglet.image import get_buffer_manager
+from pyglet.window import Window
+
+
+@pytest.fixture
+def window():
+    """A small hidden window, providing the GL context of the test."""
+    window = Window(96, 96, visible=False)
+    yield window
+    window.close()
+
+
+@pytest.fixture
+def render(window):
+    """Provide a function drawing a Batch into the window, and returning the RGBA pixels."""
+
+    def _render(batch):
+        window.switch_to()
+        window.clear()
+        batch.draw()
+        return bytes(get_buffer_manager().get_color_buffer().get_image_data().get_data('RGBA'))
+
+    return _render
@@ -436,3 +436,23 @@ def test_mix_resize():
     for region in regions:
         allocator.dealloc(region)
     assert allocator.get_free_size() == allocator.capacity
+
+
+def test_generation():
+    # The generation only changes when the allocated layout changes.
+    allocator = allocation.Allocator(100)
+    generation = allocator.generation
+    allocator.alloc(0)
+    allocator.get_allocated_regions()
+    assert allocator.generation == generation
+
+    start = allocator.alloc(10)
+    assert allocator.generation != generation
+    generation = allocator.generation
+
+    start = allocator.realloc(start, 10, 20)
+    assert allocator.generation != generation
+    generation = allocator.generation
+
+    allocator.dealloc(start, 20)
+    assert allocator.generation != generation
@@ -0,0 +1,120 @@
+from pyglet.gl import GL_ONE_MINUS_SRC_ALPHA, GL_SRC_ALPHA, GL_TRIANGLES
+from pyglet.graphics import Batch, Group, ShaderGroup, TextureGroup, get_default_shader
+from pyglet.image import SolidColorImagePattern, Texture
+from pyglet.shapes import _ShapeGroup, get_default_shader as get_default_shape_shader
+from pyglet.sprite import SpriteGroup, get_default_shader as get_default_sprite_shader
+from pyglet.text.layout import TextLayoutGroup
+
+
+class RecordingGroup(Group):
+    def __init__(self, name, calls, state, order=0, parent=None):
+        super().__init__(order, parent)
+        self.name = name
+        self.calls = calls
+        self.state = state
+
+    def set_state(self):
+        self.calls.append(('set', self.name))
+
+    def unset_state(self):
+        self.calls.append(('unset', self.name))
+
+    def has_same_state(self, other):
+        return self.__class__ is other.__class__ and self.state == other.state
+
+    def __eq__(self, other):
+        return self is other
+
+    def __hash__(self):
+        return id(self)
+
+
+def _add_vertex_list(batch, group):
+    attributes = get_default_shader().attributes.copy()
+    domain = batch.get_domain(False, False, GL_TRIANGLES, group, attributes)
+    return domain.create(3)
+
+
+def _draw(compile_draw_list):
+    calls = []
+    batch = Batch(compile_draw_list=compile_draw_list)
+    parent_a = Group(order=0)
+    parent_b = Group(order=1)
+    groups = [RecordingGroup('a', calls, 'texture', parent=parent_a),
+              RecordingGroup('b', calls, 'texture', parent=parent_b),
+              RecordingGroup('c', calls, 'other', order=2)]
+    vertex_lists = [_add_vertex_list(batch, group) for group in groups]
+    batch.draw()
+    return calls, batch, vertex_lists
+
+
+def test_uncompiled_draw_list():
+    calls, batch, _ = _draw(False)
+    assert calls == [('set', 'a'), ('unset', 'a'),
+                     ('set', 'b'), ('unset', 'b'),
+                     ('set', 'c'), ('unset', 'c')]
+    # Each group set and unset, plus one call per domain and per parent group.
+    assert len(batch._draw_list) == 3 * 2 + 3 + 2 * 2
+
+
+def test_compiled_draw_list():
+    calls, batch, _ = _draw(True)
+    # Groups sharing state are not unset and set again, and state-less groups are skipped:
+    assert calls == [('set', 'a'), ('unset', 'b'),
+                     ('set', 'c'), ('unset', 'c')]
+    # The consecutive draws of 'a' and 'b' are merged:
+    assert len(batch._draw_list) == 6
+
+
+def test_subclass_state_is_not_shared():
+    class BlendShaderGroup(ShaderGroup):
+        def __init__(self, program, blend_src):
+            super().__init__(program)
+            self.blend_src = blend_src
+
+    class ChannelTextureGroup(TextureGroup):
+        def __init__(self, texture, channel):
+            super().__init__(texture)
+            self.channel = channel
+
+    program = get_default_shader()
+    assert ShaderGroup(program).has_same_state(ShaderGroup(program, order=1))
+    assert not BlendShaderGroup(program, 0).has_same_state(BlendShaderGroup(program, 1))
+
+    texture = SolidColorImagePattern((255, 0, 0, 255)).create_image(4, 4).get_texture()
+    assert TextureGroup(texture).has_same_state(TextureGroup(texture, order=1))
+    assert not ChannelTextureGroup(texture, 0).has_same_state(ChannelTextureGroup(texture, 1))
+
+
+def test_subclass_of_pyglet_group_state_is_not_shared():
+    class MultiTextureSpriteGroup(SpriteGroup):
+        def __init__(self, texture, second_texture, program):
+            super().__init__(texture, GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA, program)
+            self.second_texture = second_texture
+
+    class StencilShapeGroup(_ShapeGroup):
+        def __init__(self, program, stencil):
+            super().__init__(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA, program)
+            self.stencil = stencil
+
+    class ColorTextLayoutGroup(TextLayoutGroup):
+        def __init__(self, texture, program, color):
+            super().__init__(texture, program)
+            self.color = color
+
+    image = SolidColorImagePattern((255, 0, 0, 255)).create_image(4, 4)
+    texture, second, third = (image.create_texture(Texture) for _ in range(3))
+
+    program = get_default_sprite_shader()
+    blend = GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA
+    assert SpriteGroup(texture, *blend, program).has_same_state(SpriteGroup(texture, *blend, program))
+    assert not MultiTextureSpriteGroup(texture, second, program).has_same_state(
+        MultiTextureSpriteGroup(texture, third, program))
+
+    program = get_default_shape_shader()
+    assert _ShapeGroup(*blend, program).has_same_state(_ShapeGroup(*blend, program))
+    assert not StencilShapeGroup(program, 0).has_same_state(StencilShapeGroup(program, 1))
+
+    program = get_default_shader()
+    assert TextLayoutGroup(texture, program).has_same_state(TextLayoutGroup(texture, program))
+    assert not ColorTextLayoutGroup(texture, program, 0).has_same_state(ColorTextLayoutGroup(texture, program, 1))
@@ -0,0 +1,79 @@
+from pyglet.gl import GL_TRIANGLES
+from pyglet.graphics import Batch, Group, get_default_shader
+
+
+def _create_batch(**kwargs):
+    batch = Batch(**kwargs)
+    attributes = get_default_shader().attributes.copy()
+    group = Group()
+    domain = batch.get_domain(False, False, GL_TRIANGLES, group, attributes)
+    vertex_lists = [domain.create(3) for _ in range(3)]
+    indexed_domain = batch.get_domain(True, False, GL_TRIANGLES, Group(order=1), attributes)
+    indexed_list = indexed_domain.create(4, 6)
+    indexed_list.indices = (0, 1, 2, 0, 2, 3)
+    return batch, vertex_lists
+
+
+def test_stats_disabled():
+    batch, _ = _create_batch()
+    batch.draw()
+    assert batch.stats is None
+
+
+def test_stats():
+    batch, vertex_lists = _create_batch()
+    batch.enable_stats()
+    batch.draw()
+    stats = batch.stats
+    assert stats.groups == 2
+    assert stats.state_changes == 4
+    assert stats.domains == 2
+    assert stats.draw_calls == 2
+    assert stats.multi_draw_calls == 0
+    assert stats.primitives == 5
+    assert stats.bytes_committed > 0
+    assert stats.gpu_times == {}
+
+    # Nothing changed, so nothing is uploaded:
+    batch.draw()
+    assert batch.stats.bytes_committed == 0
+
+    vertex_lists[1].delete()
+    batch.draw()
+    assert batch.stats.draw_calls == 1
+    assert batch.stats.multi_draw_calls == 1
+    assert batch.stats.primitives == 4
+
+    batch.disable_stats()
+    assert batch.stats is None
+
+
+def test_stats_culling():
+    batch, vertex_lists = _create_batch(culling_cell_size=64)
+    for i, vertex_list in enumerate(vertex_lists):
+        vertex_list.set_bounds(i * 100, 0, 10, 10)
+    batch.view = (0, 0, 150, 150)
+    batch.enable_stats()
+    batch.draw()
+    # Only the first two vertex lists, and the indexed list without bounds, are drawn:
+    assert batch.stats.draw_calls == 2
+    assert batch.stats.primitives == 4
+
+
+def test_stats_compiled():
+    batch, _ = _create_batch(compile_draw_list=True)
+    batch.enable_stats()
+    batch.draw()
+    # The groups do not change any state:
+    assert batch.stats.groups == 2
+    assert batch.stats.state_changes == 0
+    assert batch.stats.domains == 2
+
+
+def test_gpu_timers():
+    batch, _ = _create_batch()
+    batch.enable_stats(gpu_timers=True)
+    for _ in range(3):
+        batch.draw()
+    assert len(batch.stats.gpu_times) == 2
+    batch.disable_stats()
@@ -0,0 +1,139 @@
+import pytest
+
+import pyglet
+from pyglet import gl
+from pyglet.graphics import Batch, Group, get_default_shader
+from pyglet.image import SolidColorImagePattern
+from pyglet.sprite import Sprite, SpriteGroup
+from pyglet.graphics.vertexarray import VertexArray
+from pyglet.graphics.vertexbuffer import BufferObject
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    calls = []
+
+    def record(name):
+        func = getattr(gl, name)
+
+        def wrapper(*args):
+            calls.append(name)
+            return func(*args)
+
+        monkeypatch.setattr(gl, name, wrapper)
+
+    for name in ('glUseProgram', 'glBindVertexArray', 'glBindBuffer', 'glActiveTexture', 'glBindTexture'):
+        record(name)
+
+    pyglet.gl.current_context.bindings.invalidate()
+    return calls
+
+
+@pytest.fixture
+def skip_redundant_binds():
+    bindings = pyglet.gl.current_context.bindings
+    previous = pyglet.options.skip_redundant_binds
+    pyglet.options.skip_redundant_binds = True
+    bindings.invalidate()
+    yield
+    pyglet.options.skip_redundant_binds = previous
+    bindings.invalidate()
+
+
+def test_program(calls):
+    program = get_default_shader()
+    program.use()
+    program.use()
+    assert calls == ['glUseProgram']
+
+    program.stop()
+    program.stop()
+    assert calls == ['glUseProgram'] * 2
+
+
+def test_vertex_array(skip_redundant_binds, calls):
+    vao = VertexArray()
+    buffer = BufferObject(16)
+    calls.clear()
+
+    vao.bind()
+    buffer.bind_to_index_buffer()
+    vao.bind()
+    buffer.bind_to_index_buffer()
+    assert calls == ['glBindVertexArray', 'glBindBuffer']
+
+    # The element array buffer binding belongs to the vertex array:
+    vao.unbind()
+    vao.bind()
+    buffer.bind_to_index_buffer()
+    assert calls == ['glBindVertexArray', 'glBindBuffer', 'glBindVertexArray', 'glBindVertexArray', 'glBindBuffer']
+
+
+def test_buffer(skip_redundant_binds, calls):
+    buffer = BufferObject(16)
+    calls.clear()
+
+    buffer.bind()
+    buffer.set_data_region((gl.GLubyte * 4)(), 0, 4)
+    assert calls == []
+
+    buffer.delete()
+    other = BufferObject(16)
+    # The cache is cleared when objects are deleted, so the new buffer is bound:
+    assert calls == ['glBindBuffer']
+    other.delete()
+
+
+def test_texture(skip_redundant_binds, calls):
+    texture = pyglet.image.Texture.create(4, 4)
+    calls.clear()
+
+    texture.bind(0)
+    texture.bind(0)
+    assert calls == ['glActiveTexture', 'glBindTexture']
+
+    texture.bind(1)
+    texture.bind(0)
+    assert calls == ['glActiveTexture', 'glBindTexture', 'glActiveTexture', 'glBindTexture', 'glActiveTexture']
+
+
+def test_invalidate(calls):
+    program = get_default_shader()
+    program.use()
+    pyglet.gl.current_context.bindings.invalidate()
+    program.use()
+    assert calls == ['glUseProgram'] * 2
+
+
+def test_texture_binds_are_issued_by_default(calls):
+    texture = pyglet.image.Texture.create(4, 4)
+    calls.clear()
+
+    texture.bind(0)
+    texture.bind(0)
+    assert calls == ['glActiveTexture', 'glBindTexture'] * 2
+
+
+class RawBindSpriteGroup(SpriteGroup):
+    def set_state(self):
+        self.program.use()
+        gl.glActiveTexture(gl.GL_TEXTURE0)
+        gl.glBindTexture(self.texture.target, self.texture.id)
+
+
+class RawBindSprite(Sprite):
+    group_class = RawBindSpriteGroup
+
+
+def test_groups_binding_textures_directly(render):
+    red = SolidColorImagePattern((255, 0, 0, 255)).create_image(8, 8)
+    green = SolidColorImagePattern((0, 255, 0, 255)).create_image(8, 8)
+    batch = Batch()
+    sprites = [Sprite(red, 0, 0, batch=batch, group=Group(order=0)),
+               RawBindSprite(green, 8, 0, batch=batch, group=Group(order=1)),
+               Sprite(red, 16, 0, batch=batch, group=Group(order=2))]
+
+    pixels = render(batch)
+    # The last sprite binds its texture again after the group bound one directly:
+    x = int(sprites[2].x) + 4
+    assert tuple(pixels[x * 4:(x + 1) * 4]) == (255, 0, 0, 255)
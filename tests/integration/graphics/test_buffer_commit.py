@@ -0,0 +1,67 @@
+import ctypes
+
+import pytest
+
+from pyglet.graphics import vertexbuffer
+
+
+@pytest.fixture
+def uploads(monkeypatch):
+    calls = []
+    buffer_sub_data = vertexbuffer.glBufferSubData
+    buffer_data = vertexbuffer.glBufferData
+
+    def _buffer_sub_data(target, offset, size, data):
+        calls.append(('sub', offset, size))
+        buffer_sub_data(target, offset, size, data)
+
+    def _buffer_data(target, size, data, usage):
+        calls.append(('full', 0, size))
+        buffer_data(target, size, data, usage)
+
+    monkeypatch.setattr(vertexbuffer, 'glBufferSubData', _buffer_sub_data)
+    monkeypatch.setattr(vertexbuffer, 'glBufferData', _buffer_data)
+    return calls
+
+
+def _create_buffer(vertices, uploads):
+    # 3 floats per vertex.
+    buffer = vertexbuffer.BackedBufferObject(vertices * 12, ctypes.c_float, 12, 3)
+    uploads.clear()
+    return buffer
+
+
+def test_sparse_commit(uploads):
+    buffer = _create_buffer(100000, uploads)
+    page_size = buffer.dirty_page_size
+    buffer.set_region(0, 1, (1, 2, 3))
+    buffer.set_region(99999, 1, (4, 5, 6))
+    buffer.commit()
+    last_page = buffer.size // page_size * page_size
+    assert uploads == [('sub', 0, page_size), ('sub', last_page, buffer.size - last_page)]
+
+    # Nothing more to upload:
+    buffer.commit()
+    assert len(uploads) == 2
+
+
+def test_coalesced_commit(uploads):
+    buffer = _create_buffer(100000, uploads)
+    page_size = buffer.dirty_page_size
+    # Spans two pages, and touches the following page:
+    count = page_size // 12 + 1
+    buffer.set_region(0, count, [1.0] * count * 3)
+    buffer.invalidate_region(page_size * 2 // 12 + 1, 1)
+    buffer.commit()
+    assert uploads == [('sub', 0, page_size * 3)]
+
+
+def test_full_commit(uploads):
+    buffer = _create_buffer(1000, uploads)
+    buffer.set_region(0, 1000, [1.0] * 3000)
+    buffer.commit()
+    assert uploads == [('full', 0, buffer.size)]
+
+    buffer.resize(buffer.size * 2)
+    buffer.commit()
+    assert uploads[-1] == ('full', 0, buffer.size)
@@ -0,0 +1,109 @@
+import pytest
+
+from pyglet.gl import (
+    GL_BLEND,
+    GL_BLEND_DST_ALPHA,
+    GL_BLEND_DST_RGB,
+    GL_BLEND_SRC_ALPHA,
+    GL_BLEND_SRC_RGB,
+    GL_ONE,
+    GL_ONE_MINUS_SRC_ALPHA,
+    GL_SRC_ALPHA,
+    GL_ZERO,
+    GLint,
+    glBlendFuncSeparate,
+    glDisable,
+    glEnable,
+    glGetIntegerv,
+    glIsEnabled,
+)
+from pyglet.graphics import Batch, CachedBatch
+from pyglet.shapes import Rectangle
+
+
+@pytest.fixture
+def render_count(monkeypatch):
+    count = [0]
+    draw = Batch.draw
+
+    def counting_draw(self):
+        count[0] += 1
+        draw(self)
+
+    monkeypatch.setattr(Batch, 'draw', counting_draw)
+    return count
+
+
+def test_cached_batch_renders_once(window, render_count):
+    batch = CachedBatch()
+    rectangle = Rectangle(0, 0, 10, 10, color=(255, 0, 0, 255), batch=batch)
+
+    batch.draw()
+    batch.draw()
+    assert render_count[0] == 1
+
+    data = batch.texture.get_image_data().get_data('RGBA', batch.texture.width * 4)
+    assert tuple(data[:4]) == (255, 0, 0, 255)
+    assert rectangle.batch is batch
+
+
+def test_cached_batch_rerenders_after_changes(window, render_count):
+    batch = CachedBatch()
+    rectangle = Rectangle(0, 0, 10, 10, batch=batch)
+    batch.draw()
+
+    rectangle.x = 5
+    batch.draw()
+    assert render_count[0] == 2
+
+    other = Rectangle(20, 0, 10, 10, batch=batch)
+    batch.draw()
+    assert render_count[0] == 3
+
+    other.delete()
+    batch.draw()
+    assert render_count[0] == 4
+
+    batch.invalidate()
+    batch.draw()
+    batch.draw()
+    assert render_count[0] == 5
+
+    batch.delete()
+    assert batch.texture is None
+
+
+def test_cached_batch_restores_blend_state(window):
+    batch = CachedBatch()
+    Rectangle(0, 0, 10, 10, batch=batch)
+
+    for enabled in (True, False):
+        if enabled:
+            glEnable(GL_BLEND)
+        else:
+            glDisable(GL_BLEND)
+        glBlendFuncSeparate(GL_SRC_ALPHA, GL_ONE, GL_ZERO, GL_ONE_MINUS_SRC_ALPHA)
+        batch.draw()
+
+        assert bool(glIsEnabled(GL_BLEND)) is enabled
+        blend_func = []
+        for name in (GL_BLEND_SRC_RGB, GL_BLEND_DST_RGB, GL_BLEND_SRC_ALPHA, GL_BLEND_DST_ALPHA):
+            value = GLint()
+            glGetIntegerv(name, value)
+            blend_func.append(value.value)
+        assert blend_func == [GL_SRC_ALPHA, GL_ONE, GL_ZERO, GL_ONE_MINUS_SRC_ALPHA]
+
+    glDisable(GL_BLEND)
+    batch.delete()
+
+
+def test_cached_batch_delete_releases_quad(window):
+    batch = CachedBatch()
+    Rectangle(0, 0, 10, 10, batch=batch)
+    batch.draw()
+
+    quad = batch._quad
+    domain = quad.domain
+    batch.delete()
+    assert batch._quad is None
+    assert quad not in domain._vertex_lists
@@ -0,0 +1,90 @@
+from pyglet.gl import GL_TRIANGLES
+from pyglet.graphics import Batch, Group, get_default_shader
+from pyglet.graphics.culling import SpatialGrid
+from pyglet.image import SolidColorImagePattern
+from pyglet.sprite import Sprite
+
+
+def test_grid_query():
+    grid = SpatialGrid(cell_size=10)
+    grid.add('a', (0, 0, 5, 5))
+    grid.add('b', (50, 50, 5, 5))
+    grid.add('c', (-30, 0, 100, 5))
+    grid.add('d')
+
+    assert grid.query((0, 0, 10, 10)) == {'a', 'c', 'd'}
+    assert grid.query((45, 45, 20, 20)) == {'b', 'd'}
+    assert grid.query((-1000, -1000, 2000, 2000)) == {'a', 'b', 'c', 'd'}
+    assert grid.query() == {'a', 'b', 'c', 'd'}
+
+
+def test_grid_set_bounds():
+    grid = SpatialGrid(cell_size=10)
+    grid.view = (0, 0, 50, 50)
+    grid.add('a')
+    grid.set_bounds('a', (0, 0, 5, 5))
+    generation = grid.generation
+
+    # Moving within the view, or to the same bounds, does not change the result of a query:
+    grid.set_bounds('a', (30, 30, 5, 5))
+    grid.set_bounds('a', (30, 30, 5, 5))
+    assert grid.generation == generation
+    assert grid.query((30, 30, 1, 1)) == {'a'}
+
+    grid.set_bounds('a', (100, 100, 5, 5))
+    assert grid.generation > generation
+    generation = grid.generation
+    grid.set_bounds('a', (200, 100, 5, 5))
+    assert grid.generation == generation
+    assert grid.query((0, 0, 10, 10)) == set()
+    assert grid.query((190, 90, 20, 20)) == {'a'}
+
+    assert grid.remove('a') == (200, 100, 5, 5)
+    assert 'a' not in grid
+    assert not grid._cells
+
+
+def test_batch_culling():
+    batch = Batch(culling_cell_size=64)
+    attributes = get_default_shader().attributes.copy()
+    domain = batch.get_domain(False, False, GL_TRIANGLES, Group(), attributes)
+    vertex_lists = [domain.create(3) for _ in range(4)]
+    for i, vertex_list in enumerate(vertex_lists[:3]):
+        vertex_list.set_bounds(i * 100, 0, 10, 10)
+
+    batch.draw()
+    assert list(domain._draw_args[1]) == [0]
+    assert list(domain._draw_args[2]) == [12]
+
+    # The last vertex list has no bounds, so is always drawn:
+    batch.view = (0, 0, 150, 150)
+    batch.draw()
+    assert list(domain._draw_args[1]) == [0, 9]
+    assert list(domain._draw_args[2]) == [6, 3]
+
+    vertex_lists[2].set_bounds(120, 0, 10, 10)
+    batch.draw()
+    assert list(domain._draw_args[1]) == [0]
+    assert list(domain._draw_args[2]) == [12]
+
+    vertex_lists[0].delete()
+    batch.view = None
+    batch.draw()
+    assert list(domain._draw_args[1]) == [3]
+    assert list(domain._draw_args[2]) == [9]
+
+
+def test_sprite_bounds():
+    image = SolidColorImagePattern((255, 0, 0, 255)).create_image(4, 4)
+    batch = Batch(culling_cell_size=64)
+    sprite = Sprite(image, 10, 10, batch=batch)
+    grid = sprite._vertex_list.domain.culling
+    assert grid.get_bounds(sprite._vertex_list) is not None
+
+    sprite.position = (500, 500, 0)
+    x, y, _, _ = grid.get_bounds(sprite._vertex_list)
+    assert x > 400 and y > 400
+
+    # Batches without culling do not need the bounds:
+    sprite.batch = Batch()
+    assert not sprite._culling
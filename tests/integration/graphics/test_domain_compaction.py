@@ -0,0 +1,60 @@
+from pyglet.gl import GL_TRIANGLES
+from pyglet.graphics import Batch, Group, get_default_shader
+
+
+def _create_vertex_lists(batch, indexed, count=20):
+    attributes = get_default_shader().attributes.copy()
+    domain = batch.get_domain(indexed, False, GL_TRIANGLES, Group(), attributes)
+    vertex_lists = []
+    for i in range(count):
+        if indexed:
+            vertex_list = domain.create(3, 3)
+            vertex_list.indices = (0, 1, 2)
+        else:
+            vertex_list = domain.create(3)
+        vertex_list.position[:] = (i, i, i) * 3
+        vertex_lists.append(vertex_list)
+    return domain, vertex_lists
+
+
+def test_compact():
+    domain, vertex_lists = _create_vertex_lists(Batch(), False)
+    for vertex_list in vertex_lists[::2]:
+        vertex_list.delete()
+    vertex_lists = vertex_lists[1::2]
+    assert len(domain.allocator.starts) == len(vertex_lists)
+
+    domain.compact()
+    assert domain.allocator.starts == [0]
+    assert domain.allocator.sizes == [3 * len(vertex_lists)]
+    assert domain.allocator.capacity == 32
+    for i, vertex_list in zip(range(1, 20, 2), vertex_lists):
+        assert tuple(vertex_list.position) == (i, i, i) * 3
+
+
+def test_compact_indexed():
+    domain, vertex_lists = _create_vertex_lists(Batch(), True)
+    for vertex_list in vertex_lists[::2]:
+        vertex_list.delete()
+    vertex_lists = vertex_lists[1::2]
+
+    domain.compact()
+    assert domain.allocator.starts == [0]
+    assert domain.index_allocator.starts == [0]
+    for i, vertex_list in zip(range(1, 20, 2), vertex_lists):
+        assert tuple(vertex_list.position) == (i, i, i) * 3
+        assert vertex_list.indices == [0, 1, 2]
+
+
+def test_compaction_threshold():
+    batch = Batch(compaction_threshold=0.25)
+    domain, vertex_lists = _create_vertex_lists(batch, True)
+    vertex_lists[0].delete()
+    batch.draw()
+    assert len(domain.allocator.starts) == 1
+    assert domain.allocator.starts[0] == 3
+
+    for vertex_list in vertex_lists[1::2]:
+        vertex_list.delete()
+    batch.draw()
+    assert domain.allocator.starts == [0]
@@ -0,0 +1,69 @@
+import pytest
+
+from pyglet.graphics import Batch
+from pyglet.image import SolidColorImagePattern, TextureArray
+from pyglet.sprite import GeometrySprite, Sprite, update_many
+
+
+@pytest.fixture
+def image():
+    image = SolidColorImagePattern((255, 0, 0, 255)).create_image(16, 8)
+    image.anchor_x = 8
+    image.anchor_y = 4
+    return image
+
+
+def _draw_sprites(render, sprite_class, image):
+    batch = Batch()
+    sprites = [sprite_class(image, 20, 30, batch=batch), sprite_class(image, 40, 40, batch=batch)]
+    sprites[0].opacity = 128
+    sprites[1].update(rotation=90, scale_x=1.5)
+    sprites[1].color = (0, 255, 0)
+    return render(batch)
+
+
+def test_geometry_sprite_matches_sprite(render, image):
+    pixels = _draw_sprites(render, GeometrySprite, image)
+    assert any(pixels)
+    assert pixels == _draw_sprites(render, Sprite, image)
+
+
+def test_geometry_sprite_stores_one_vertex(image):
+    sprite = GeometrySprite(image, x=1, y=2, batch=Batch())
+    sprite.position = (5, 6, 7)
+    sprite.color = (1, 2, 3, 4)
+
+    vertex_list = sprite._vertex_list
+    assert vertex_list.count == 1
+    assert list(vertex_list.translate) == [5, 6, 7]
+    assert list(vertex_list.colors) == [1, 2, 3, 4]
+    assert list(vertex_list.bounds) == [-8, -4, 8, 4]
+
+    sprite.visible = False
+    assert list(vertex_list.bounds) == [0, 0, 0, 0]
+
+    update_many([sprite], xs=[10], scales=[2])
+    assert list(vertex_list.translate) == [10, 6, 7]
+    assert list(vertex_list.scale) == [2, 2]
+
+
+def test_geometry_sprite_texture_region(image):
+    texture = image.get_texture()
+    region = texture.get_region(0, 0, 4, 4)
+    sprite = GeometrySprite(texture, batch=Batch())
+    sprite.image = region
+
+    vertex_list = sprite._vertex_list
+    u0, v0, _, u1, _, _, u2, v2, _, u3, _, _ = region.tex_coords
+    assert list(vertex_list.tex_coords_bottom) == pytest.approx([u0, v0, u1, v0])
+    assert list(vertex_list.tex_coords_top) == pytest.approx([u2, v2, u3, v2])
+
+
+def test_geometry_sprite_texture_array(image):
+    array = TextureArray.create(16, 8)
+    regions = array.allocate(image, image)
+    sprite = GeometrySprite(regions[1], batch=Batch())
+    assert list(sprite._vertex_list.tex_layer) == [1]
+
+    sprite.image = regions[0]
+    assert list(sprite._vertex_list.tex_layer) == [0]
@@ -0,0 +1,80 @@
+import ctypes
+
+import pytest
+
+import pyglet
+from pyglet.gl import GL_ARRAY_BUFFER, GL_TRIANGLES, GLuint, gl_info, glGetBufferSubData
+from pyglet.graphics import Batch, Group, get_default_shader
+
+pytestmark = pytest.mark.skipif(not (gl_info.have_version(4, 3) or gl_info.have_extension('GL_ARB_multi_draw_indirect')),
+                                reason='Multi-draw-indirect is not supported.')
+
+
+def _read_commands(domain, length):
+    buffer = domain._indirect_buffer
+    commands = (GLuint * (domain._draw_args[0] * length))()
+    pyglet.gl.current_context.bindings.bind_buffer(GL_ARRAY_BUFFER, buffer.id)
+    glGetBufferSubData(GL_ARRAY_BUFFER, 0, ctypes.sizeof(commands), commands)
+    return [tuple(commands[i:i + length]) for i in range(0, len(commands), length)]
+
+
+def test_indirect_draw_arrays():
+    batch = Batch(indirect_draw=True)
+    attributes = get_default_shader().attributes.copy()
+    domain = batch.get_domain(False, False, GL_TRIANGLES, Group(), attributes)
+    vertex_lists = [domain.create(3) for _ in range(4)]
+    vertex_lists[1].delete()
+    batch.draw()
+
+    assert domain._draw_args[1] is None
+    assert _read_commands(domain, 4) == [(3, 1, 0, 0), (6, 1, 6, 0)]
+
+    # Commands are rewritten when the allocator changes:
+    vertex_lists[3].delete()
+    batch.draw()
+    assert _read_commands(domain, 4) == [(3, 1, 0, 0), (3, 1, 6, 0)]
+
+    # A single region is drawn directly:
+    vertex_lists[2].delete()
+    batch.draw()
+    assert list(domain._draw_args[1]) == [0]
+
+
+def test_indirect_draw_elements():
+    batch = Batch(indirect_draw=True)
+    attributes = get_default_shader().attributes.copy()
+    domain = batch.get_domain(True, False, GL_TRIANGLES, Group(), attributes)
+    vertex_lists = [domain.create(3, 3) for _ in range(3)]
+    for vertex_list in vertex_lists:
+        vertex_list.indices = (0, 1, 2)
+    vertex_lists[1].delete()
+    batch.draw()
+
+    assert domain._draw_args[1] is None
+    assert _read_commands(domain, 5) == [(3, 1, 0, 0, 0), (3, 1, 6, 0, 0)]
+
+
+def test_indirect_draw_disabled():
+    batch = Batch()
+    attributes = get_default_shader().attributes.copy()
+    domain = batch.get_domain(False, False, GL_TRIANGLES, Group(), attributes)
+    vertex_lists = [domain.create(3) for _ in range(3)]
+    vertex_lists[1].delete()
+    batch.draw()
+    assert domain._indirect_buffer is None
+    assert list(domain._draw_args[1]) == [0, 6]
+
+
+def test_indirect_draw_stats():
+    batch = Batch(indirect_draw=True)
+    attributes = get_default_shader().attributes.copy()
+    domain = batch.get_domain(False, False, GL_TRIANGLES, Group(), attributes)
+    vertex_lists = [domain.create(3) for _ in range(4)]
+    vertex_lists[1].delete()
+    batch.enable_stats()
+    batch.draw()
+
+    assert domain._draw_args[1] is None
+    assert batch.stats.draw_calls == 0
+    assert batch.stats.multi_draw_calls == 1
+    assert batch.stats.primitives == 3
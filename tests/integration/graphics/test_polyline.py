@@ -0,0 +1,70 @@
+import pytest
+
+from pyglet.graphics import Batch
+from pyglet.shapes import MultiLine, Polyline
+
+# Offset from the pixel centers, so the edges of the lines are not rounded differently:
+POINTS = [(10.25, 10.25), (40.25, 20.25), (60.25, 70.25), (85.25, 40.25), (30.25, 80.25)]
+
+
+def test_polyline_matches_multiline(render):
+    batch = Batch()
+    line = MultiLine(*POINTS[:4], thickness=5, color=(255, 0, 0), batch=batch)
+    expected = render(batch)
+    line.delete()
+
+    batch = Batch()
+    line = Polyline(*POINTS[:4], thickness=5, color=(255, 0, 0), batch=batch)
+    pixels = render(batch)
+    assert any(pixels)
+    assert pixels == expected
+
+
+# Translucent, so that segments drawn twice are visible:
+COLOR = (255, 255, 255, 100)
+
+
+@pytest.mark.parametrize('closed', [False, True])
+def test_add_points_matches_polyline(render, closed):
+    batch = Batch()
+    line = Polyline(*POINTS, closed=closed, thickness=4, color=COLOR, batch=batch)
+    expected = render(batch)
+    line.delete()
+
+    batch = Batch()
+    line = Polyline(*POINTS[:2], closed=closed, thickness=4, color=COLOR, batch=batch)
+    line.add_points(POINTS[2])
+    line.add_points(*POINTS[3:])
+    assert line.coordinates == POINTS
+    assert render(batch) == expected
+
+
+@pytest.mark.parametrize('closed', [False, True])
+def test_fewer_coordinates_match_polyline(render, closed):
+    batch = Batch()
+    line = Polyline(*POINTS[:4], closed=closed, thickness=4, color=COLOR, batch=batch)
+    expected = render(batch)
+    line.delete()
+
+    batch = Batch()
+    line = Polyline(*POINTS, closed=closed, thickness=4, color=COLOR, batch=batch)
+    line.coordinates = POINTS[:4]
+    assert render(batch) == expected
+
+
+def test_add_points_reserves_capacity():
+    line = Polyline(*POINTS[:2], thickness=3, batch=Batch())
+    assert line._vertex_list.count == 4
+
+    line.add_points(POINTS[2])
+    assert line._vertex_list.count == 8
+    # The line ends at the vertices without thickness:
+    assert list(line._vertex_list.thickness) == [0, 3, 3, 3, 0, 0, 0, 0]
+    assert list(line._vertex_list.position[6:8]) == [50, 60]
+
+    line.add_points(*POINTS[3:])
+    assert line._vertex_list.count == 8
+    assert list(line._vertex_list.thickness) == [0, 3, 3, 3, 3, 3, 0, 0]
+
+    line.visible = False
+    assert not any(line._vertex_list.thickness)
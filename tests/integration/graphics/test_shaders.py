@@ -537,3 +537,289 @@ def test_shader_uniform_float_array():
 
     assert test_data == fetched_data
 
+
+
+def test_shader_uniform_skips_unchanged_values(monkeypatch):
+    vertex_source: str = """#version 150 core
+        in vec3 position;
+
+        uniform float scale;
+        uniform vec2 offset;
+        uniform float weights[4];
+
+        void main()
+        {
+            gl_Position = vec4(position.xy * scale + offset, weights[0] + weights[3], 1.0);
+        }
+    """
+
+    fragment_source: str = """#version 150 core
+        out vec4 final_colors;
+
+        void main()
+        {
+            final_colors = vec4(1.0);
+        }
+    """
+
+    shader = pyglet.graphics.shader
+    uploads = []
+
+    def counting(uniform_type):
+        gl_type, legacy_setter, dsa_setter, length = shader._uniform_setters[uniform_type]
+
+        def wrap(func):
+            def setter(*args):
+                uploads.append(uniform_type)
+                func(*args)
+            return setter
+
+        monkeypatch.setitem(shader._uniform_setters, uniform_type,
+                            (gl_type, wrap(legacy_setter), wrap(dsa_setter), length))
+
+    counting(pyglet.gl.GL_FLOAT)
+    counting(pyglet.gl.GL_FLOAT_VEC2)
+
+    program = shader.ShaderProgram(shader.Shader(vertex_source, "vertex"), shader.Shader(fragment_source, "fragment"))
+
+    program['scale'] = 2.0
+    program['scale'] = 2.0
+    program['offset'] = (1.0, 2.0)
+    program['offset'] = [1.0, 2.0]
+    program['weights'] = (1.0, 2.0, 3.0, 4.0)
+    program['weights'] = (1.0, 2.0, 3.0, 4.0)
+    assert len(uploads) == 3
+
+    program['scale'] = 3.0
+    program['offset'] = (2.0, 2.0)
+    program['weights'][0] = 1.0
+    program['weights'] = (1.0, 2.0, 3.0, 4.0)
+    assert len(uploads) == 7
+
+    assert program['scale'] == 3.0
+    assert tuple(program['offset']) == (2.0, 2.0)
+
+
+def test_shader_shared_ubo():
+    vertex_source: str = """#version 150 core
+        in vec3 position;
+
+        uniform FrameBlock
+        {
+            float time;
+        } frame;
+
+        void main()
+        {
+            gl_Position = vec4(position * frame.time, 1.0);
+        }
+    """
+
+    fragment_source: str = """#version 150 core
+        out vec4 final_colors;
+
+        uniform FrameBlock
+        {
+            float time;
+        } frame;
+
+        void main()
+        {
+            final_colors = vec4(frame.time);
+        }
+    """
+
+    shader = pyglet.graphics.shader
+    program_a = shader.ShaderProgram(shader.Shader(vertex_source, "vertex"))
+    program_b = shader.ShaderProgram(shader.Shader(vertex_source, "vertex"),
+                                     shader.Shader(fragment_source, "fragment"))
+
+    ubo = program_a.uniform_blocks['FrameBlock'].get_shared_ubo()
+    assert ubo.shared
+    assert program_b.uniform_blocks['FrameBlock'].get_shared_ubo() is ubo
+    assert program_a.uniform_blocks['FrameBlock'].create_ubo() is not ubo
+
+    manager = pyglet.gl.current_context.ubo_manager
+    with ubo as block:
+        block.time[0] = 1.5
+    with ubo as block:
+        block.time[0] = 2.5
+
+    # Uploaded once, when a program with a uniform block is next used:
+    assert manager.pending == {ubo}
+    program_b.use()
+    program_b.stop()
+    assert not manager.pending
+
+    verified = ubo.view.__class__.from_buffer_copy(ubo.read())
+    assert verified.time[0] == 2.5
+
+
+def test_shader_program_binary_cache(monkeypatch, tmp_path):
+    vertex_source: str = """#version 150 core
+        in vec3 position;
+        uniform float scale;
+
+        void main()
+        {
+            gl_Position = vec4(position * scale, 1.0);
+        }
+    """
+
+    shader = pyglet.graphics.shader
+    if not shader._have_program_binary():
+        pytest.skip("Program binaries are not supported.")
+
+    monkeypatch.setattr(pyglet.options, 'shader_cache', str(tmp_path))
+
+    loaded = []
+
+    def load_program_binary(*args):
+        result = _load_program_binary(*args)
+        loaded.append(result)
+        return result
+
+    _load_program_binary = shader._load_program_binary
+    monkeypatch.setattr(shader, '_load_program_binary', load_program_binary)
+
+    program = shader.ShaderProgram(shader.Shader(vertex_source, "vertex"))
+    assert loaded == []
+    cache_files = list(tmp_path.iterdir())
+    assert len(cache_files) == 1
+
+    program = shader.ShaderProgram(shader.Shader(vertex_source, "vertex"))
+    assert loaded == [True]
+    assert 'scale' in program.uniforms
+
+    # A different source is cached separately:
+    shader.ShaderProgram(shader.Shader(vertex_source.replace("scale, 1.0", "scale, 2.0"), "vertex"))
+    assert len(list(tmp_path.iterdir())) == 2
+
+    # A corrupt binary is rejected, and the program is linked and cached again:
+    cache_files[0].write_bytes(b'\0' * 64)
+    program = shader.ShaderProgram(shader.Shader(vertex_source, "vertex"))
+    assert loaded == [True, False]
+    assert 'scale' in program.uniforms
+    assert cache_files[0].stat().st_size != 64
+
+
+def test_shader_program_compile_async():
+    vertex_source: str = """#version 150 core
+        in vec3 position;
+        uniform float scale;
+
+        void main()
+        {
+            gl_Position = vec4(position * scale, 1.0);
+        }
+    """
+
+    fragment_source: str = """#version 150 core
+        out vec4 final_colors;
+
+        void main()
+        {
+            final_colors = vec4(1.0);
+        }
+    """
+
+    shader = pyglet.graphics.shader
+    fragment_shader = shader.Shader(fragment_source, 'fragment')
+    pending = [shader.ShaderProgram.compile_async((vertex_source.replace('1.0', f'{i}.0'), 'vertex'), fragment_shader)
+               for i in range(4)]
+
+    while not all(program.ready for program in pending):
+        pass
+
+    programs = [program.get() for program in pending]
+    assert len({program.id for program in programs}) == 4
+    for program in programs:
+        assert 'scale' in program.uniforms
+        assert 'position' in program.attributes
+
+    assert pending[0].get() is programs[0]
+
+
+def test_shader_program_compile_async_errors():
+    shader = pyglet.graphics.shader
+    pending = shader.ShaderProgram.compile_async(("#version 150 core\nvoid main() { undefined(); }", 'vertex'))
+
+    while not pending.ready:
+        pass
+
+    with pytest.raises(shader.ShaderException):
+        pending.get()
+    with pytest.raises(shader.ShaderException):
+        pending.get()
+
+    # A link error is raised by get() too:
+    pending = shader.ShaderProgram.compile_async(
+        ("#version 150 core\nvec4 undefined();\nvoid main() { gl_Position = undefined(); }", 'vertex'),
+    )
+
+    with pytest.raises(shader.ShaderException):
+        pending.get()
+    assert pending.ready
+
+
+def test_shader_source_includes_and_defines(monkeypatch, tmp_path):
+    (tmp_path / 'scale.glsl').write_text('#include "common.glsl"\nvec4 scaled(vec3 v) { return vec4(v * SCALE, 1.0); }\n')
+    (tmp_path / 'common.glsl').write_text('#define SCALE 2.0\n')
+    (tmp_path / 'loop.glsl').write_text('#include "loop.glsl"\n')
+
+    monkeypatch.setattr(pyglet.resource, 'path', [str(tmp_path)])
+    monkeypatch.setattr(pyglet.resource._default_loader, '_index', None)
+
+    vertex_source: str = """#version 150 core
+        #include "scale.glsl"
+        #include "common.glsl"
+        in vec3 position;
+
+        void main()
+        {
+        #ifdef OFFSET
+            gl_Position = scaled(position) + vec4(OFFSET);
+        #else
+            gl_Position = scaled(position);
+        #endif
+        }
+    """
+
+    shader = pyglet.graphics.shader
+    source = shader.ShaderSource(vertex_source, pyglet.gl.GL_VERTEX_SHADER, {'OFFSET': 1.0, 'FLAG': None}).validate()
+    lines = [line.strip() for line in source.splitlines()]
+    assert lines[:3] == ["#version 150 core", "#define OFFSET 1.0", "#define FLAG"]
+    assert lines.count("#define SCALE 2.0") == 1
+    assert not any(line.startswith("#include") for line in lines)
+
+    vertex_shader = shader.Shader(vertex_source, 'vertex', {'OFFSET': 1.0})
+    assert "#define OFFSET 1.0" in vertex_shader.source
+
+    with pytest.raises(shader.ShaderException):
+        shader.ShaderSource('#version 150 core\n#include "loop.glsl"', pyglet.gl.GL_VERTEX_SHADER)
+    with pytest.raises(shader.ShaderException):
+        shader.ShaderSource('#version 150 core\n#include "missing.glsl"', pyglet.gl.GL_VERTEX_SHADER)
+
+    # Context shaders are cached by source, type and definitions:
+    context = pyglet.gl.current_context
+    first = context.create_shader(vertex_source, 'vertex', {'OFFSET': 1.0})
+    assert context.create_shader(vertex_source, 'vertex', {'OFFSET': 1.0}) is first
+    assert context.create_shader(vertex_source, 'vertex', {'OFFSET': 2.0}) is not first
+    assert context.create_shader(vertex_source, 'vertex') is not first
+
+
+def test_context_shader_cache_is_bounded(monkeypatch):
+    context = pyglet.gl.current_context
+    monkeypatch.setattr(context, 'max_cached_shaders', 2)
+    monkeypatch.setattr(context, '_cached_shaders', type(context._cached_shaders)())
+
+    vertex_source = "#version 150 core\nin vec3 position;\nvoid main() { gl_Position = vec4(position * SCALE, 1.0); }\n"
+    first = context.create_shader(vertex_source, 'vertex', {'SCALE': 1.0})
+    second = context.create_shader(vertex_source, 'vertex', {'SCALE': 2.0})
+
+    # Using the first shader again makes the second the least recently used:
+    assert context.create_shader(vertex_source, 'vertex', {'SCALE': 1.0}) is first
+    context.create_shader(vertex_source, 'vertex', {'SCALE': 3.0})
+    assert len(context._cached_shaders) == 2
+    assert context.create_shader(vertex_source, 'vertex', {'SCALE': 1.0}) is first
+    assert context.create_shader(vertex_source, 'vertex', {'SCALE': 2.0}) is not second
@@ -0,0 +1,50 @@
+import pytest
+
+from pyglet.graphics import Batch
+from pyglet.shapes import Box, Circle, Rectangle, ShapeInstancer, Star
+
+
+@pytest.mark.parametrize(('create_shape', 'create_instance'), [
+    (lambda batch: Rectangle(40, 40, 20, 12, color=(255, 0, 0), batch=batch),
+     lambda batch: ShapeInstancer.rectangle(batch=batch).create(40, 40, 20, 12, color=(255, 0, 0))),
+    (lambda batch: Circle(40, 40, 20, segments=32, batch=batch),
+     lambda batch: ShapeInstancer.circle(32, batch=batch).create(40, 40, 40, 40)),
+    (lambda batch: Box(10, 10, 50, 40, thickness=5, batch=batch),
+     lambda batch: ShapeInstancer.box(batch=batch).create(10, 10, 50, 40, thickness=5)),
+    (lambda batch: Star(48, 48, 40, 20, 5, rotation=20, batch=batch),
+     lambda batch: ShapeInstancer.star(5, 0.5, batch=batch).create(48, 48, 80, 80, rotation=20)),
+])
+def test_instanced_shape_matches_shape(render, create_shape, create_instance):
+    batch = Batch()
+    shape = create_shape(batch)
+    expected = render(batch)
+    shape.delete()
+
+    batch = Batch()
+    instance = create_instance(batch)
+    pixels = render(batch)
+    assert any(pixels)
+    assert pixels == expected
+    assert instance.instancer is not None
+
+
+def test_shape_instancer_records():
+    instancer = ShapeInstancer.circle(16, batch=Batch())
+    shapes = [instancer.create(i, i * 2, 10, 10) for i in range(4)]
+    assert instancer._domain.instance_count == 4
+
+    shapes[2].position = (5, 6)
+    shapes[2].color = (1, 2, 3)
+    shapes[2].rotation = 45
+    assert list(instancer._translation.get_region(2, 1)) == [5, 6]
+    assert list(instancer._color.get_region(2, 1)) == [1, 2, 3, 255]
+    assert list(instancer._rotation.get_region(2, 1)) == [45]
+
+    shapes[2].visible = False
+    assert list(instancer._size.get_region(2, 1)) == [0, 0]
+
+    # The last shape is moved into the place of the deleted one:
+    shapes[0].delete()
+    assert instancer.shapes == [shapes[3], shapes[1], shapes[2]]
+    assert instancer._domain.instance_count == 3
+    assert list(instancer._translation.get_region(0, 1)) == [3, 6]
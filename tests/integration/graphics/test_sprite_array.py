@@ -0,0 +1,94 @@
+import array
+
+import pytest
+
+from pyglet.graphics import Batch
+from pyglet.image import SolidColorImagePattern
+from pyglet.image.atlas import TextureAtlas
+from pyglet.sprite import SpriteArray
+
+
+@pytest.fixture
+def frames():
+    atlas = TextureAtlas(64, 64)
+    return [atlas.add(SolidColorImagePattern(rgba).create_image(8, 8))
+            for rgba in ((255, 0, 0, 255), (0, 255, 0, 255))]
+
+
+def test_sprite_array_whole_array_updates(frames):
+    sprites = SpriteArray(frames, count=3, batch=Batch())
+    assert len(sprites) == 3
+    assert sprites._domain.instance_count == 3
+
+    sprites.positions = array.array('f', [0, 1, 2, 3, 4, 5, 6, 7, 8])
+    sprites.rotations = (10, 20, 30)
+    assert sprites[1].position == (3, 4, 5)
+    assert sprites[2].rotation == 30
+
+    with pytest.raises(ValueError):
+        sprites.scales = (1, 2, 3)
+
+
+def test_sprite_array_views(frames):
+    sprites = SpriteArray(frames, count=2, batch=Batch())
+    assert sprites.positions.shape == (2, 3)
+    assert sprites.colors.tolist() == [[255, 255, 255, 255]] * 2
+    assert sprites.scales.tolist() == [[1, 1]] * 2
+
+    # Writes through the views go directly to the buffers:
+    sprites.frame_indices[1] = 1
+    assert sprites[1].frame_index == 1
+    assert sprites._per_sprite._dirty
+
+
+def test_sprite_array_items(frames):
+    sprites = SpriteArray(frames, count=2, batch=Batch())
+    sprite = sprites[-1]
+    assert sprite.index == 1
+
+    sprite.x = 5
+    sprite.scale_y = 3
+    sprite.color = (1, 2, 3)
+    sprite.opacity = 4
+    assert sprites.positions.tolist()[1] == [5, 0, 0]
+    assert sprites.scales.tolist()[1] == [1, 3]
+    assert sprites.colors.tolist()[1] == [1, 2, 3, 4]
+
+    with pytest.raises(IndexError):
+        sprites[2]
+
+    sprites.resize(4)
+    assert [sprite.position for sprite in sprites][1:] == [(5, 0, 0), (0, 0, 0), (0, 0, 0)]
+
+
+def test_sprite_array_animation(frames, monkeypatch):
+    from pyglet import clock
+    from pyglet.image import Animation
+
+    monkeypatch.setattr(clock.get_default(), 'time', lambda: 100.0)
+    animation = Animation.from_image_sequence(frames, 0.5, loop=True)
+    sprites = SpriteArray(animation, count=2, batch=Batch())
+    assert sprites.animation is animation
+    assert sprites._group.frame_ends == [0.5, 1.0]
+    assert sprites._group.loop_duration == 1.0
+
+    monkeypatch.setattr(clock.get_default(), 'time', lambda: 102.0)
+    assert sprites.time == 2.0
+    sprites.resize(3)
+    assert sprites.start_times.tolist() == [0, 0, 2]
+
+    sprites[0].start_time = 1.5
+    assert sprites[0].start_time == 1.5
+
+    # Frames are chosen by the shader, and cannot be set:
+    with pytest.raises(ValueError):
+        sprites.frame_indices
+
+
+def test_sprite_array_animation_without_loop(frames):
+    from pyglet.image import Animation
+
+    animation = Animation.from_image_sequence(frames, 0.5, loop=False)
+    sprites = SpriteArray(animation, batch=Batch())
+    assert sprites._group.frame_ends == [0.5, float('inf')]
+    assert sprites._group.loop_duration == 0
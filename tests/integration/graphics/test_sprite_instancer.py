@@ -0,0 +1,69 @@
+import pytest
+
+from pyglet.graphics import Batch
+from pyglet.image import SolidColorImagePattern
+from pyglet.image.atlas import TextureAtlas
+from pyglet.sprite import SpriteInstancer
+
+
+@pytest.fixture
+def atlas():
+    return TextureAtlas(64, 64)
+
+
+def _region(atlas, rgba):
+    return atlas.add(SolidColorImagePattern(rgba).create_image(8, 8))
+
+
+def test_sprite_instancer_records(atlas):
+    red = _region(atlas, (255, 0, 0, 255))
+    instancer = SpriteInstancer(red, batch=Batch())
+    sprites = [instancer.create(x=i, y=i * 2, rotation=i) for i in range(20)]
+    assert len(instancer) == 20
+    assert instancer._domain.instance_count == 20
+
+    # Each sprite is a single record, not four vertices:
+    assert list(instancer._translate.get_region(5, 1)) == [5, 10, 0]
+    assert list(instancer._rotation.get_region(5, 1)) == [5]
+    assert list(instancer._bounds.get_region(5, 1)) == [0, 0, 8, 8]
+
+    sprites[5].scale_x = 2.0
+    sprites[5].color = (1, 2, 3)
+    assert list(instancer._scale.get_region(5, 1)) == [2.0, 1.0]
+    assert list(instancer._colors.get_region(5, 1)) == [1, 2, 3, 255]
+
+    sprites[5].visible = False
+    assert list(instancer._bounds.get_region(5, 1)) == [0, 0, 0, 0]
+
+
+def test_sprite_instancer_delete(atlas):
+    red = _region(atlas, (255, 0, 0, 255))
+    instancer = SpriteInstancer(red, batch=Batch())
+    sprites = [instancer.create(x=i) for i in range(4)]
+
+    # The last sprite is moved into the place of the deleted one:
+    sprites[1].delete()
+    assert instancer.sprites == [sprites[0], sprites[3], sprites[2]]
+    assert instancer._domain.instance_count == 3
+    assert list(instancer._translate.get_region(1, 1)) == [3, 0, 0]
+
+    sprites[3].x = 10
+    assert list(instancer._translate.get_region(1, 1)) == [10, 0, 0]
+
+    sprites[2].delete()
+    sprites[2].delete()
+    assert instancer.sprites == [sprites[0], sprites[3]]
+
+
+def test_sprite_instancer_texture(atlas):
+    red = _region(atlas, (255, 0, 0, 255))
+    green = _region(atlas, (0, 255, 0, 255))
+    instancer = SpriteInstancer(red, batch=Batch())
+    sprite = instancer.create(green)
+
+    u1, v1, _, _, _, _, u2, v2, _, _, _, _ = green.tex_coords
+    assert list(instancer._tex_region.get_region(0, 1)) == pytest.approx([u1, v1, u2, v2])
+
+    other = SolidColorImagePattern((0, 0, 255, 255)).create_image(8, 8).get_texture()
+    with pytest.raises(ValueError):
+        sprite.image = other
@@ -0,0 +1,40 @@
+import pytest
+
+from pyglet.graphics import Batch
+from pyglet.image import SolidColorImagePattern
+from pyglet.sprite import Sprite, update_many
+
+
+@pytest.fixture
+def image():
+    return SolidColorImagePattern((255, 0, 0, 255)).create_image(8, 8)
+
+
+def test_sprite_update_writes_changed_attributes(image):
+    sprite = Sprite(image, x=1, y=2, batch=Batch())
+    sprite.update(x=5, rotation=45, scale_y=2)
+
+    vertex_list = sprite._vertex_list
+    assert list(vertex_list.translate) == [5, 2, 0] * 4
+    assert list(vertex_list.rotation) == [45] * 4
+    assert list(vertex_list.scale) == [1, 2] * 4
+
+
+def test_update_many(image):
+    batch = Batch()
+    sprites = [Sprite(image, batch=batch) for _ in range(3)]
+    update_many(sprites, xs=[1, 2, 3], rotations=[10, 20, 30], scales=[2, 2, 2], scale_ys=[1, 2, 3])
+
+    for i, sprite in enumerate(sprites):
+        vertex_list = sprite._vertex_list
+        assert sprite.position == (i + 1, 0, 0)
+        assert sprite.rotation == (i + 1) * 10
+        assert list(vertex_list.translate) == [i + 1, 0, 0] * 4
+        assert list(vertex_list.rotation) == [(i + 1) * 10] * 4
+        assert list(vertex_list.scale) == [2, (i + 1) * 2] * 4
+
+    buffer = sprites[0]._vertex_list.domain.attrib_name_buffers['translate']
+    assert buffer._dirty
+
+    with pytest.raises(ValueError):
+        update_many(sprites, ys=[1, 2])
@@ -0,0 +1,62 @@
+import ctypes
+
+import pytest
+
+from pyglet.gl import GL_TRIANGLES, gl_info
+from pyglet.graphics import Batch, Group, get_default_shader
+from pyglet.graphics.vertexbuffer import AttributeBufferObject, RingAttributeBufferObject
+
+pytestmark = pytest.mark.skipif(not (gl_info.have_version(4, 4) or gl_info.have_extension('GL_ARB_buffer_storage')),
+                                reason='Buffer storage is not supported.')
+
+
+def _mapped_section(buffer):
+    ptr_type = ctypes.POINTER(buffer.c_type * (buffer.size // ctypes.sizeof(buffer.c_type)))
+    return ctypes.cast(buffer._mapped_ptr + buffer.ptr, ptr_type).contents
+
+
+def test_stream_attributes():
+    batch = Batch(stream_attributes=('position',))
+    attributes = get_default_shader().attributes.copy()
+    domain = batch.get_domain(False, False, GL_TRIANGLES, Group(), attributes)
+    assert isinstance(domain.attrib_name_buffers['position'], RingAttributeBufferObject)
+    assert type(domain.attrib_name_buffers['colors']) is AttributeBufferObject
+
+    vertex_list = domain.create(3)
+    buffer = domain.attrib_name_buffers['position']
+    sections = set()
+    for frame in range(buffer.sections + 1):
+        vertex_list.position[:] = (frame,) * 9
+        batch.draw()
+        sections.add(buffer.ptr)
+        assert list(_mapped_section(buffer)) == list(buffer.data)
+
+    assert len(sections) == buffer.sections
+
+    # Resizing recreates the ring:
+    more = domain.create(100)
+    more.position[:] = (1.0,) * 300
+    batch.draw()
+    assert list(_mapped_section(buffer)) == list(buffer.data)
+
+
+def test_stream_attributes_write_changed_pages():
+    batch = Batch(stream_attributes=('position',))
+    attributes = get_default_shader().attributes.copy()
+    domain = batch.get_domain(False, False, GL_TRIANGLES, Group(), attributes)
+    vertex_lists = [domain.create(3) for _ in range(1000)]
+    buffer = domain.attrib_name_buffers['position']
+    assert buffer.size > buffer.dirty_page_size * 4
+
+    # Every section is written entirely once:
+    for _ in range(buffer.sections):
+        vertex_lists[0].position[:] = (1.0,) * 9
+        batch.draw()
+
+    # Afterward, only the pages changed since a section was last written are copied to it:
+    for frame in range(buffer.sections * 2):
+        committed_bytes = buffer.committed_bytes
+        vertex_lists[frame % 2 * 999].position[:] = (frame,) * 9
+        batch.draw()
+        assert buffer.committed_bytes - committed_bytes <= buffer.dirty_page_size * 2
+        assert list(_mapped_section(buffer)) == list(buffer.data)
@@ -0,0 +1,48 @@
+import array
+
+import pytest
+
+from pyglet.gl import GL_TRIANGLES
+from pyglet.graphics import Batch, Group, get_default_shader
+
+
+@pytest.fixture
+def vertex_list():
+    attributes = get_default_shader().attributes.copy()
+    domain = Batch().get_domain(False, False, GL_TRIANGLES, Group(), attributes)
+    domain.create(2)
+    return domain.create(3)
+
+
+def test_set_attribute_data_buffer(vertex_list):
+    data = array.array('f', range(9))
+    vertex_list.set_attribute_data('position', data)
+    assert tuple(vertex_list.position) == tuple(range(9))
+
+    # Read-only buffers are also copied directly:
+    vertex_list.position = memoryview(array.array('f', range(9, 18)).tobytes()).cast('f')
+    assert tuple(vertex_list.position) == tuple(range(9, 18))
+
+
+def test_set_attribute_data_converted(vertex_list):
+    # Items of another type are converted one by one:
+    vertex_list.set_attribute_data('position', array.array('d', range(9)))
+    assert tuple(vertex_list.position) == tuple(range(9))
+
+
+def test_set_attribute_data_size(vertex_list):
+    with pytest.raises(ValueError):
+        vertex_list.set_attribute_data('position', array.array('f', range(6)))
+
+
+def test_attribute_view(vertex_list):
+    buffer = vertex_list.domain.attrib_name_buffers['position']
+    buffer.commit()
+
+    view = vertex_list.attribute_view('position')
+    assert view.format == 'f'
+    assert len(view) == 9
+    assert buffer._dirty
+
+    view[:] = array.array('f', range(9))
+    assert tuple(vertex_list.position) == tuple(range(9))
@@ -0,0 +1,63 @@
+import math
+
+import pytest
+
+from pyglet.shapes import Arc, Circle, Ellipse, Sector, _get_segment, _get_unit_arc
+
+
+def _points(x, y, rx, ry, segments, angle, start=0.0):
+    step = angle / segments
+    return [(x + rx * math.cos(i * step + start), y + ry * math.sin(i * step + start)) for i in range(segments + 1)]
+
+
+def _fan(x, y, points, wrap):
+    vertices = []
+    for i in range(0 if wrap else 1, len(points)):
+        vertices.extend((x, y, *points[i - 1], *points[i]))
+    return vertices
+
+
+def test_circle_vertices():
+    circle = Circle(10, 10, 20, segments=16)
+    circle.anchor_position = (2, 3)
+    expected = _fan(-2, -3, _points(-2, -3, 20, 20, 16, math.tau)[:-1], wrap=True)
+    assert circle._get_vertices() == pytest.approx(expected)
+
+
+def test_ellipse_vertices():
+    ellipse = Ellipse(10, 10, 20, 8, segments=16)
+    expected = _fan(0, 0, _points(0, 0, 20, 8, 16, math.tau)[:-1], wrap=True)
+    assert ellipse._get_vertices() == pytest.approx(expected)
+
+
+def test_sector_vertices():
+    sector = Sector(10, 10, 20, segments=12, angle=120, start_angle=30)
+    expected = _fan(0, 0, _points(0, 0, 20, 20, 12, math.radians(120), math.radians(30)), wrap=False)
+    assert sector._get_vertices() == pytest.approx(expected)
+
+
+@pytest.mark.parametrize('closed', [False, True])
+def test_arc_vertices(closed):
+    arc = Arc(10, 10, 20, segments=12, angle=120, start_angle=30, closed=closed, thickness=4)
+    points = _points(0, 0, 20, 20, 12, math.radians(120), math.radians(30))
+    if closed:
+        points.append(points[0])
+
+    expected = []
+    prev_miter = prev_scale = None
+    for i in range(len(points) - 1):
+        prev_point = points[i - 1] if i > 0 else (points[-2] if closed else None)
+        next_point = points[i + 2] if i + 2 < len(points) else (points[1] if closed else None)
+        prev_miter, prev_scale, *segment = _get_segment(prev_point, points[i], points[i + 1], next_point,
+                                                        4, prev_miter, prev_scale)
+        expected.extend(segment)
+    assert arc._get_vertices() == pytest.approx(expected)
+
+
+def test_resizing_reuses_unit_arc():
+    circle = Circle(10, 10, 20, segments=23)
+    before = _get_unit_arc.cache_info()
+    for radius in range(1, 10):
+        circle.radius = radius
+    after = _get_unit_arc.cache_info()
+    assert after.misses == before.misses
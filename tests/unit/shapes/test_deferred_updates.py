@@ -0,0 +1,57 @@
+from unittest.mock import patch
+
+from pyglet.graphics import Batch
+from pyglet.shapes import Circle, Rectangle
+
+
+def test_updates_are_combined_until_batch_draw():
+    batch = Batch()
+    circle = Circle(10, 10, 20, batch=batch)
+
+    with patch.object(Circle, '_update_vertices') as update_vertices, \
+            patch.object(Circle, '_update_translation') as update_translation:
+        circle.radius = 5
+        circle.anchor_position = (1, 2)
+        circle.x = 3
+        circle.position = (4, 5)
+        circle.color = (1, 2, 3)
+        assert update_vertices.call_count == 0
+        assert update_translation.call_count == 0
+
+        batch.draw()
+        assert update_vertices.call_count == 1
+        assert update_translation.call_count == 1
+
+        # Nothing is left to update:
+        batch.draw()
+        assert update_vertices.call_count == 1
+
+
+def test_shapes_without_batch_update_immediately():
+    rectangle = Rectangle(0, 0, 10, 10)
+    with patch.object(Rectangle, '_update_vertices') as update_vertices:
+        rectangle.width = 5
+        rectangle.height = 5
+        assert update_vertices.call_count == 2
+
+
+def test_changing_batch_applies_updates():
+    batch = Batch()
+    rectangle = Rectangle(0, 0, 10, 10, batch=batch)
+    with patch.object(Rectangle, '_update_vertices') as update_vertices, patch.object(Batch, 'migrate'):
+        rectangle.width = 5
+        rectangle.batch = Batch()
+        assert update_vertices.call_count == 1
+
+        batch.draw()
+        assert update_vertices.call_count == 1
+
+
+def test_deleted_shape_is_not_updated():
+    batch = Batch()
+    rectangle = Rectangle(0, 0, 10, 10, batch=batch)
+    rectangle.width = 5
+    rectangle.delete()
+    with patch.object(Rectangle, '_update_vertices') as update_vertices:
+        batch.draw()
+        assert update_vertices.call_count == 0
@@ -0,0 +1,69 @@
+import math
+
+import pytest
+
+from pyglet.shapes import Polygon, _is_triangulation_valid
+
+SQUARE = [(10, 10), (30, 10), (30, 30), (10, 30)]
+
+
+def _star(points, radius):
+    coordinates = []
+    for i in range(points * 2):
+        r = radius if i % 2 else radius / 2
+        angle = i * math.pi / points
+        coordinates.append((r * math.cos(angle), r * math.sin(angle)))
+    return coordinates
+
+
+def test_translation_keeps_triangulation():
+    polygon = Polygon(*SQUARE)
+    vertex_list = polygon._vertex_list
+    indices = polygon._indices
+
+    polygon.coordinates = [(x + 5, y - 3) for x, y in SQUARE]
+    assert polygon._vertex_list is vertex_list
+    assert polygon._indices is indices
+    assert polygon.position == (15, 7)
+    assert polygon.coordinates == [(x + 5, y - 3) for x, y in SQUARE]
+
+
+def test_small_changes_reuse_triangulation():
+    coordinates = _star(5, 20)
+    polygon = Polygon(*coordinates)
+    indices = polygon._indices
+
+    coordinates[3] = (coordinates[3][0] + 0.5, coordinates[3][1])
+    polygon.coordinates = coordinates
+    assert polygon._indices is indices
+    assert polygon._get_vertices()[6] == pytest.approx(coordinates[3][0] - coordinates[0][0])
+
+
+def test_flipped_triangle_retriangulates():
+    polygon = Polygon(*SQUARE)
+    indices = polygon._indices
+
+    # Move a corner across the diagonal of the square's triangulation:
+    polygon.coordinates = [(10, 10), (30, 10), (30, 30), (25, 15)]
+    relative = polygon._get_relative_coordinates()
+    assert not _is_triangulation_valid(relative, indices)
+    assert _is_triangulation_valid(relative, polygon._indices)
+    polygon._vertex_list.delete.assert_not_called()
+
+
+def test_point_count_change_recreates_vertex_list():
+    polygon = Polygon(*SQUARE)
+
+    polygon.coordinates = _star(4, 20)
+    polygon._vertex_list.delete.assert_called_once()
+    assert polygon._num_verts == 8
+    assert len(polygon._indices) == 6 * 3
+
+
+def test_is_triangulation_valid():
+    vertices = (0, 0, 1, 0, 1, 1, 0, 1)
+    assert _is_triangulation_valid(vertices, (0, 1, 2, 0, 2, 3))
+    # Flipped, collapsed and missing triangles:
+    assert not _is_triangulation_valid(vertices, (0, 1, 2, 0, 3, 2))
+    assert not _is_triangulation_valid((0, 0, 1, 0, 2, 0), (0, 1, 2))
+    assert not _is_triangulation_valid(vertices, ())
@@ -44,6 +44,7 @@ def main() -> None:  # noqa: D103
         "GL_ARB_bindless_texture",
         "GL_ARB_gpu_shader_int64",
         "GL_NV_mesh_shader",
+        "GL_KHR_parallel_shader_compile",  # For ShaderProgram.compile_async
     ]
 
     core_profile = registry.get_profile(